@@ -0,0 +1,86 @@
+"""Interactive latency under overload, with and without ``AdmissionController``.
+
+Events arrive at ``--rate`` per second for ``--duration`` seconds, one in ``--high-every`` a direct
+message and the rest channel chatter, while the handler spends ``--cost`` seconds per event, so the
+input exceeds what the bot can handle. Reports the queueing delay of direct messages (from arrival
+to handler start) and how many events were handled and shed.
+
+Run with ``uv run python -m benchmarks.bench_admission --rate 2000 --cost 0.001``.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import time
+
+import orjson
+
+from benchmarks.payloads import make_post
+from botenix.core.admission import AdmissionController
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.core.events.event_queue import EventQueue
+from botenix.exceptions import QueueClosedError
+
+
+def make_event(index: int, high_every: int) -> Event:
+    channel_type = "D" if index % high_every == 0 else "O"
+    return Event(EventType.posted, {"post": orjson.dumps(make_post(index)).decode(), "channel_type": channel_type})
+
+
+async def produce(queue: EventQueue, args: argparse.Namespace) -> None:
+    # Batches every 10 ms: sleeping between single events is too coarse at these rates.
+    per_batch = max(1, int(args.rate / 100))
+    started_at = time.monotonic()
+    for batch in range(int(args.duration * 100)):
+        for index in range(batch * per_batch, (batch + 1) * per_batch):
+            await queue.put(make_event(index, args.high_every))
+        await asyncio.sleep(max(0.0, started_at + (batch + 1) / 100 - time.monotonic()))
+    await queue.close()
+
+
+async def run(name: str, args: argparse.Namespace, admission: AdmissionController | None) -> None:
+    dispatcher = Dispatcher()
+    if admission is not None:
+        dispatcher.add_stage(admission.observe)
+    delays: list[float] = []
+    handled = 0
+
+    @dispatcher.message()
+    async def handle(event: Event) -> None:
+        nonlocal handled
+        handled += 1
+        if event.data["channel_type"] == "D":
+            delays.append(time.monotonic() - event.received_at)
+        await asyncio.sleep(args.cost)
+
+    queue = EventQueue(maxsize=1_000_000)
+    producer = asyncio.create_task(produce(queue, args))
+    with contextlib.suppress(QueueClosedError):
+        while True:
+            await dispatcher.feed_event(await queue.get())
+    await producer
+
+    quantiles = statistics.quantiles(delays, n=100)
+    shed = admission.stats.total_shed if admission is not None else 0
+    print(
+        f"{name:<12} direct messages p50 {quantiles[49] * 1e3:7.1f} ms  p99 {quantiles[98] * 1e3:7.1f} ms  "
+        f"handled {handled:6}  shed {shed:6}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=2000, help="incoming events per second")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--cost", type=float, default=0.001, help="handler time per event in seconds")
+    parser.add_argument("--high-every", type=int, default=20)
+    args = parser.parse_args()
+
+    await run("no admission", args, None)
+    await run("admission", args, AdmissionController(target=0.05, interval=0.1))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
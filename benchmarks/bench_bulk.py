@@ -0,0 +1,52 @@
+"""Broadcasting one message to many channels: sequential awaits vs. ``HttpClient.bulk``.
+
+The server is an in-process ``httpx.MockTransport`` with a fixed per-request latency.
+
+Run with ``uv run python -m benchmarks.bench_bulk``.
+"""
+
+import asyncio
+import time
+from functools import partial
+
+import httpx
+
+from benchmarks.payloads import make_id
+from botenix.integration.utils.http_client import HttpClient
+
+
+CHANNELS = 500
+LATENCY = 0.005
+
+
+async def create_post(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(LATENCY)
+    return httpx.Response(201, content=request.content, headers={"Content-Type": "application/json"})
+
+
+async def main() -> None:
+    client = HttpClient("http://mattermost", transport=httpx.MockTransport(create_post))
+    channels = [make_id(index) for index in range(CHANNELS)]
+
+    started_at = time.perf_counter()
+    for channel_id in channels:
+        await client.post("/api/v4/posts", json={"channel_id": channel_id, "message": "maintenance at 18:00"})
+    sequential = time.perf_counter() - started_at
+
+    for concurrency in (8, 32, 100):
+        operations = (
+            partial(client.post, "/api/v4/posts", json={"channel_id": channel_id, "message": "maintenance at 18:00"})
+            for channel_id in channels
+        )
+        started_at = time.perf_counter()
+        failed = sum([not result.ok async for result in client.bulk(operations, concurrency=concurrency)])
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"{CHANNELS} posts   sequential {sequential:6.2f}s   bulk({concurrency:>3}) {elapsed:6.2f}s   "
+            f"{sequential / elapsed:5.1f}x   failed {failed}"
+        )
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
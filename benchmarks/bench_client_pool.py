@@ -0,0 +1,68 @@
+"""Many bot accounts on one server: ``ClientPool`` tenants vs. one ``HttpClient`` per token.
+
+Each of ``--tenants`` tokens sends ``--rounds`` concurrent rounds of one request to the fake Mattermost
+server. Reports the memory retained per tenant (``tracemalloc``), the TCP connections the server accepted
+and the request throughput.
+
+Run with ``uv run python -m benchmarks.bench_client_pool --tenants 1000``.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from benchmarks.fake_server import FakeMattermost
+from botenix.integration.utils.client_pool import ClientPool
+from botenix.integration.utils.http_client import HttpClient
+
+
+async def run(
+    name: str,
+    args: argparse.Namespace,
+    create: Callable[[str, str], HttpClient],
+    close: Callable[[list[HttpClient]], Awaitable[None]],
+    server: FakeMattermost,
+) -> None:
+    connections = server.http_connections
+    tracemalloc.start()
+    clients = [create(server.url, f"token-{index}") for index in range(args.tenants)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started_at = time.perf_counter()
+    for _ in range(args.rounds):
+        await asyncio.gather(*(client.get("/api/v4/users/me") for client in clients))
+    throughput = args.tenants * args.rounds / (time.perf_counter() - started_at)
+    await close(clients)
+    print(
+        f"{name:<12} {memory / args.tenants / 1024:7.1f} KiB/tenant  "
+        f"{server.http_connections - connections:5} connections  {throughput:8,.0f} requests/s"
+    )
+
+
+async def close_clients(clients: list[HttpClient]) -> None:
+    for client in clients:
+        await client.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0, help="fake server latency per request in seconds")
+    args = parser.parse_args()
+
+    async with FakeMattermost(latency=args.latency, heavy_metadata=False) as server:
+        await run("HttpClient", args, lambda url, token: HttpClient(url, bearer_token=token), close_clients, server)
+        pool = ClientPool()
+
+        async def close_pool(clients: list[HttpClient]) -> None:  # noqa: ARG001
+            await pool.close()
+
+        await run("ClientPool", args, pool.client, close_pool, server)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
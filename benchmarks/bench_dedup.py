@@ -0,0 +1,50 @@
+"""Deduplication stage cost: ``DedupFilter`` vs. an unbounded ``set`` of keys.
+
+Every key is checked twice (once new, once as a duplicate); the filter is sized for the key count.
+
+Run with ``uv run python -m benchmarks.bench_dedup --keys 1000000``.
+"""
+
+import argparse
+import sys
+import time
+
+from benchmarks.payloads import make_id
+from botenix.core.dedup import DedupFilter
+
+
+def bench_filter(keys: list[str], error_rate: float) -> None:
+    dedup = DedupFilter(capacity=len(keys), error_rate=error_rate)
+    started_at = time.perf_counter()
+    duplicates = sum(dedup.add(key) for key in keys) + sum(dedup.add(key) for key in keys)
+    elapsed = time.perf_counter() - started_at
+    false_positives = duplicates - len(keys)
+    print(
+        f"filter ({error_rate:.1%}): {elapsed / (2 * len(keys)) * 1e9:6.0f} ns/key  "
+        f"{dedup.memory / 2**20:6.1f} MiB  false positives {false_positives}"
+    )
+
+
+def bench_set(keys: list[str]) -> None:
+    seen: set[str] = set()
+    started_at = time.perf_counter()
+    for key in keys + keys:
+        if key not in seen:
+            seen.add(key)
+    elapsed = time.perf_counter() - started_at
+    size = sys.getsizeof(seen) + sum(sys.getsizeof(key) for key in seen)
+    print(f"set:           {elapsed / (2 * len(keys)) * 1e9:6.0f} ns/key  {size / 2**20:6.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    args = parser.parse_args()
+    keys = [f"post:{make_id(index)}" for index in range(args.keys)]
+    bench_set(keys)
+    for error_rate in (0.01, 0.001):
+        bench_filter(keys, error_rate)
+
+
+if __name__ == "__main__":
+    main()
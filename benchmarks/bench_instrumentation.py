@@ -0,0 +1,67 @@
+"""Cost of request instrumentation: ``HttpClient`` without hooks vs. with a ``HistogramAggregator``.
+
+The server is an in-process ``httpx.MockTransport`` without latency, so the numbers are pure client overhead.
+
+Run with ``uv run python -m benchmarks.bench_instrumentation``.
+"""
+
+import asyncio
+import time
+import timeit
+
+import httpx
+
+from benchmarks.payloads import make_id
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.instrumentation import HistogramAggregator, Instrumentation
+
+
+REQUESTS = 5000
+BODY = b'{"id": "%s", "message": "hello"}' % make_id(0).encode()
+
+
+def respond(_: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=BODY, headers={"Content-Type": "application/json"})
+
+
+async def measure(client: HttpClient) -> float:
+    paths = [f"/api/v4/posts/{make_id(index % 100)}" for index in range(REQUESTS)]
+    for path in paths[:100]:
+        await client.get(path)
+    started_at = time.perf_counter()
+    for path in paths:
+        await client.get(path)
+    return (time.perf_counter() - started_at) / REQUESTS
+
+
+async def main() -> None:
+    transport = httpx.MockTransport(respond)
+    instrumentation = Instrumentation()
+    start_cost = timeit.timeit(lambda: instrumentation.start("GET", "/"), number=10**6) * 1e3
+    print(f"Instrumentation.start() without hooks: {start_cost:.0f} ns/call")
+
+    plain = HttpClient("http://mattermost", transport=transport)
+    aggregator = HistogramAggregator()
+    instrumented = HttpClient("http://mattermost", transport=transport, instrumentation=Instrumentation([aggregator]))
+
+    # Alternate the runs to spread out noise from the single event loop.
+    timings: dict[str, list[float]] = {"no hooks": [], "histogram": []}
+    for _ in range(5):
+        timings["no hooks"].append(await measure(plain))
+        timings["histogram"].append(await measure(instrumented))
+    baseline = min(timings["no hooks"])
+    for name, values in timings.items():
+        best = min(values)
+        print(f"{name:>10}: {best * 1e6:7.1f} us/request   {(best - baseline) / baseline:+6.1%}")
+
+    for (method, route), stats in aggregator.routes.items():
+        print(
+            f"{method} {route}: {stats.total.count} requests   p50 {stats.total.percentile(0.5) * 1e3:.2f} ms   "
+            f"p99 {stats.total.percentile(0.99) * 1e3:.2f} ms   decode mean {stats.decode.mean * 1e6:.1f} us"
+        )
+    await plain.close()
+    await instrumented.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
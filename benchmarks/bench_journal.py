@@ -0,0 +1,50 @@
+"""Cost of journaling handled posts: interval-batched fsync vs. an fsync after every post.
+
+Run with ``uv run python -m benchmarks.bench_journal --events 2000``.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import orjson
+
+from benchmarks.payloads import make_id, make_post
+from botenix.core.events.event import Event, EventType
+from botenix.integration.services.journal import EventJournal
+
+
+def make_events(count: int) -> list[Event]:
+    return [
+        Event(EventType.posted, {"post": orjson.dumps(make_post(index)).decode(), "team_id": make_id(0)})
+        for index in range(count)
+    ]
+
+
+async def run(name: str, events: list[Event], path: Path, *, every_post: bool) -> None:
+    async with EventJournal(path, flush_interval=0.1) as journal:
+        started_at = time.perf_counter()
+        for event in events:
+            journal.observe(event)
+            if every_post:
+                await journal.flush()
+            else:
+                await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started_at
+    print(f"{name:>10}: {elapsed / len(events) * 1e6:8.1f} us/post   {journal.flushes:5} fsyncs")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+    events = make_events(args.events)
+    with tempfile.TemporaryDirectory() as directory:
+        await run("per post", events, Path(directory, "per-post.jsonl"), every_post=True)
+        await run("batched", events, Path(directory, "batched.jsonl"), every_post=False)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
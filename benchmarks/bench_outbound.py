@@ -0,0 +1,88 @@
+"""Streaming progress into posts: direct ``HttpClient`` edits vs. the coalescing ``OutboundQueue``.
+
+Every stream edits its post 50 times a second and sends a typing notification with each edit. The
+server is an in-process ``httpx.MockTransport`` with a fixed per-request latency.
+
+Run with ``uv run python -m benchmarks.bench_outbound``.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+import orjson
+
+from benchmarks.payloads import make_id
+from botenix.integration.services.outbound import OutboundQueue
+from botenix.integration.utils.http_client import HttpClient
+
+
+STREAMS = 10
+DURATION = 2.0
+EDITS_PER_SECOND = 50
+LATENCY = 0.005
+
+
+class Server:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.messages: dict[str, str] = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(LATENCY)
+        self.requests += 1
+        payload = orjson.loads(request.content)
+        post_id = request.url.path.split("/")[-2]
+        if "message" in payload:
+            self.messages[post_id] = payload["message"]
+        post = {"id": post_id, "user_id": "bot", "channel_id": "c", "message": payload.get("message", "")}
+        timestamps = {"create_at": 0, "update_at": 0, "delete_at": 0, "edit_at": 0}
+        return httpx.Response(200, json={**post, **timestamps})
+
+
+async def stream(index: int, edit: Callable[..., Awaitable[None]], typing: Callable[[str], Awaitable[None]]) -> str:
+    post_id, channel_id = make_id(index), make_id(1000 + index)
+    message = ""
+    for step in range(int(DURATION * EDITS_PER_SECOND)):
+        message += f"token{step} "
+        await typing(channel_id)
+        await edit(post_id, channel_id, message=message)
+        await asyncio.sleep(1 / EDITS_PER_SECOND)
+    return message
+
+
+async def run(name: str, queued: bool) -> None:
+    server = Server()
+    client = HttpClient("http://mattermost", transport=httpx.MockTransport(server))
+    queue = OutboundQueue(client)
+
+    async def direct_edit(post_id: str, channel_id: str, *, message: str) -> None:  # noqa: ARG001
+        await client.put(f"/api/v4/posts/{post_id}/patch", json={"message": message})
+
+    async def direct_typing(channel_id: str) -> None:
+        await client.post("/api/v4/users/me/typing", json={"channel_id": channel_id})
+
+    async def queued_edit(post_id: str, channel_id: str, *, message: str) -> None:  # noqa: RUF029
+        queue.edit_post(post_id, channel_id, message=message)
+
+    async def queued_typing(channel_id: str) -> None:  # noqa: RUF029
+        queue.typing(channel_id)
+
+    edit, typing = (queued_edit, queued_typing) if queued else (direct_edit, direct_typing)
+    started_at = time.perf_counter()
+    finals = await asyncio.gather(*(stream(index, edit, typing) for index in range(STREAMS)))
+    await queue.close()
+    elapsed = time.perf_counter() - started_at
+    intact = all(server.messages[make_id(index)] == final for index, final in enumerate(finals))
+    print(f"{name:>8}: {server.requests:5} requests in {elapsed:5.2f}s   final content intact: {intact}")
+    await client.close()
+
+
+async def main() -> None:
+    await run("direct", queued=False)
+    await run("queued", queued=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
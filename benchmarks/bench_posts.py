@@ -0,0 +1,62 @@
+"""Parse time and retained memory per post: ``PostResponse`` vs. ``LazyPost`` on heavy-metadata payloads.
+
+Run with ``uv run python -m benchmarks.bench_posts``.
+"""
+
+import gc
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+import orjson
+
+from benchmarks.payloads import make_posts
+from botenix.integration.clients.models.posts import LazyPost, PostResponse
+from botenix.integration.utils.type_adapters import type_adapters
+
+
+POSTS = 1_000
+
+
+def parse_models(body: bytes) -> list[object]:
+    return list(type_adapters.get(list[PostResponse]).validate_json(body))
+
+
+def parse_lazy(body: bytes) -> list[object]:
+    return list(type_adapters.get(list[LazyPost]).validate_json(body))
+
+
+def parse_lazy_trusted(body: bytes) -> list[object]:
+    return [LazyPost.from_dict(post, trusted=True) for post in orjson.loads(body)]
+
+
+def parse_time(parse: Callable[[bytes], list[object]], body: bytes, number: int = 5) -> float:
+    return min(timeit.repeat(lambda: parse(body), number=number, repeat=5)) / number
+
+
+def retained_bytes(parse: Callable[[bytes], list[object]], body: bytes) -> int:
+    gc.collect()
+    tracemalloc.start()
+    posts = parse(body)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del posts
+    return current
+
+
+def main() -> None:
+    for heavy_metadata in (True, False):
+        body = orjson.dumps(make_posts(POSTS, heavy_metadata=heavy_metadata))
+        print(f"{POSTS} posts, {'heavy' if heavy_metadata else 'light'} metadata, {len(body) / POSTS:,.0f} B/post JSON")
+        for name, parse in (
+            ("list[PostResponse]", parse_models),
+            ("list[LazyPost]", parse_lazy),
+            ("LazyPost trusted", parse_lazy_trusted),
+        ):
+            elapsed = parse_time(parse, body)
+            memory = retained_bytes(parse, body)
+            print(f"  {name:<20} {elapsed / POSTS * 1e6:8.2f} us/post   {memory / POSTS:9,.0f} B/post retained")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Routing cost of the indexed ``Dispatcher`` against a linear scan over every handler.
+
+Handlers are a mix of commands, channel-scoped handlers and regular expressions; the indexed
+lookup should stay flat as the handler count grows while the linear scan grows with it.
+
+Run with ``uv run python -m benchmarks.bench_router``.
+"""
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+import orjson
+
+from benchmarks.payloads import make_id
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.core.router import HandlerSpec
+
+
+HANDLER_COUNTS = (10, 100, 1_000, 10_000)
+REGEXP_HANDLERS = 20
+
+
+async def handler(event: Event) -> None:
+    pass
+
+
+def make_dispatcher(count: int, regexp_handlers: int) -> Dispatcher:
+    dispatcher = Dispatcher()
+    for index in range(count):
+        if index < regexp_handlers:
+            dispatcher.register(handler, EventType.posted, regexp=rf"\bticket-{index}\b")
+        elif index % 2:
+            dispatcher.register(handler, EventType.posted, command=f"command{index}")
+        else:
+            dispatcher.register(handler, EventType.posted, channel_id=make_id(index), prefix="deploy")
+    dispatcher.build()
+    return dispatcher
+
+
+def linear_resolve(specs: list[HandlerSpec], event: Event) -> HandlerSpec | None:
+    text = event.text or ""
+    command = text[1:].split(maxsplit=1)[0].lower() if text[:1] in "!/" and len(text) > 1 else None
+    for spec in specs:
+        if spec.event_type != event.type:
+            continue
+        if spec.channel_id is not None and spec.channel_id != event.channel_id:
+            continue
+        if spec.commands and command not in spec.commands:
+            continue
+        if spec.prefix is not None and not text.startswith(spec.prefix):
+            continue
+        if spec.pattern is not None and not spec.pattern.search(text):
+            continue
+        return spec
+    return None
+
+
+def make_message(text: str, channel_id: str) -> Event:
+    post = orjson.dumps({"channel_id": channel_id, "message": text}).decode()
+    return Event(EventType.posted, {"post": post}, {"channel_id": channel_id, "team_id": ""})
+
+
+def measure(resolve: Callable[[Event], object], events: list[Event], number: int = 2_000) -> float:
+    elapsed = min(timeit.repeat(lambda: [resolve(event) for event in events], number=number, repeat=5))
+    return elapsed / number / len(events) * 1e6
+
+
+def main() -> None:
+    for count in HANDLER_COUNTS:
+        regexp_handlers = min(REGEXP_HANDLERS, count // 5)
+        dispatcher = make_dispatcher(count, regexp_handlers)
+        specs = [spec for router in dispatcher.walk() for spec in router.handlers]
+        last_command = max(index for index in range(regexp_handlers, count) if index % 2)
+        events = [
+            make_message(f"!command{last_command} now", make_id(1)),
+            make_message("deploy production", make_id(count - 2)),
+            make_message(f"see ticket-{regexp_handlers - 1} please", make_id(1)),
+            make_message("nothing to see here", make_id(1)),
+        ]
+        for event in events:
+            resolved = dispatcher.resolve(event)
+            assert (resolved[0] if resolved else None) is linear_resolve(specs, event)
+
+        indexed_us = measure(dispatcher.resolve, events)
+        linear_us = measure(partial(linear_resolve, specs), events)
+        print(f"{count:>6} handlers   indexed {indexed_us:8.2f} us/event   linear {linear_us:9.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
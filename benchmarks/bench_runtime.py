@@ -0,0 +1,79 @@
+"""Throughput of CPU-bound handlers on one event loop vs. the sharded multi-process runtime.
+
+Every event validates a post with its metadata (pydantic) in the handler. The numbers scale with
+the worker count up to the number of cores.
+
+Run with ``uv run python -m benchmarks.bench_runtime --events 20000 --workers 1 2 4``.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator
+
+import orjson
+
+from benchmarks.payloads import make_post
+from botenix.core.bot import Bot
+from botenix.core.events.event import Event, EventType
+from botenix.core.runtime import ShardedRuntime
+from botenix.integration.clients.models.posts import PostResponse
+
+
+def make_bot() -> Bot:
+    bot = Bot("token", "http://mattermost")
+
+    @bot.message()
+    async def validate(event: Event) -> None:  # noqa: RUF029
+        PostResponse.model_validate_json(event.data["post"])
+
+    return bot
+
+
+def make_events(count: int) -> list[Event]:
+    return [
+        Event(EventType.posted, {"post": orjson.dumps(make_post(index)).decode()}, {"channel_id": f"c{index % 64}"})
+        for index in range(count)
+    ]
+
+
+async def single_loop(events: list[Event]) -> float:
+    bot = make_bot()
+    started_at = time.perf_counter()
+    for event in events:
+        await bot.dispatcher.feed_event(event)
+    await bot.close()
+    return time.perf_counter() - started_at
+
+
+async def sharded(events: list[Event], workers: int) -> float:
+    async def source() -> AsyncIterator[Event]:  # noqa: RUF029
+        for event in events:
+            yield event
+
+    runtime = ShardedRuntime(make_bot(), workers)
+    await runtime.start()
+    started_at = time.perf_counter()
+    await runtime.serve(source())
+    await runtime.stop()
+    return time.perf_counter() - started_at
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+    events = make_events(args.events)
+
+    print(f"{os.cpu_count()} CPUs, {args.events} events")
+    elapsed = await single_loop(events)
+    print(f"single event loop: {args.events / elapsed:8,.0f} events/s")
+    for workers in args.workers:
+        elapsed = await sharded(events, workers)
+        print(f"{workers:>2} workers:        {args.events / elapsed:8,.0f} events/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""Startup cost in a fresh interpreter: ``import botenix``, creating a ``Bot`` and the first request.
+
+Each scenario runs in its own process, ``--runs`` times, and reports the median time from before the
+import to the end of the scenario, interpreter startup excluded. ``first request`` sends a post to the
+fake Mattermost server, so it includes building the model validators it needs; the ``eager schemas``
+variants build every validator at import (``BOTENIX_DEFER_SCHEMAS=0``) for comparison.
+``--importtime`` prints the slowest modules behind ``Bot`` as reported by ``python -X importtime``.
+
+Run with ``uv run python -m benchmarks.bench_startup``.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+
+from benchmarks.fake_server import FakeMattermost
+
+
+TIMER = """
+import time
+started_at = time.perf_counter()
+{code}
+print(time.perf_counter() - started_at)
+"""
+
+FIRST_REQUEST = """
+import asyncio
+from botenix import Bot
+from botenix.integration.clients.models.posts import PostResponse
+
+async def main():
+    bot = Bot("bench", {url!r})
+    payload = {{"channel_id": "c" * 26, "message": "hello"}}
+    await bot.http_client.post("/api/v4/posts", json=payload, response_model=PostResponse)
+    await bot.http_client.close()
+
+asyncio.run(main())
+"""
+
+
+async def run_python(code: str, *args: str, env: dict[str, str] | None = None) -> str:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        *args,
+        "-c",
+        code,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, **(env or {})},
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode:
+        raise RuntimeError(stderr.decode())
+    return stdout.decode() if stdout else stderr.decode()
+
+
+async def measure(name: str, code: str, runs: int, env: dict[str, str] | None = None) -> None:
+    samples = [float(await run_python(TIMER.format(code=code), env=env)) for _ in range(runs)]
+    print(f"{name:<32} {statistics.median(samples) * 1e3:8.1f} ms  (min {min(samples) * 1e3:.1f} ms)")
+
+
+async def print_importtime(limit: int) -> None:
+    # ``-X importtime`` lines: "import time: self [us] | cumulative | imported package".
+    report = await run_python("import botenix.core.bot", "-X", "importtime")
+    modules = []
+    for line in report.splitlines()[1:]:
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        modules.append((int(self_us), int(cumulative_us), name.rstrip()))
+    print("\nslowest modules of botenix.core.bot (self, cumulative):")
+    for self_us, cumulative_us, name in sorted(modules, reverse=True)[:limit]:
+        print(f"{self_us / 1e3:8.1f} ms {cumulative_us / 1e3:8.1f} ms  {name}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--importtime", type=int, default=0, metavar="N", help="print the N slowest modules")
+    args = parser.parse_args()
+    eager = {"BOTENIX_DEFER_SCHEMAS": "0"}
+
+    await measure("import botenix", "import botenix", args.runs)
+    await measure("create Bot", "from botenix import Bot\nBot('bench')", args.runs)
+    await measure("create Bot (eager schemas)", "from botenix import Bot\nBot('bench')", args.runs, eager)
+    async with FakeMattermost(heavy_metadata=False) as server:
+        first_request = FIRST_REQUEST.format(url=server.url)
+        await measure("first request", first_request, args.runs)
+        await measure("first request (eager schemas)", first_request, args.runs, eager)
+    if args.importtime:
+        await print_importtime(args.importtime)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Recent context of a thread: ``ThreadIndex.last`` vs. fetching ``/posts/{id}/thread`` per reply.
+
+Each of ``--replies`` replies looks up the last ``--count`` posts of one of ``--threads`` threads on
+the fake Mattermost server (``--latency`` seconds per request), while new posts for those threads
+arrive as events. Reports the lookup latency and the memory the index holds.
+
+Run with ``uv run python -m benchmarks.bench_thread_index --replies 2000 --latency 0.005``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import orjson
+
+from benchmarks.fake_server import FakeMattermost
+from benchmarks.payloads import make_id, make_post
+from botenix.core.events.event import Event, EventType
+from botenix.integration.clients.models.posts import LazyPost, PostList
+from botenix.integration.services.thread_index import ThreadIndex
+from botenix.integration.utils.http_client import HttpClient
+
+
+def make_reply(index: int, root_id: str) -> Event:
+    post = make_post(1_000_000 + index) | {"root_id": root_id, "create_at": 1_800_000_000_000 + index}
+    return Event(EventType.posted, {"post": orjson.dumps(post).decode()}, {"channel_id": post["channel_id"]})
+
+
+def report(name: str, timings: list[float]) -> None:
+    quantiles = statistics.quantiles(timings, n=100)
+    print(f"{name:<10} p50 {quantiles[49] * 1e6:9.1f} us  p99 {quantiles[98] * 1e6:9.1f} us")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replies", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--count", type=int, default=20, help="posts of context per reply")
+    parser.add_argument("--latency", type=float, default=0.005, help="server latency in seconds")
+    args = parser.parse_args()
+
+    async with FakeMattermost(latency=args.latency) as server:
+        client = HttpClient(server.url, bearer_token="bench")
+        roots = [make_id(30_000_000 + index) for index in range(args.threads)]
+
+        fetch: list[float] = []
+        for index in range(args.replies // 10):
+            started_at = time.perf_counter()
+            page = await client.get(
+                f"/api/v4/posts/{roots[index % args.threads]}/thread", response_model=PostList[LazyPost]
+            )
+            sorted(page.posts.values(), key=lambda post: post.create_at)[-args.count :]
+            fetch.append(time.perf_counter() - started_at)
+
+        threads = ThreadIndex(client)
+        index_timings: list[float] = []
+        requests = server.requests
+        for index in range(args.replies):
+            root_id = roots[index % args.threads]
+            threads.observe(make_reply(index, root_id))
+            started_at = time.perf_counter()
+            await threads.last(root_id, args.count)
+            index_timings.append(time.perf_counter() - started_at)
+        await client.close()
+
+    report("fetch", fetch)
+    report("index", index_timings)
+    print(
+        f"index: {server.requests - requests} requests for {args.replies} lookups, "
+        f"{threads.size / 1024:.0f} KiB in {len(threads)} threads"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+"""Per-request cost of response decoding: fresh ``TypeAdapter`` + dict round trip vs. cached ``validate_json``.
+
+Run with ``uv run python -m benchmarks.bench_type_adapters``.
+"""
+
+import timeit
+from typing import Any
+
+import orjson
+from pydantic import TypeAdapter
+
+from benchmarks.payloads import make_post, make_posts
+from botenix.integration.clients.models.posts import PostResponse
+from botenix.integration.utils.type_adapters import type_adapters
+
+
+def decode_uncached(body: bytes, model: type[Any]) -> object:
+    return TypeAdapter(model).validate_python(orjson.loads(body))
+
+
+def decode_cached(body: bytes, model: type[Any]) -> object:
+    return type_adapters.get(model).validate_json(body)
+
+
+def measure(name: str, body: bytes, model: type[Any], number: int) -> None:
+    before = min(timeit.repeat(lambda: decode_uncached(body, model), number=number, repeat=5)) / number
+    after = min(timeit.repeat(lambda: decode_cached(body, model), number=number, repeat=5)) / number
+    print(
+        f"{name:<28} uncached {before * 1e6:9.1f} us/req   cached {after * 1e6:9.1f} us/req   "
+        f"saved {(before - after) * 1e6:9.1f} us/req ({before / after:4.1f}x)"
+    )
+
+
+def main() -> None:
+    measure("PostResponse", orjson.dumps(make_post()), PostResponse, number=2_000)
+    measure("PostResponse (light)", orjson.dumps(make_post(heavy_metadata=False)), PostResponse, number=5_000)
+    measure("list[PostResponse]", orjson.dumps(make_posts(60)), list[PostResponse], number=100)
+    measure(
+        "list[PostResponse] (light)",
+        orjson.dumps(make_posts(60, heavy_metadata=False)),
+        list[PostResponse],
+        number=500,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Per-event overhead of ``WebSocketClient`` (receive, orjson decode, queue) against a local fake server.
+
+Run with ``uv run python -m benchmarks.bench_websocket``.
+"""
+
+import asyncio
+import time
+
+import orjson
+from websockets.asyncio.server import ServerConnection, serve
+
+from benchmarks.payloads import make_post
+from botenix.integration.utils.websocket_client import WebSocketClient
+
+
+EVENTS = 50_000
+
+
+def make_frames(count: int) -> list[bytes]:
+    frames = [orjson.dumps({"event": "hello", "data": {"connection_id": "bench"}, "broadcast": {}, "seq": 0})]
+    for seq in range(1, count + 1):
+        post = make_post(seq, heavy_metadata=False)
+        frames.append(
+            orjson.dumps({
+                "event": "posted",
+                "data": {"post": orjson.dumps(post).decode(), "channel_type": "O", "sender_name": "@bot"},
+                "broadcast": {"channel_id": post["channel_id"], "team_id": "", "user_id": ""},
+                "seq": seq,
+            })
+        )
+    return frames
+
+
+async def main() -> None:
+    frames = make_frames(EVENTS)
+
+    async def handler(connection: ServerConnection) -> None:
+        for frame in frames:
+            await connection.send(frame)
+        await connection.wait_closed()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        host, port = next(iter(server.sockets)).getsockname()[:2]
+        started_at = time.perf_counter()
+        received = 0
+        async with WebSocketClient(f"http://{host}:{port}", "bench-token", max_queue_size=10_000) as client:
+            async for event in client:
+                received += 1
+                if event.seq == EVENTS:
+                    break
+        elapsed = time.perf_counter() - started_at
+
+    rate, per_event = received / elapsed, elapsed / received * 1e6
+    print(f"events: {received}  elapsed: {elapsed:.2f}s  {rate:,.0f} events/s  {per_event:.1f} us/event")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,212 @@
+"""In-process fake Mattermost server for the benchmarks: REST over HTTP/1.1 keep-alive and the WebSocket.
+
+Responses are serialized once up front, so the server spends as little of the shared event loop as
+possible. ``latency`` delays every REST response, ``rate`` and ``burst`` enable a token bucket with
+Mattermost's ``X-RateLimit-*`` headers and ``429`` responses, and ``heavy_metadata``/``message_size``
+control the payload sizes.
+
+    async with FakeMattermost(latency=0.002) as server:
+        client = HttpClient(server.url)
+        websocket = WebSocketClient(server.websocket_url, "token")
+        connected = server.expect_connection()
+        websocket.start()
+        await connected
+        await server.broadcast(make_event_frames(1000))
+"""
+
+import asyncio
+import contextlib
+import re
+import time
+from collections.abc import Iterable
+from types import TracebackType
+from typing import Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+from benchmarks.payloads import make_id, make_post
+
+
+_TEMPLATES = 64
+_REASONS = {200: "OK", 201: "Created", 404: "Not Found", 429: "Too Many Requests"}
+_POST = re.compile(r"^/api/v4/posts/(?P<post_id>\w+)(?P<patch>/patch)?$")
+_CHANNEL_POSTS = re.compile(r"^/api/v4/channels/(?P<channel_id>\w+)/posts$")
+_THREAD = re.compile(r"^/api/v4/posts/(?P<post_id>\w+)/thread$")
+
+
+def make_event_frames(count: int, *, heavy_metadata: bool = False, channels: int = 16) -> list[bytes]:
+    # ``posted`` events as the server sends them: the post is a JSON string inside the JSON frame.
+    frames = []
+    for seq in range(1, count + 1):
+        post = make_post(seq, channel_id=make_id(10_000_000 + seq % channels), heavy_metadata=heavy_metadata)
+        frames.append(
+            orjson.dumps({
+                "event": "posted",
+                "data": {"post": orjson.dumps(post).decode(), "channel_type": "O", "sender_name": "@user"},
+                "broadcast": {"channel_id": post["channel_id"], "team_id": "", "user_id": ""},
+                "seq": seq,
+            })
+        )
+    return frames
+
+
+class FakeMattermost:
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        rate: float | None = None,
+        burst: int = 100,
+        heavy_metadata: bool = True,
+        message_size: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.rate = rate
+        self.burst = burst
+        self.requests = 0
+        self.throttled = 0
+        self.http_connections = 0
+        self.posts = [self._make_post(index, heavy_metadata, message_size) for index in range(_TEMPLATES)]
+        self._post_bodies = [orjson.dumps(post) for post in self.posts]
+        self._post_lists: dict[int, bytes] = {}
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._http: asyncio.Server | None = None
+        self._websocket: Server | None = None
+        self._connections: set[ServerConnection] = set()
+        self._waiter: asyncio.Future[None] | None = None
+        self.url = ""
+        self.websocket_url = ""
+
+    @staticmethod
+    def _make_post(index: int, heavy_metadata: bool, message_size: int | None) -> dict[str, Any]:
+        post = make_post(index, heavy_metadata=heavy_metadata)
+        if message_size is not None:
+            post["message"] = (post["message"] * (message_size // len(post["message"]) + 1))[:message_size]
+        return post
+
+    async def start(self) -> None:
+        self._http = await asyncio.start_server(self._serve_http, "127.0.0.1", 0)
+        self._websocket = await serve(self._serve_websocket, "127.0.0.1", 0, max_size=None)
+        self.url = f"http://127.0.0.1:{self._http.sockets[0].getsockname()[1]}"
+        self.websocket_url = f"http://127.0.0.1:{next(iter(self._websocket.sockets)).getsockname()[1]}"
+
+    async def close(self) -> None:
+        if self._websocket is not None:
+            self._websocket.close()
+            await self._websocket.wait_closed()
+        if self._http is not None:
+            self._http.close()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._http.wait_closed(), 1)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    # REST
+
+    async def _serve_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.http_connections += 1
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in {b"\r\n", b"\n", b""}:
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                writer.write(await self._respond(method, target, body))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, target: str, body: bytes) -> bytes:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        rate_headers = self._take_token()
+        if rate_headers is None:
+            self.throttled += 1
+            return self._response(429, b'{"message": "Too many requests"}', {"Retry-After": "1"})
+        url = urlsplit(target)
+        status, content = self._route(method, url.path, parse_qs(url.query), body)
+        return self._response(status, content, rate_headers)
+
+    def _take_token(self) -> dict[str, str] | None:
+        if self.rate is None:
+            return {}
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        if self._tokens < 1:
+            return None
+        self._tokens -= 1
+        return {"X-RateLimit-Limit": str(self.burst), "X-RateLimit-Remaining": str(int(self._tokens))}
+
+    def _route(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[int, bytes]:
+        if match := _POST.match(path):
+            return 200, self._post_bodies[hash(match["post_id"]) % _TEMPLATES]
+        if method == "GET" and (_CHANNEL_POSTS.match(path) or _THREAD.match(path)):
+            per_page = int(query.get("per_page", ["60"])[0])
+            if per_page not in self._post_lists:
+                self._post_lists[per_page] = self._post_list(per_page)
+            return 200, self._post_lists[per_page]
+        if method == "POST" and path == "/api/v4/posts":
+            request = orjson.loads(body)
+            return 201, orjson.dumps({**self.posts[0], **request, "id": make_id(self.requests)})
+        if path == "/api/v4/users/me/typing":
+            return 200, b'{"status": "OK"}'
+        if path == "/api/v4/users/me":
+            return 200, orjson.dumps({"id": make_id(1), "username": "bench-bot", "email": "bot@example.com"})
+        return 404, b'{"id": "api.context.404.app_error", "message": "Not found"}'
+
+    def _post_list(self, count: int) -> bytes:
+        posts = (self.posts[index % _TEMPLATES] | {"id": make_id(index)} for index in range(count))
+        posts_by_id = {post["id"]: post for post in posts}
+        return orjson.dumps({"order": list(posts_by_id), "posts": posts_by_id, "next_post_id": "", "prev_post_id": ""})
+
+    @staticmethod
+    def _response(status: int, content: bytes, headers: dict[str, str]) -> bytes:
+        lines = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(content)}",
+            *(f"{name}: {value}" for name, value in headers.items()),
+        ]
+        return "\r\n".join(lines).encode() + b"\r\n\r\n" + content
+
+    # WebSocket
+
+    async def _serve_websocket(self, connection: ServerConnection) -> None:
+        hello = {"event": "hello", "data": {"connection_id": str(connection.id)}, "broadcast": {}, "seq": 0}
+        await connection.send(orjson.dumps(hello))
+        self._connections.add(connection)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        try:
+            await connection.wait_closed()
+        finally:
+            self._connections.discard(connection)
+
+    def expect_connection(self) -> asyncio.Future[None]:
+        # Resolves once the next WebSocket client is connected and greeted; call it before connecting.
+        self._waiter = asyncio.get_running_loop().create_future()
+        return self._waiter
+
+    async def broadcast(self, frames: Iterable[bytes]) -> None:
+        for frame in frames:
+            for connection in list(self._connections):
+                await connection.send(frame)
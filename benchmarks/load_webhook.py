@@ -0,0 +1,108 @@
+"""Load test of the webhook server: requests/s and latency percentiles of slash command requests.
+
+Starts a local server (``--workers`` processes sharing the port) unless ``--url`` points to a
+running instance.
+
+Run with ``uv run python -m benchmarks.load_webhook --workers 4 --concurrency 64 --duration 10``.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+
+import httpx
+
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event
+from botenix.core.executor import HandlerExecutor
+from botenix.interface.webhook import WebhookApp, run_webhook_server
+
+
+TOKEN = "load-test-token"
+PAYLOAD = {"token": TOKEN, "command": "/echo", "text": "hello", "channel_id": "channel", "user_id": "user"}
+
+
+def make_app() -> WebhookApp:
+    dispatcher = Dispatcher(executor=HandlerExecutor())
+
+    @dispatcher.slash_command("echo")
+    async def echo(event: Event) -> None:  # noqa: ARG001
+        await asyncio.sleep(0.001)
+
+    return WebhookApp(dispatcher, tokens=[TOKEN])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+async def wait_until_listening(url: str) -> None:
+    async with httpx.AsyncClient() as client, asyncio.timeout(10):
+        while True:
+            try:
+                await client.post(f"{url}/hooks/command", data=PAYLOAD)
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+            else:
+                return
+
+
+async def run_load(url: str, concurrency: int, duration: float) -> None:
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+
+        async def worker(deadline: float) -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started_at = time.perf_counter()
+                response = await client.post("/hooks/command", data=PAYLOAD)
+                latencies.append(time.perf_counter() - started_at)
+                errors += response.status_code != 200
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(started_at + duration) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"requests: {len(latencies)}  errors: {errors}  {len(latencies) / elapsed:,.0f} req/s  "
+        f"p50 {quantiles[49] * 1e3:.2f} ms  p99 {quantiles[98] * 1e3:.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="base URL of a running webhook server")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = multiprocessing.get_context("fork").Process(
+            target=run_webhook_server, args=(make_app, "127.0.0.1", port), kwargs={"workers": args.workers}
+        )
+        server.start()
+    try:
+        asyncio.run(wait_until_listening(url))
+        asyncio.run(run_load(url, args.concurrency, args.duration))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
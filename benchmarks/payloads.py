@@ -0,0 +1,77 @@
+"""Realistic Mattermost payload factories shared by the benchmarks."""
+
+from typing import Any
+
+
+def make_id(index: int) -> str:
+    return f"{index:026d}"[-26:]
+
+
+def make_post(index: int = 0, *, channel_id: str | None = None, heavy_metadata: bool = True) -> dict[str, Any]:
+    post_id = make_id(index)
+    channel_id = channel_id or make_id(10_000_000 + index % 16)
+    post: dict[str, Any] = {
+        "id": post_id,
+        "create_at": 1_700_000_000_000 + index,
+        "update_at": 1_700_000_000_000 + index,
+        "edit_at": 0,
+        "delete_at": 0,
+        "user_id": make_id(20_000_000 + index % 64),
+        "channel_id": channel_id,
+        "root_id": "",
+        "original_id": "",
+        "message": f"Deploy #{index} finished: all checks passed, see the attached report for details.",
+        "type": "",
+        "props": {"from_bot": "true", "attachments": []},
+        "hashtags": "",
+        "pending_post_id": "",
+        "file_ids": [],
+    }
+    if heavy_metadata:
+        post["file_ids"] = [make_id(30_000_000 + index * 4 + n) for n in range(3)]
+        post["metadata"] = {
+            "embeds": [{"type": "opengraph", "url": "https://example.com/report", "data": {"title": "Report"}}],
+            "emojis": [
+                {"id": make_id(40_000_000 + n), "name": f"emoji_{n}", "create_at": 1, "update_at": 1, "delete_at": 0}
+                for n in range(3)
+            ],
+            "files": [
+                {
+                    "id": file_id,
+                    "user_id": post["user_id"],
+                    "post_id": post_id,
+                    "channel_id": channel_id,
+                    "create_at": 1,
+                    "update_at": 1,
+                    "delete_at": 0,
+                    "name": f"report-{n}.png",
+                    "extension": "png",
+                    "size": 123_456,
+                    "mime_type": "image/png",
+                    "width": 1024,
+                    "height": 768,
+                    "has_preview_image": True,
+                }
+                for n, file_id in enumerate(post["file_ids"])
+            ],
+            "images": {"https://example.com/preview.png": {"width": 640, "height": 480, "format": "png"}},
+            "reactions": [
+                {
+                    "user_id": make_id(20_000_000 + n),
+                    "post_id": post_id,
+                    "emoji_name": "thumbsup",
+                    "channel_id": channel_id,
+                    "create_at": 1,
+                }
+                for n in range(5)
+            ],
+            "priority": {"priority": "important", "requested_ack": True},
+            "acknowledgements": [
+                {"user_id": make_id(20_000_000 + n), "post_id": post_id, "acknowledged_at": 1} for n in range(2)
+            ],
+        }
+    return post
+
+
+def make_posts(count: int, *, heavy_metadata: bool = True) -> list[dict[str, Any]]:
+    return [make_post(index, heavy_metadata=heavy_metadata) for index in range(count)]
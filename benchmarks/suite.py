@@ -0,0 +1,314 @@
+"""Benchmark suite against the in-process fake Mattermost server, with JSON results for comparing commits.
+
+Covers ``HttpClient`` round trips (also under a server rate limit) and response decoding,
+``PostResponse`` validation, routing and dispatch, and end-to-end WebSocket events handled per
+second (each handler replies over REST).
+Every benchmark runs ``--repeat`` times and reports the median.
+
+Run with ``uv run python -m benchmarks.suite --output before.json``, then after a change
+``uv run python -m benchmarks.suite --output after.json --compare before.json``; the comparison exits
+with status 1 when a benchmark regressed by more than ``--threshold``.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from benchmarks.fake_server import FakeMattermost, make_event_frames
+from benchmarks.payloads import make_id, make_post
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.core.executor import HandlerExecutor
+from botenix.core.router import HandlerCallback
+from botenix.integration.clients.models.posts import LazyPost, PostList, PostResponse
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.rate_limiter import RateLimiter
+from botenix.integration.utils.websocket_client import WebSocketClient
+
+
+@dataclass
+class Result:
+    value: float
+    unit: str
+    higher_is_better: bool = True
+    samples: list[float] = field(default_factory=list)
+    extra: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class Options:
+    scale: float
+    latency: float
+    repeat: int
+
+
+async def repeat(options: Options, run: Callable[[], Awaitable[float]]) -> list[float]:
+    return [await run() for _ in range(options.repeat)]
+
+
+def scaled(options: Options, count: int) -> int:
+    return max(1, int(count * options.scale))
+
+
+async def bench_http_get_post(options: Options) -> Result:
+    requests = scaled(options, 2000)
+    latencies: list[float] = []
+    async with FakeMattermost(latency=options.latency) as server:
+        client = HttpClient(server.url, bearer_token="bench")
+
+        async def run() -> float:
+            started_at = time.perf_counter()
+            for index in range(requests):
+                request_started_at = time.perf_counter()
+                await client.get(f"/api/v4/posts/{make_id(index)}", response_model=PostResponse)
+                latencies.append(time.perf_counter() - request_started_at)
+            return requests / (time.perf_counter() - started_at)
+
+        samples = await repeat(options, run)
+        await client.close()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return Result(
+        statistics.median(samples),
+        "requests/s",
+        samples=samples,
+        extra={"p50_us": quantiles[49] * 1e6, "p99_us": quantiles[98] * 1e6},
+    )
+
+
+async def bench_http_get_post_concurrent(options: Options) -> Result:
+    requests = scaled(options, 2000)
+    async with FakeMattermost(latency=options.latency) as server:
+        client = HttpClient(server.url, bearer_token="bench")
+
+        async def get(index: int) -> PostResponse:
+            return await client.get(f"/api/v4/posts/{make_id(index)}", response_model=PostResponse)
+
+        async def run() -> float:
+            started_at = time.perf_counter()
+            async for result in client.bulk(lambda index=index: get(index) for index in range(requests)):
+                result.unwrap()
+            return requests / (time.perf_counter() - started_at)
+
+        samples = await repeat(options, run)
+        await client.close()
+    return Result(statistics.median(samples), "requests/s", samples=samples)
+
+
+async def bench_http_rate_limited(options: Options) -> Result:
+    # The client limiter follows the server's budget, so no request should be throttled.
+    requests = scaled(options, 1000)
+    async with FakeMattermost(latency=options.latency, rate=500, burst=50) as server:
+        client = HttpClient(server.url, bearer_token="bench", rate_limiter=RateLimiter(rate=500, burst=50))
+
+        async def get(index: int) -> PostResponse:
+            return await client.get(f"/api/v4/posts/{make_id(index)}", response_model=PostResponse)
+
+        async def run() -> float:
+            started_at = time.perf_counter()
+            async for result in client.bulk(lambda index=index: get(index) for index in range(requests)):
+                result.unwrap()
+            return requests / (time.perf_counter() - started_at)
+
+        samples = await repeat(options, run)
+        await client.close()
+    return Result(statistics.median(samples), "requests/s", samples=samples, extra={"throttled": server.throttled})
+
+
+async def bench_http_list_posts(options: Options) -> Result:
+    pages = scaled(options, 100)
+    async with FakeMattermost(latency=options.latency) as server:
+        client = HttpClient(server.url, bearer_token="bench")
+
+        async def run() -> float:
+            started_at = time.perf_counter()
+            decoded = 0
+            for _ in range(pages):
+                page = await client.get(
+                    f"/api/v4/channels/{make_id(1)}/posts", params={"per_page": 200}, response_model=PostList[LazyPost]
+                )
+                decoded += len(page.posts)
+            return decoded / (time.perf_counter() - started_at)
+
+        samples = await repeat(options, run)
+        await client.close()
+    return Result(statistics.median(samples), "posts/s", samples=samples)
+
+
+async def bench_validate_post_response(options: Options) -> Result:
+    bodies = [orjson.dumps(make_post(index)) for index in range(scaled(options, 5000))]
+
+    async def run() -> float:  # noqa: RUF029
+        started_at = time.perf_counter()
+        for body in bodies:
+            PostResponse.model_validate_json(body)
+        return (time.perf_counter() - started_at) / len(bodies) * 1e6
+
+    samples = await repeat(options, run)
+    return Result(statistics.median(samples), "us/post", higher_is_better=False, samples=samples)
+
+
+async def noop(event: Event) -> None:
+    pass
+
+
+def make_dispatcher(handler: HandlerCallback, executor: HandlerExecutor | None = None) -> Dispatcher:
+    # 100 handlers that do not match the benchmark posts (commands, regular expressions and other
+    # channels) in front of ``handler``, which takes every post.
+    dispatcher = Dispatcher(executor=executor)
+    for index in range(100):
+        if index < 10:
+            dispatcher.register(noop, EventType.posted, regexp=rf"\bticket-{index}\b")
+        elif index % 2:
+            dispatcher.register(noop, EventType.posted, command=f"command{index}")
+        else:
+            dispatcher.register(noop, EventType.posted, channel_id=make_id(index), prefix="Deploy")
+    dispatcher.register(handler, EventType.posted)
+    dispatcher.build()
+    return dispatcher
+
+
+async def bench_dispatch(options: Options) -> Result:
+    frames = make_event_frames(scaled(options, 20_000))
+    dispatcher = make_dispatcher(noop)
+
+    async def run() -> float:
+        # Decoding is included: the dispatcher reads the post text from the JSON string.
+        started_at = time.perf_counter()
+        for frame in frames:
+            event = Event.from_json(frame)
+            if event is not None:
+                await dispatcher.feed_event(event)
+        return len(frames) / (time.perf_counter() - started_at)
+
+    samples = await repeat(options, run)
+    return Result(statistics.median(samples), "events/s", samples=samples)
+
+
+async def bench_end_to_end(options: Options) -> Result:
+    events = scaled(options, 2000)
+    frames = make_event_frames(events)
+    async with FakeMattermost(latency=options.latency, heavy_metadata=False) as server:
+        client = HttpClient(server.url, bearer_token="bench")
+
+        async def run() -> float:
+            done = asyncio.Event()
+            handled = 0
+
+            async def reply(event: Event) -> None:
+                nonlocal handled
+                await client.post("/api/v4/posts", json={"channel_id": event.channel_id, "message": "ack"})
+                handled += 1
+                if handled == events:
+                    done.set()
+
+            dispatcher = make_dispatcher(reply, HandlerExecutor())
+
+            websocket = WebSocketClient(server.websocket_url, "bench", max_queue_size=10_000)
+
+            async def consume() -> None:
+                async for event in websocket:
+                    await dispatcher.feed_event(event)
+
+            connected = server.expect_connection()
+            consumer = asyncio.create_task(consume())
+            await connected
+            started_at = time.perf_counter()
+            await server.broadcast(frames)
+            await done.wait()
+            elapsed = time.perf_counter() - started_at
+            await websocket.close()
+            consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await consumer
+            await dispatcher.close()
+            return events / elapsed
+
+        samples = await repeat(options, run)
+        await client.close()
+    return Result(statistics.median(samples), "events/s", samples=samples)
+
+
+BENCHMARKS: dict[str, Callable[[Options], Awaitable[Result]]] = {
+    "http_get_post": bench_http_get_post,
+    "http_get_post_concurrent": bench_http_get_post_concurrent,
+    "http_rate_limited": bench_http_rate_limited,
+    "http_list_posts": bench_http_list_posts,
+    "validate_post_response": bench_validate_post_response,
+    "dispatch": bench_dispatch,
+    "end_to_end": bench_end_to_end,
+}
+
+
+def metadata(options: Options) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        **asdict(options),
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> bool:
+    regressed = False
+    print(f"\n{'benchmark':<26} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None or not previous["value"]:
+            continue
+        change = result["value"] / previous["value"] - 1
+        worse = -change if result["higher_is_better"] else change
+        flag = "  REGRESSION" if worse > threshold else ""
+        regressed = regressed or bool(flag)
+        print(f"{name:<26} {previous['value']:>12,.1f} {result['value']:>12,.1f} {change:>+8.1%}{flag}")
+    return not regressed
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, help="write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change counted as a regression")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the operation counts")
+    parser.add_argument("--latency", type=float, default=0.0, help="fake server latency per request in seconds")
+    args = parser.parse_args()
+    options = Options(scale=args.scale, latency=args.latency, repeat=args.repeat)
+
+    results: dict[str, Any] = {"meta": metadata(options), "benchmarks": {}}
+    for name in args.only or BENCHMARKS:
+        result = await BENCHMARKS[name](options)
+        results["benchmarks"][name] = asdict(result)
+        extra = "  ".join(f"{key} {value:,.1f}" for key, value in result.extra.items())
+        print(f"{name:<26} {result.value:>12,.1f} {result.unit:<11} {extra}")
+
+    if args.output is not None:
+        args.output.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    if args.compare is not None:
+        return 0 if compare(results, orjson.loads(args.compare.read_bytes()), args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from botenix.core.bot import Bot  # noqa: TC004
+    from botenix.core.dispatcher import Dispatcher  # noqa: TC004
+    from botenix.core.router import Router  # noqa: TC004
+
+
+__all__ = ["Bot", "Dispatcher", "Router"]
+
+# Imported on first access: ``import botenix`` does not load httpx, pydantic or websockets.
+_LAZY = {"Bot": "botenix.core.bot", "Dispatcher": "botenix.core.dispatcher", "Router": "botenix.core.router"}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
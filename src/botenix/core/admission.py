@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import IntEnum, StrEnum
+from typing import TYPE_CHECKING
+
+from botenix.core.events.event import EventType
+from botenix.logger import core_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from botenix.core.events.event import Event
+
+
+class Priority(IntEnum):
+    high = 0
+    normal = 1
+    low = 2
+
+
+class ShedReason(StrEnum):
+    # Low priority, while the queueing delay has been above target for a whole interval.
+    overload = "overload"
+    # Waited longer than ``max_delay``.
+    expired = "expired"
+
+
+_INTERACTIVE = frozenset({
+    EventType.slash_command,
+    EventType.post_action,
+    EventType.dialog_submission,
+    EventType.outgoing_webhook,
+})
+_AMBIENT = frozenset({
+    EventType.posted,
+    EventType.post_edited,
+    EventType.post_deleted,
+    EventType.reaction_added,
+    EventType.reaction_removed,
+    EventType.typing,
+    EventType.status_change,
+})
+
+
+def classify(event: Event, user_id: str | None = None) -> Priority:
+    # Commands, interactive messages and posts addressed to the bot (direct messages, mentions of
+    # ``user_id``) are high; channel chatter, reactions and presence are low; the rest, such as
+    # membership and channel changes that caches depend on, is normal.
+    if event.type in _INTERACTIVE:
+        return Priority.high
+    if event.type == EventType.posted:
+        if event.data.get("channel_type") == "D":
+            return Priority.high
+        # ``mentions`` is a JSON array of user ids, encoded as a string; ids are fixed-length, so a
+        # substring check is enough.
+        mentions = event.data.get("mentions")
+        if user_id and mentions and user_id in mentions:
+            return Priority.high
+    if event.type in _AMBIENT:
+        return Priority.low
+    return Priority.normal
+
+
+@dataclass(slots=True)
+class AdmissionStats:
+    admitted: Counter[Priority] = field(default_factory=Counter)
+    shed: Counter[ShedReason] = field(default_factory=Counter)
+    sampled: int = 0
+    overloads: int = 0
+    peak_delay: float = 0.0
+
+    @property
+    def total_shed(self) -> int:
+        return self.shed.total()
+
+
+class AdmissionController:
+    """Dispatcher stage that sheds low-priority events while the event backlog is overloaded.
+
+    Use with ``dispatcher.add_stage(admission.observe)`` after the other stages.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        target: float = 0.05,
+        interval: float = 0.5,
+        *,
+        max_delay: float | None = None,
+        sample_rate: float = 0.0,
+        user_id: str | None = None,
+        classify: Callable[[Event, str | None], Priority] = classify,
+    ) -> None:
+        if target <= 0 or interval <= 0 or not 0 <= sample_rate <= 1:
+            raise ValueError("Target and interval must be positive and the sample rate between 0 and 1")
+        self.target = target
+        self.interval = interval
+        self.max_delay = max_delay
+        self.sample_rate = sample_rate
+        self.user_id = user_id
+        self.classify = classify
+        self.stats = AdmissionStats()
+        self._above_since: float | None = None
+        self._shedding = False
+        self._stopped_at = float("-inf")
+        self._episode_shed = 0
+        self._sample_credit = 0.0
+
+    @property
+    def shedding(self) -> bool:
+        return self._shedding
+
+    def _update(self, delay: float, now: float) -> None:
+        if delay < self.target:
+            self._above_since = None
+            if self._shedding:
+                self._shedding = False
+                self._stopped_at = now
+                logger.debug(f"Event queue delay back under {self.target * 1e3:.0f} ms, {self._episode_shed} shed")
+            return
+        if self._above_since is None:
+            self._above_since = now
+        if self._shedding:
+            return
+        if now - self._stopped_at < self.interval:
+            # Shedding drains the backlog quickly; an overload that returns within an interval of the
+            # last episode is the same one, so shedding resumes at once.
+            self._shedding = True
+        elif now - self._above_since >= self.interval:
+            self._shedding = True
+            self._episode_shed = 0
+            self.stats.overloads += 1
+            logger.warning(f"Event queue delay above {self.target * 1e3:.0f} ms, shedding low-priority events")
+
+    def _shed_reason(self, priority: Priority, delay: float) -> ShedReason | None:
+        if priority is Priority.high:
+            return None
+        if self.max_delay is not None and delay > self.max_delay:
+            return ShedReason.expired
+        if priority is Priority.low and self._shedding:
+            self._sample_credit += self.sample_rate
+            if self._sample_credit < 1:
+                return ShedReason.overload
+            self._sample_credit -= 1
+            self.stats.sampled += 1
+        return None
+
+    def observe(self, event: Event) -> bool:
+        now = time.monotonic()
+        delay = now - event.received_at
+        self.stats.peak_delay = max(self.stats.peak_delay, delay)
+        self._update(delay, now)
+        priority = self.classify(event, self.user_id)
+        reason = self._shed_reason(priority, delay)
+        if reason is None:
+            self.stats.admitted[priority] += 1
+            return True
+        self.stats.shed[reason] += 1
+        self._episode_shed += 1
+        return False
+
+    def reset(self) -> None:
+        self.stats = AdmissionStats()
+        self._above_since = None
+        self._shedding = False
+        self._stopped_at = float("-inf")
+        self._sample_credit = 0.0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.executor import HandlerExecutor
+from botenix.integration.clients.models.common import build_schemas
+from botenix.integration.services.entity_store import EntityStore
+from botenix.integration.services.outbound import OutboundQueue
+from botenix.integration.services.thread_index import ThreadIndex
+from botenix.integration.utils.http_client import HttpClient
+from botenix.logger import core_logger as logger
+
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable, Iterable, Sequence
+
+    from botenix.core.router import EventFilter, Router, THandler
+    from botenix.integration.services.journal import EventJournal
+    from botenix.integration.utils.websocket_client import GapCallback, WebSocketClient
+    from botenix.interface.webhook import WebhookApp
+
+
+class Bot:
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str,
+        url: str = "http://localhost:8065",
+        *,
+        verify_ssl: bool = True,
+        http_client: HttpClient | None = None,
+        dispatcher: Dispatcher | None = None,
+        entity_store: EntityStore | None = None,
+        thread_index: ThreadIndex | None = None,
+        journal: EventJournal | None = None,
+    ) -> None:
+        self.url = url
+        self.verify_ssl = verify_ssl
+        self._token = token
+        self.http_client = http_client or HttpClient(url, verify_ssl=verify_ssl, bearer_token=token)
+        self.dispatcher = dispatcher or Dispatcher(executor=HandlerExecutor())
+        self.journal = journal
+        if journal is not None:
+            # First stage: posts handled before a restart or reconnect are dropped before anything else sees them.
+            self.dispatcher.add_stage(journal.observe)
+            self.dispatcher.add_done_callback(journal.done)
+        # Updated from the event stream before any handler runs, so handlers see current entities.
+        self.entities = entity_store or EntityStore(self.http_client)
+        self.dispatcher.add_stage(self.entities.observe)
+        # Only threads a handler has looked up are tracked, so this costs nothing until it is used.
+        self.threads = thread_index or ThreadIndex(self.http_client)
+        self.dispatcher.add_stage(self.threads.observe)
+        self.outbound = OutboundQueue(self.http_client)
+        self.dispatcher.context.update(
+            bot=self,
+            http_client=self.http_client,
+            entities=self.entities,
+            threads=self.threads,
+            outbound=self.outbound,
+        )
+
+    def include_router(self, router: Router) -> Router:
+        return self.dispatcher.include_router(router)
+
+    def message(
+        self,
+        *filters: EventFilter,
+        command: str | Sequence[str] | None = None,
+        regexp: str | re.Pattern[str] | None = None,
+        prefix: str | None = None,
+        channel_id: str | None = None,
+        team_id: str | None = None,
+    ) -> Callable[[THandler], THandler]:
+        return self.dispatcher.message(
+            *filters, command=command, regexp=regexp, prefix=prefix, channel_id=channel_id, team_id=team_id
+        )
+
+    def event(
+        self,
+        event_type: str,
+        *filters: EventFilter,
+        channel_id: str | None = None,
+        team_id: str | None = None,
+    ) -> Callable[[THandler], THandler]:
+        return self.dispatcher.event(event_type, *filters, channel_id=channel_id, team_id=team_id)
+
+    def create_webhook_app(self, *, tokens: Iterable[str] = (), path_prefix: str = "/hooks") -> WebhookApp:
+        # Imported here: the server lives behind the optional ``webhook`` extra.
+        from botenix.interface.webhook import WebhookApp  # noqa: PLC0415
+
+        return WebhookApp(self.dispatcher, tokens=tokens, path_prefix=path_prefix)
+
+    def create_websocket_client(self, *, on_gap: GapCallback | None = None) -> WebSocketClient:
+        # Imported here, like the runtime below: jobs that only call the REST API never load websockets.
+        from botenix.integration.utils.websocket_client import WebSocketClient  # noqa: PLC0415
+
+        return WebSocketClient(self.url, self._token, verify_ssl=self.verify_ssl, on_gap=on_gap)
+
+    async def catch_up(self) -> int:
+        # Feeds the posts missed since the journal was last written; returns how many there were.
+        if self.journal is None:
+            return 0
+        events = await self.journal.missed_events(self.http_client)
+        for event in events:
+            await self.dispatcher.feed_event(event)
+        if events:
+            logger.info(f"Caught up on {len(events)} missed posts")
+        return len(events)
+
+    async def _catch_up_after_gap(self, expected: int, received: int) -> None:  # noqa: ARG002
+        # Awaited by the WebSocket client before the first event of the new connection is queued,
+        # so missed posts are dispatched ahead of the live ones.
+        await self.catch_up()
+
+    async def start(self) -> None:
+        self.dispatcher.build()
+        # A long-running bot builds the model validators now rather than on the first events.
+        build_schemas()
+        try:
+            on_gap = None
+            if self.journal is not None:
+                await self.journal.open()
+                on_gap = self._catch_up_after_gap
+            async with self.create_websocket_client(on_gap=on_gap) as websocket:
+                logger.info("Bot started")
+                if self.journal is not None:
+                    # Posts made while the bot was down; those the WebSocket delivers too are dropped by the journal.
+                    await websocket.wait_connected()
+                    await self.catch_up()
+                async for event in websocket:
+                    await self.dispatcher.feed_event(event)
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        await self.dispatcher.close()
+        # Handlers are done; whatever they queued is sent before the connection pool goes away.
+        await self.outbound.close()
+        if self.journal is not None:
+            await self.journal.close()
+        await self.http_client.close()
+        logger.info("Bot stopped")
+
+    def run(self, *, workers: int = 1) -> None:
+        # With several workers, events are sharded by channel over forked processes (see ``ShardedRuntime``).
+        if workers != 1:
+            if self.journal is not None:
+                raise ValueError("The event journal is not supported with several workers")
+            from botenix.core.runtime import ShardedRuntime  # noqa: PLC0415
+
+            ShardedRuntime(self, workers).run()
+            return
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self.start())
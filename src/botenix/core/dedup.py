@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import functools
+import math
+import random
+import time
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from botenix.core.events.event import EventType
+from botenix.logger import core_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from botenix.core.events.event import Event
+
+_UINT64 = (1 << 64) - 1
+_BLOCK_BITS = 64
+_PATTERN_BITS = 12
+_MAX_PROBES = 16
+
+
+def event_key(event: Event) -> str | None:
+    # Keys include the event type: handlers for ``posted`` events must still see a post whose outgoing
+    # webhook copy arrived first. Every edit of a post is a new event; other events are not deduplicated.
+    if event.type == EventType.posted:
+        post = event.post
+        return f"{event.type}:{post['id']}" if post and post.get("id") else None
+    if event.type == EventType.outgoing_webhook:
+        post_id = event.data.get("post_id")
+        return f"{event.type}:{post_id}" if post_id else None
+    if event.type in {EventType.post_edited, EventType.post_deleted}:
+        post = event.post
+        if not post or not post.get("id"):
+            return None
+        return f"{event.type}:{post['id']}:{post.get('edit_at', 0)}:{post.get('delete_at', 0)}"
+    return None
+
+
+@functools.cache
+def _patterns(bits: int) -> array[int]:
+    # Precomputed 64-bit masks with ``bits`` bits set; fixed seed, so every filter gets the same table.
+    generator = random.Random(bits)  # noqa: S311
+    table = array("Q")
+    for _ in range(1 << _PATTERN_BITS):
+        mask = 0
+        for bit in generator.sample(range(_BLOCK_BITS), bits):
+            mask |= 1 << bit
+        table.append(mask)
+    return table
+
+
+def _false_positive_rate(keys_per_block: float, probes: int) -> float:
+    # Blocks hold a Poisson-distributed number of keys; a key is a false positive when all of its
+    # bits are already set in its block.
+    total, weight = 0.0, math.exp(-keys_per_block)
+    for keys in range(int(keys_per_block + 10 * math.sqrt(keys_per_block) + 20)):
+        filled = 1 - (1 - probes / _BLOCK_BITS) ** keys
+        total += weight * filled**probes
+        weight *= keys_per_block / (keys + 1)
+    return total
+
+
+def _dimensions(capacity: int, error_rate: float) -> tuple[int, int]:
+    blocks = max(1, math.ceil(capacity * -math.log(error_rate) / math.log(2) ** 2 / _BLOCK_BITS))
+    while True:
+        for probes in range(2, _MAX_PROBES + 1):
+            if _false_positive_rate(capacity / blocks, probes) <= error_rate:
+                return blocks, probes
+        blocks = math.ceil(blocks * 1.05)
+
+
+@dataclass(slots=True)
+class DedupStats:
+    checked: int = 0
+    duplicates: int = 0
+    rotations: int = 0
+
+
+class DedupFilter:
+    """Dispatcher stage that drops events whose key was already seen within ``window`` seconds.
+
+    Use with ``dispatcher.add_stage(dedup.observe)``; a false positive drops an event with probability ``error_rate``.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        window: float = 3600.0,
+        *,
+        key: Callable[[Event], str | None] = event_key,
+    ) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Capacity must be positive and the error rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window = window
+        self.key = key
+        self.stats = DedupStats()
+        self.blocks, self.probes = _dimensions(capacity, error_rate)
+        # Two half patterns from small tables combine into 2**24 distinct masks.
+        self._low = _patterns(self.probes // 2)
+        self._high = _patterns(self.probes - self.probes // 2)
+        self._current = array("Q", bytes(8 * self.blocks))
+        self._previous = array("Q", bytes(8 * self.blocks))
+        self._count = 0
+        self._rotated_at = time.monotonic()
+
+    @property
+    def memory(self) -> int:
+        return 2 * 8 * self.blocks
+
+    def _locate(self, key: str) -> tuple[int, int]:
+        # The string hash is salted per process, which is fine for a filter that never leaves it.
+        value = hash(key) & _UINT64
+        mask = self._low[value & 0xFFF] | self._high[(value >> _PATTERN_BITS) & 0xFFF]
+        return (value >> 2 * _PATTERN_BITS) % self.blocks, mask
+
+    def __contains__(self, key: str) -> bool:
+        block, mask = self._locate(key)
+        return self._current[block] & mask == mask or self._previous[block] & mask == mask
+
+    def add(self, key: str) -> bool:
+        # Returns whether the key was (probably) seen before; either way it is remembered from now on.
+        now = time.monotonic()
+        if now - self._rotated_at >= self.window or self._count >= self.capacity:
+            self._rotate(now)
+        block, mask = self._locate(key)
+        word = self._current[block]
+        if word & mask == mask:
+            return True
+        # Keys seen again are copied forward, so they stay known while they keep arriving.
+        self._current[block] = word | mask
+        self._count += 1
+        return self._previous[block] & mask == mask
+
+    def _rotate(self, now: float) -> None:
+        self._previous, self._current = self._current, self._previous
+        self._clear(self._current)
+        self._count = 0
+        self._rotated_at = now
+        self.stats.rotations += 1
+
+    @staticmethod
+    def _clear(words: array[int]) -> None:
+        memoryview(words).cast("B")[:] = bytes(8 * len(words))
+
+    def observe(self, event: Event) -> bool:
+        key = self.key(event)
+        if key is None:
+            return True
+        self.stats.checked += 1
+        if self.add(key):
+            self.stats.duplicates += 1
+            logger.debug(f"Dropping duplicate event {key}")
+            return False
+        return True
+
+    def clear(self) -> None:
+        self._clear(self._current)
+        self._clear(self._previous)
+        self._count = 0
+        self._rotated_at = time.monotonic()
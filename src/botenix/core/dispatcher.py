@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from botenix.core.events.event import EventType
+from botenix.core.router import Router
+from botenix.logger import core_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from botenix.core.events.event import Event
+    from botenix.core.executor import HandlerExecutor
+    from botenix.core.router import HandlerSpec
+
+# Patterns with back-references or conditionals depend on group numbering and are matched one by one.
+_UNCOMBINABLE = re.compile(r"\(\?P=|\(\?\(|\\[1-9]|\\g<")
+_NAMED_GROUP = re.compile(r"\(\?P<[^>]+>")
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+
+def _scoped_pattern(pattern: re.Pattern[str]) -> str | None:
+    flags = pattern.flags & ~re.UNICODE
+    if flags & ~sum(_SCOPED_FLAGS) or _UNCOMBINABLE.search(pattern.pattern):
+        return None
+    inline = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag)
+    source = _NAMED_GROUP.sub("(?:", pattern.pattern)
+    return f"(?{inline}:{source})" if inline else f"(?:{source})"
+
+
+class _Route:
+    __slots__ = ("order", "spec")
+
+    def __init__(self, order: int, spec: HandlerSpec) -> None:
+        self.order = order
+        self.spec = spec
+
+    def search(self, text: str | None) -> re.Match[str] | bool:
+        spec = self.spec
+        if text is None:
+            return not spec.matches_text
+        if spec.prefix is not None and not text.startswith(spec.prefix):
+            return False
+        if spec.pattern is not None:
+            return spec.pattern.search(text) or False
+        return True
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """Handlers of one event type within one ``(channel_id, team_id)`` scope."""
+
+    plain: list[_Route] = field(default_factory=list)
+    commands: dict[str, list[_Route]] = field(default_factory=dict)
+    text_routes: list[_Route] = field(default_factory=list)
+    matcher: re.Pattern[str] | None = None
+    matcher_routes: dict[str, _Route] = field(default_factory=dict)
+    uncombined: list[_Route] = field(default_factory=list)
+
+    def add(self, route: _Route) -> None:
+        if route.spec.commands:
+            for command in route.spec.commands:
+                self.commands.setdefault(command, []).append(route)
+        elif route.spec.matches_text:
+            self.text_routes.append(route)
+        else:
+            self.plain.append(route)
+
+    def compile(self) -> None:
+        alternatives = []
+        for route in self.text_routes:
+            spec = route.spec
+            pattern = _scoped_pattern(spec.pattern) if spec.pattern is not None else ""
+            if pattern is None:
+                self.uncombined.append(route)
+                continue
+            prefix = re.escape(spec.prefix) if spec.prefix is not None else ""
+            # Every alternative is anchored at the start so alternation order equals handler order;
+            # ``.*?`` gives ``search`` semantics for regular expressions.
+            body = f"(?={prefix})(?s:.*?){pattern}" if spec.pattern is not None else prefix
+            name = f"_h{route.order}"
+            alternatives.append(f"(?P<{name}>{body})")
+            self.matcher_routes[name] = route
+        if alternatives:
+            try:
+                self.matcher = re.compile("|".join(alternatives))
+            except re.error:
+                self.uncombined.extend(self.matcher_routes.values())
+                self.uncombined.sort(key=lambda route: route.order)
+                self.matcher_routes.clear()
+
+    def candidates(self, text: str | None, command: str | None) -> list[_Route]:
+        candidates = list(self.plain)
+        if command is not None and (routes := self.commands.get(command)):
+            candidates.extend(routes)
+        if text is not None:
+            if self.matcher is not None and (match := self.matcher.match(text)) is not None:
+                candidates.append(self.matcher_routes[match.lastgroup])  # type: ignore[index]
+            candidates.extend(route for route in self.uncombined if route.search(text))
+        return candidates
+
+    def text_matches_after(self, route: _Route, text: str) -> list[_Route]:
+        return [candidate for candidate in self.text_routes if candidate.order > route.order and candidate.search(text)]
+
+
+class _RouteIndex:
+    def __init__(self, command_prefixes: str) -> None:
+        self.command_prefixes = command_prefixes
+        self.buckets: dict[str, dict[tuple[str | None, str | None], _Bucket]] = {}
+        self.size = 0
+
+    def add(self, spec: HandlerSpec) -> None:
+        scopes = self.buckets.setdefault(spec.event_type, {})
+        bucket = scopes.get((spec.channel_id, spec.team_id))
+        if bucket is None:
+            bucket = scopes[spec.channel_id, spec.team_id] = _Bucket()
+        bucket.add(_Route(self.size, spec))
+        self.size += 1
+
+    def compile(self) -> None:
+        for scopes in self.buckets.values():
+            for bucket in scopes.values():
+                bucket.compile()
+
+    def lookup(self, event: Event) -> list[tuple[_Route, _Bucket]]:
+        scopes = self.buckets.get(event.type)
+        if not scopes:
+            return []
+        channel_id, team_id = event.channel_id, event.team_id
+        keys = {(None, None), (channel_id, None), (None, team_id), (channel_id, team_id)}
+        text = event.text
+        prefixes = "/" if event.type == EventType.slash_command else self.command_prefixes
+        command = _extract_command(text, prefixes)
+        return [
+            (route, bucket)
+            for key in keys
+            if (bucket := scopes.get(key)) is not None
+            for route in bucket.candidates(text, command)
+        ]
+
+
+def _extract_command(text: str | None, prefixes: str) -> str | None:
+    if not text or text[0] not in prefixes:
+        return None
+    token = text[1:].split(maxsplit=1)
+    return token[0].lower() if token else None
+
+
+class Dispatcher(Router):
+    """Root router that compiles every nested router into a single index before dispatching.
+
+    Stages run before routing and may drop an event; done callbacks get ``(event, processed)``.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        *,
+        command_prefixes: str = "!/",
+        executor: HandlerExecutor | None = None,
+    ) -> None:
+        super().__init__(name)
+        self.command_prefixes = command_prefixes
+        self.executor = executor
+        self.context: dict[str, Any] = {}
+        self.stages: list[Callable[[Event], bool]] = []
+        self.done_callbacks: list[Callable[[Event, bool], None]] = []
+        self._index: _RouteIndex | None = None
+
+    def add_stage(self, stage: Callable[[Event], bool]) -> Callable[[Event], bool]:
+        self.stages.append(stage)
+        return stage
+
+    def add_done_callback(self, callback: Callable[[Event, bool], None]) -> Callable[[Event, bool], None]:
+        self.done_callbacks.append(callback)
+        return callback
+
+    def _done(self, event: Event, processed: bool) -> None:
+        for callback in self.done_callbacks:
+            callback(event, processed)
+
+    def _changed(self) -> None:
+        self._index = None
+        super()._changed()
+
+    def build(self) -> None:
+        index = _RouteIndex(self.command_prefixes)
+        for router in self.walk():
+            for spec in router.handlers:
+                index.add(spec)
+        index.compile()
+        self._index = index
+        logger.debug(f"Dispatcher index built with {index.size} handlers")
+
+    def resolve(self, event: Event) -> tuple[HandlerSpec, re.Match[str] | None] | None:
+        if self._index is None:
+            self.build()
+        candidates = self._index.lookup(event)  # type: ignore[union-attr]
+        if not candidates:
+            return None
+        candidates.sort(key=lambda candidate: candidate[0].order)
+        text = event.text
+        position = 0
+        while position < len(candidates):
+            route, bucket = candidates[position]
+            position += 1
+            spec = route.spec
+            match = route.search(text)
+            if match and all(event_filter(event) for event_filter in spec.filters):
+                return spec, match if isinstance(match, re.Match) else None
+            if text is not None and spec.matches_text and not spec.commands:
+                # The combined matcher only reports the first alternative; fall back to the next ones.
+                later = [(candidate, bucket) for candidate in bucket.text_matches_after(route, text)]
+                known = {id(candidate) for candidate, _ in candidates}
+                candidates[position:] = sorted(
+                    candidates[position:] + [item for item in later if id(item[0]) not in known],
+                    key=lambda candidate: candidate[0].order,
+                )
+        return None
+
+    async def feed_event(self, event: Event) -> bool:
+        for stage in self.stages:
+            if not stage(event):
+                self._done(event, False)
+                return False
+        resolved = self.resolve(event)
+        if resolved is None:
+            self._done(event, True)
+            return False
+        spec, match = resolved
+        if self.executor is None:
+            await self._handle(spec, event, match)
+        else:
+            await self.executor.submit(event, partial(self._handle, spec, event, match))
+        return True
+
+    async def _handle(self, spec: HandlerSpec, event: Event, match: re.Match[str] | None) -> None:
+        await self.call_handler(spec, event, match)
+        # Not reached when cancelled, e.g. by closing the executor without draining.
+        self._done(event, True)
+
+    async def close(self) -> None:
+        if self.executor is not None:
+            await self.executor.close()
+
+    async def call_handler(self, spec: HandlerSpec, event: Event, match: re.Match[str] | None = None) -> None:
+        available = {**self.context, "match": match}
+        if spec.parameters is None:
+            kwargs = available
+        else:
+            kwargs = {name: value for name, value in available.items() if name in spec.parameters}
+        try:
+            await spec.callback(event, **kwargs)
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Handler {spec.callback.__qualname__} failed on {event!r}")
+            if self.executor is not None:
+                self.executor.failed += 1
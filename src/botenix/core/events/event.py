@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, cast
+
+import orjson
+
+
+if TYPE_CHECKING:
+    from botenix.integration.clients.models.posts import LazyPost
+
+
+class EventType(StrEnum):
+    hello = "hello"
+    posted = "posted"
+    post_edited = "post_edited"
+    post_deleted = "post_deleted"
+    reaction_added = "reaction_added"
+    reaction_removed = "reaction_removed"
+    typing = "typing"
+    status_change = "status_change"
+    user_added = "user_added"
+    user_removed = "user_removed"
+    user_updated = "user_updated"
+    channel_created = "channel_created"
+    channel_updated = "channel_updated"
+    channel_deleted = "channel_deleted"
+    direct_added = "direct_added"
+    group_added = "group_added"
+    added_to_team = "added_to_team"
+    leave_team = "leave_team"
+    update_team = "update_team"
+    delete_team = "delete_team"
+    # Delivered over HTTP by ``botenix.interface.webhook`` rather than the WebSocket.
+    outgoing_webhook = "outgoing_webhook"
+    slash_command = "slash_command"
+    post_action = "post_action"
+    dialog_submission = "dialog_submission"
+
+
+class Event:
+    """A Mattermost event as received from the WebSocket, decoded with orjson.
+
+    ``data`` is kept as sent by the server; nested JSON strings (such as ``data["post"]``) are only
+    decoded when the matching property is first accessed. ``received_at`` is the ``time.monotonic()``
+    of its arrival, from which queueing delay is measured.
+    """
+
+    __slots__ = ("_post", "_post_model", "broadcast", "data", "received_at", "seq", "type")
+
+    def __init__(
+        self,
+        type: str,  # noqa: A002
+        data: dict[str, Any] | None = None,
+        broadcast: dict[str, Any] | None = None,
+        seq: int | None = None,
+        received_at: float | None = None,
+    ) -> None:
+        self.type = type
+        self.data = data if data is not None else {}
+        self.broadcast = broadcast if broadcast is not None else {}
+        self.seq = seq
+        self.received_at = time.monotonic() if received_at is None else received_at
+        self._post: dict[str, Any] | None = None
+        self._post_model: LazyPost | None = None
+
+    @classmethod
+    def from_json(cls, raw: bytes | str, received_at: float | None = None) -> Event | None:
+        message = orjson.loads(raw)
+        if not isinstance(message, dict) or "event" not in message:
+            # Replies to client actions (``seq_reply``) carry no event.
+            return None
+        return cls(message["event"], message.get("data"), message.get("broadcast"), message.get("seq"), received_at)
+
+    def to_json(self) -> bytes:
+        return orjson.dumps({"event": self.type, "data": self.data, "broadcast": self.broadcast, "seq": self.seq})
+
+    def _lookup(self, key: str) -> str | None:
+        return cast(str | None, self.broadcast.get(key) or self.data.get(key) or None)
+
+    @property
+    def channel_id(self) -> str | None:
+        channel_id = self._lookup("channel_id")
+        if channel_id is None and (post := self.post) is not None:
+            channel_id = cast(str | None, post.get("channel_id"))
+        return channel_id
+
+    @property
+    def team_id(self) -> str | None:
+        return self._lookup("team_id")
+
+    @property
+    def user_id(self) -> str | None:
+        return self._lookup("user_id")
+
+    @property
+    def post(self) -> dict[str, Any] | None:
+        if self._post is None:
+            post = self.data.get("post")
+            if isinstance(post, str | bytes):
+                post = orjson.loads(post)
+            self._post = post if isinstance(post, dict) else None
+        return self._post
+
+    @property
+    def post_model(self) -> LazyPost | None:
+        # Posts pushed by the server are trusted: no validation until ``metadata`` is accessed.
+        if self._post_model is None and (post := self.post) is not None:
+            # Imported here: routing events does not need the post models.
+            from botenix.integration.clients.models.posts import LazyPost  # noqa: PLC0415
+
+            self._post_model = LazyPost.from_dict(post, trusted=True)
+        return self._post_model
+
+    @property
+    def root_id(self) -> str | None:
+        # Thread of the post: its ``root_id`` for replies, its own ``id`` for the root post.
+        if (post := self.post) is None:
+            return None
+        return cast(str | None, post.get("root_id") or post.get("id") or None)
+
+    @property
+    def text(self) -> str | None:
+        if (post := self.post) is not None:
+            return cast(str | None, post.get("message"))
+        text = cast(str | None, self.data.get("text"))
+        if command := self.data.get("command"):
+            # Slash commands carry the trigger separately from its arguments.
+            return f"{command} {text}" if text else cast(str, command)
+        return text
+
+    def __repr__(self) -> str:
+        return f"Event(type={self.type!r}, seq={self.seq!r}, channel_id={self.channel_id!r})"
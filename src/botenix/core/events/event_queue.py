@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import struct
+import tempfile
+from collections import deque
+from enum import StrEnum
+from typing import IO
+
+from botenix.core.events.event import Event
+from botenix.exceptions import QueueClosedError
+from botenix.logger import core_logger as logger
+
+
+# Payload length and arrival time, so a spilled event keeps its queueing delay.
+_HEADER = struct.Struct("<Id")
+
+
+class OverflowPolicy(StrEnum):
+    block = "block"
+    drop_oldest = "drop_oldest"
+    spill = "spill"
+
+
+class _SpillFile:
+    """FIFO of serialized events in an anonymous temporary file."""
+
+    def __init__(self) -> None:
+        self._file: IO[bytes] = tempfile.TemporaryFile()  # noqa: SIM115
+        self._read_at = self._write_at = 0
+        self.count = 0
+
+    def push(self, event: Event) -> None:
+        payload = event.to_json()
+        self._file.seek(self._write_at)
+        self._file.write(_HEADER.pack(len(payload), event.received_at))
+        self._file.write(payload)
+        self._write_at = self._file.tell()
+        self.count += 1
+
+    def pop(self) -> Event:
+        self._file.seek(self._read_at)
+        length, received_at = _HEADER.unpack(self._file.read(_HEADER.size))
+        event = Event.from_json(self._file.read(length), received_at)
+        self._read_at = self._file.tell()
+        self.count -= 1
+        if not self.count:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_at = self._write_at = 0
+        return event  # type: ignore[return-value]
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class EventQueue:
+    """Bounded FIFO of events between the transport and the dispatcher.
+
+    When ``maxsize`` events are buffered, ``overflow`` decides what happens to the next one:
+    ``block`` suspends the producer (and thus the socket reader), ``drop_oldest`` discards the
+    oldest buffered event, and ``spill`` appends it to a temporary file that is drained, in order,
+    before newer events are delivered.
+    """
+
+    def __init__(self, maxsize: int = 1000, overflow: OverflowPolicy = OverflowPolicy.block) -> None:
+        if maxsize < 1:
+            raise ValueError("Queue size must be positive")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self._items: deque[Event] = deque()
+        self._spill: _SpillFile | None = None
+        self._changed = asyncio.Condition()
+        self._closed = False
+
+    def qsize(self) -> int:
+        return len(self._items) + (self._spill.count if self._spill else 0)
+
+    @property
+    def spilled(self) -> int:
+        return self._spill.count if self._spill else 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, event: Event) -> None:
+        async with self._changed:
+            if self._closed:
+                raise QueueClosedError("Event queue is closed")
+            if self.spilled or (len(self._items) >= self.maxsize and self.overflow is OverflowPolicy.spill):
+                # Once anything is spilled, newer events follow it to keep the order.
+                if self._spill is None:
+                    self._spill = _SpillFile()
+                self._spill.push(event)
+            else:
+                if len(self._items) >= self.maxsize:
+                    if self.overflow is OverflowPolicy.block:
+                        await self._changed.wait_for(lambda: len(self._items) < self.maxsize or self._closed)
+                        if self._closed:
+                            raise QueueClosedError("Event queue is closed")
+                    else:
+                        self._items.popleft()
+                        self.dropped += 1
+                        if self.dropped & (self.dropped - 1) == 0:
+                            logger.warning(f"Event queue is full, {self.dropped} events dropped so far")
+                self._items.append(event)
+            self._changed.notify_all()
+
+    async def get(self) -> Event:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._items or self.spilled or self._closed)
+            if self._items:
+                event = self._items.popleft()
+            elif self._spill and self._spill.count:
+                event = self._spill.pop()
+            else:
+                raise QueueClosedError("Event queue is closed")
+            while self._spill and self._spill.count and len(self._items) < self.maxsize:
+                self._items.append(self._spill.pop())
+            self._changed.notify_all()
+            return event
+
+    async def close(self) -> None:
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def __del__(self) -> None:
+        # ``__init__`` may have raised before the spill attribute was set.
+        spill: _SpillFile | None = getattr(self, "_spill", None)
+        if spill is not None:
+            spill.close()
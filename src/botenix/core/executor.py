@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from botenix.exceptions import QueueClosedError
+from botenix.logger import core_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from botenix.core.events.event import Event
+
+    Job = Callable[[], Awaitable[object]]
+
+
+class Ordering(StrEnum):
+    channel = "channel"
+    thread = "thread"
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutorStats:
+    queue_depths: tuple[int, ...]
+    running: int
+    processed: int
+    failed: int
+    latency_p50: float
+    latency_p99: float
+    latency_max: float
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self.queue_depths)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class _Shard:
+    """Accounting and backpressure for the keys hashed onto it: ``queued`` jobs wait to start."""
+
+    __slots__ = ("queued", "space")
+
+    def __init__(self, maxsize: int) -> None:
+        self.queued = 0
+        self.space = asyncio.Semaphore(maxsize)
+
+
+class HandlerExecutor:
+    """Runs handler jobs concurrently while keeping the order of jobs with the same key.
+
+    The key of an event is its channel (or thread, see :class:`Ordering`). Jobs of one key run one
+    after another in arrival order; jobs of different keys run concurrently, up to
+    ``max_concurrency`` at once, so a slow handler only holds up its own channel. Keys are hashed
+    onto ``shards`` queues of at most ``shard_queue_size`` jobs waiting to start; ``submit`` waits
+    while its queue is full, which pushes back on the event source instead of buffering without bound.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        *,
+        max_concurrency: int = 64,
+        shard_queue_size: int = 1000,
+        ordering: Ordering = Ordering.channel,
+        latency_window: int = 1024,
+    ) -> None:
+        if shards < 1 or max_concurrency < 1 or shard_queue_size < 1:
+            raise ValueError("Shard count, concurrency and queue size must be positive")
+        self.ordering = ordering
+        self.running = 0
+        self.processed = 0
+        # Also counted by ``Dispatcher.call_handler``, which catches handler errors itself.
+        self.failed = 0
+        self._shards = [_Shard(shard_queue_size) for _ in range(shards)]
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        # Jobs waiting per key, and the task running them while any are left.
+        self._chains: dict[str, deque[Job]] = {}
+        self._runners: dict[str, asyncio.Task[None]] = {}
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def shard_key(self, event: Event) -> str:
+        if self.ordering is Ordering.thread and (root_id := event.root_id) is not None:
+            return root_id
+        return event.channel_id or event.user_id or event.type
+
+    def shard_for(self, key: str) -> int:
+        # crc32 rather than ``hash``: stable across processes and interpreter runs.
+        return zlib.crc32(key.encode()) % len(self._shards)
+
+    async def submit(self, event: Event, job: Job) -> None:
+        if self._closed:
+            raise QueueClosedError("Handler executor is closed")
+        key = self.shard_key(event)
+        shard = self._shards[self.shard_for(key)]
+        await shard.space.acquire()
+        shard.queued += 1
+        chain = self._chains.get(key)
+        if chain is None:
+            chain = self._chains[key] = deque()
+            self._runners[key] = asyncio.create_task(self._run(key, shard, chain))
+        chain.append(job)
+
+    async def _run(self, key: str, shard: _Shard, chain: deque[Job]) -> None:
+        try:
+            while chain:
+                async with self._concurrency:
+                    job = chain.popleft()
+                    shard.queued -= 1
+                    shard.space.release()
+                    self.running += 1
+                    started_at = time.perf_counter()
+                    try:
+                        await job()
+                    except Exception:  # noqa: BLE001
+                        self.failed += 1
+                        logger.exception("Handler job failed")
+                    finally:
+                        self._latencies.append(time.perf_counter() - started_at)
+                        self.processed += 1
+                        self.running -= 1
+        finally:
+            # No await since the loop condition was checked: a job submitted now starts a new runner.
+            del self._chains[key], self._runners[key]
+
+    def queue_depth(self) -> int:
+        return sum(shard.queued for shard in self._shards)
+
+    def stats(self) -> ExecutorStats:
+        latencies = sorted(self._latencies)
+        return ExecutorStats(
+            queue_depths=tuple(shard.queued for shard in self._shards),
+            running=self.running,
+            processed=self.processed,
+            failed=self.failed,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p99=_percentile(latencies, 0.99),
+            latency_max=latencies[-1] if latencies else 0.0,
+        )
+
+    async def join(self) -> None:
+        while self._runners:
+            await asyncio.gather(*self._runners.values(), return_exceptions=True)
+
+    async def close(self, *, drain: bool = True) -> None:
+        self._closed = True
+        if not drain:
+            for runner in self._runners.values():
+                runner.cancel()
+        await self.join()
+        logger.debug(f"Handler executor closed after {self.processed} jobs")
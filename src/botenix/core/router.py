@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import inspect
+import re
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from botenix.core.events.event import Event, EventType
+
+
+HandlerCallback = Callable[..., Awaitable[Any]]
+EventFilter = Callable[[Event], bool]
+
+THandler = TypeVar("THandler", bound=HandlerCallback)
+
+
+def _injected_parameters(callback: HandlerCallback) -> frozenset[str] | None:
+    # Keyword arguments the callback accepts besides the event; ``None`` means any (``**kwargs``).
+    parameters = list(inspect.signature(callback).parameters.values())[1:]
+    if any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return frozenset(
+        parameter.name
+        for parameter in parameters
+        if parameter.kind in {inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY}
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class HandlerSpec:
+    callback: HandlerCallback
+    event_type: str
+    channel_id: str | None = None
+    team_id: str | None = None
+    commands: tuple[str, ...] = ()
+    pattern: re.Pattern[str] | None = None
+    prefix: str | None = None
+    filters: tuple[EventFilter, ...] = ()
+    parameters: frozenset[str] | None = frozenset()
+
+    @property
+    def matches_text(self) -> bool:
+        return self.pattern is not None or self.prefix is not None
+
+
+class Router:
+    """Collects event handlers; routers can be nested with :meth:`include_router`.
+
+    Handlers are tried in registration order, depth first through included routers, and the first
+    one whose conditions all match handles the event.
+    """
+
+    def __init__(self, name: str | None = None) -> None:
+        self.name = name or hex(id(self))
+        self.handlers: list[HandlerSpec] = []
+        self.sub_routers: list[Router] = []
+        self.parent: Router | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+    def include_router(self, router: Router) -> Router:
+        if router.parent is not None:
+            raise ValueError(f"{router!r} is already included into {router.parent!r}")
+        parent: Router | None = self
+        while parent is not None:
+            if parent is router:
+                raise ValueError(f"Including {router!r} into {self!r} creates a cycle")
+            parent = parent.parent
+        router.parent = self
+        self.sub_routers.append(router)
+        self._changed()
+        return router
+
+    def _changed(self) -> None:
+        # Handlers were added below this router; the root dispatcher rebuilds its index on the next event.
+        if self.parent is not None:
+            self.parent._changed()  # noqa: SLF001
+
+    def walk(self) -> Iterator[Router]:
+        yield self
+        for router in self.sub_routers:
+            yield from router.walk()
+
+    def register(  # noqa: PLR0913
+        self,
+        callback: HandlerCallback,
+        event_type: str,
+        *filters: EventFilter,
+        channel_id: str | None = None,
+        team_id: str | None = None,
+        command: str | Sequence[str] | None = None,
+        regexp: str | re.Pattern[str] | None = None,
+        prefix: str | None = None,
+    ) -> HandlerSpec:
+        commands = (command,) if isinstance(command, str) else tuple(command or ())
+        spec = HandlerSpec(
+            callback=callback,
+            event_type=event_type,
+            channel_id=channel_id,
+            team_id=team_id,
+            commands=tuple(command.lower() for command in commands),
+            pattern=re.compile(regexp) if isinstance(regexp, str) else regexp,
+            prefix=prefix,
+            filters=filters,
+            parameters=_injected_parameters(callback),
+        )
+        self.handlers.append(spec)
+        self._changed()
+        return spec
+
+    def event(
+        self,
+        event_type: str,
+        *filters: EventFilter,
+        channel_id: str | None = None,
+        team_id: str | None = None,
+    ) -> Callable[[THandler], THandler]:
+        def decorator(callback: THandler) -> THandler:
+            self.register(callback, event_type, *filters, channel_id=channel_id, team_id=team_id)
+            return callback
+
+        return decorator
+
+    def message(
+        self,
+        *filters: EventFilter,
+        command: str | Sequence[str] | None = None,
+        regexp: str | re.Pattern[str] | None = None,
+        prefix: str | None = None,
+        channel_id: str | None = None,
+        team_id: str | None = None,
+    ) -> Callable[[THandler], THandler]:
+        def decorator(callback: THandler) -> THandler:
+            self.register(
+                callback,
+                EventType.posted,
+                *filters,
+                channel_id=channel_id,
+                team_id=team_id,
+                command=command,
+                regexp=regexp,
+                prefix=prefix,
+            )
+            return callback
+
+        return decorator
+
+    def slash_command(
+        self,
+        command: str | Sequence[str],
+        *filters: EventFilter,
+        channel_id: str | None = None,
+        team_id: str | None = None,
+    ) -> Callable[[THandler], THandler]:
+        def decorator(callback: THandler) -> THandler:
+            self.register(
+                callback, EventType.slash_command, *filters, channel_id=channel_id, team_id=team_id, command=command
+            )
+            return callback
+
+        return decorator
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import multiprocessing
+import os
+import signal
+import socket
+import struct
+import time
+from typing import TYPE_CHECKING
+
+from botenix.core.events.event import Event
+from botenix.logger import core_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+    from multiprocessing.process import BaseProcess
+
+    from botenix.core.bot import Bot
+
+# Payload length and arrival time: ``time.monotonic`` is system-wide, so workers measure queueing
+# delay from the moment the ingest process received the event.
+_FRAME = struct.Struct(">Id")
+_JUMP_MULTIPLIER = 2862933555777941757
+_UINT64 = (1 << 64) - 1
+
+
+def jump_hash(key: str, buckets: int) -> int:
+    # Jump consistent hash (Lamping & Veach): going from n to n + 1 buckets only moves 1/(n + 1)
+    # of the keys, all of them to the new bucket. blake2b keeps it stable across processes.
+    if buckets < 1:
+        raise ValueError("At least one bucket is required")
+    value = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest())
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        value = (value * _JUMP_MULTIPLIER + 1) & _UINT64
+        candidate = int((bucket + 1) * ((1 << 31) / ((value >> 33) + 1)))
+    return bucket
+
+
+class _Slot:
+    __slots__ = ("failures", "index", "process", "ready", "sock", "started_at", "writer")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: BaseProcess | None = None
+        self.sock: socket.socket | None = None
+        self.writer: asyncio.StreamWriter | None = None
+        self.ready = asyncio.Event()
+        self.started_at = 0.0
+        self.failures = 0
+
+
+class ShardedRuntime:
+    """Runs a bot on ``workers`` forked processes fed by a single ingest process.
+
+    Each channel is handled by one worker, in arrival order; dead workers are restarted.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        workers: int | None = None,
+        *,
+        drain_timeout: float = 30.0,
+        restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+    ) -> None:
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+        self.bot = bot
+        self.workers = workers
+        self.drain_timeout = drain_timeout
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.routed = [0] * workers
+        self.restarts = 0
+        self._slots = [_Slot(index) for index in range(workers)]
+        self._context = multiprocessing.get_context("fork")
+        self._restarting: set[asyncio.Task[None]] = set()
+        self._stopping = False
+
+    @staticmethod
+    def route_key(event: Event) -> str:
+        return event.channel_id or event.user_id or event.type
+
+    def worker_for(self, event: Event) -> int:
+        return jump_hash(self.route_key(event), self.workers)
+
+    def pids(self) -> list[int | None]:
+        return [slot.process.pid if slot.process is not None else None for slot in self._slots]
+
+    async def start(self) -> None:
+        if (rate_limiter := self.bot.http_client.rate_limiter) is not None:
+            rate_limiter.share()
+        for slot in self._slots:
+            await self._spawn(slot)
+
+    async def _spawn(self, slot: _Slot) -> None:
+        parent_sock, child_sock = socket.socketpair()
+        slot.sock = parent_sock
+        process = self._context.Process(
+            target=self._worker_main, args=(slot.index, child_sock), name=f"botenix-worker-{slot.index}"
+        )
+        process.start()
+        child_sock.close()
+        _, slot.writer = await asyncio.open_connection(sock=parent_sock)
+        slot.process = process
+        slot.started_at = time.monotonic()
+        asyncio.get_running_loop().add_reader(process.sentinel, self._on_exit, slot)
+        slot.ready.set()
+        logger.info(f"Runtime worker {slot.index} started with pid {process.pid}")
+
+    def _on_exit(self, slot: _Slot) -> None:
+        process = slot.process
+        if process is None:
+            return
+        asyncio.get_running_loop().remove_reader(process.sentinel)
+        process.join()
+        if self._stopping:
+            return
+        slot.ready.clear()
+        if slot.writer is not None:
+            slot.writer.close()
+        # Workers that crash right after starting back off; one that ran for a while restarts at once.
+        slot.failures = slot.failures + 1 if time.monotonic() - slot.started_at < self.max_restart_delay else 1
+        delay = min(self.restart_delay * 2 ** (slot.failures - 1), self.max_restart_delay)
+        logger.error(f"Runtime worker {slot.index} exited with code {process.exitcode}, restarting in {delay:.1f}s")
+        task = asyncio.create_task(self._restart(slot, delay))
+        self._restarting.add(task)
+        task.add_done_callback(self._restarting.discard)
+
+    async def _restart(self, slot: _Slot, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if not self._stopping:
+            await self._spawn(slot)
+            self.restarts += 1
+
+    async def feed_event(self, event: Event) -> bool:
+        index = self.worker_for(event)
+        slot = self._slots[index]
+        data = event.to_json()
+        while True:
+            await slot.ready.wait()
+            writer = slot.writer
+            if writer is None or writer.is_closing():
+                slot.ready.clear()
+                continue
+            writer.writelines((_FRAME.pack(len(data), event.received_at), data))
+            try:
+                await writer.drain()
+            except ConnectionError:
+                # The worker is gone; the event goes to its replacement.
+                slot.ready.clear()
+                continue
+            self.routed[index] += 1
+            return True
+
+    async def serve(self, events: AsyncIterable[Event]) -> None:
+        async for event in events:
+            await self.feed_event(event)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in list(self._restarting):
+            task.cancel()
+        loop = asyncio.get_running_loop()
+        processes = []
+        for slot in self._slots:
+            if slot.process is not None:
+                loop.remove_reader(slot.process.sentinel)
+                processes.append(slot.process)
+            if slot.writer is not None:
+                # End of stream: the worker handles what it has received, then exits.
+                slot.writer.close()
+        await asyncio.gather(*(asyncio.to_thread(process.join, self.drain_timeout) for process in processes))
+        for process in processes:
+            if process.is_alive():
+                logger.warning(f"Runtime worker {process.name} did not drain in time, terminating")
+                process.terminate()
+                await asyncio.to_thread(process.join)
+
+    def run(self) -> None:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        # Workers are forked before the WebSocket is opened, so they do not inherit the connection.
+        await self.start()
+        ingest = asyncio.create_task(self._ingest())
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, ingest.cancel)
+        try:
+            with contextlib.suppress(asyncio.CancelledError):
+                await ingest
+        finally:
+            await self.stop()
+            logger.info("Runtime stopped")
+
+    async def _ingest(self) -> None:
+        async with self.bot.create_websocket_client() as websocket:
+            logger.info(f"Runtime started with {self.workers} workers")
+            await self.serve(websocket)
+
+    def _worker_main(self, index: int, sock: socket.socket) -> None:
+        # Forked from the ingest process: drop its signal wiring (the parent stops the workers by
+        # closing their channels) and the parent ends of every channel, so each sees the EOF.
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for slot in self._slots:
+            if slot.sock is not None:
+                slot.sock.close()
+        asyncio.run(self._consume(index, sock))
+
+    async def _consume(self, index: int, sock: socket.socket) -> None:
+        reader, writer = await asyncio.open_connection(sock=sock)
+        dispatcher = self.bot.dispatcher
+        dispatcher.build()
+        try:
+            while True:
+                try:
+                    length, received_at = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+                    payload = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    break
+                event = Event.from_json(payload, received_at)
+                if event is not None:
+                    await dispatcher.feed_event(event)
+        finally:
+            logger.info(f"Runtime worker {index} draining")
+            writer.close()
+            await self.bot.close()
@@ -1,2 +1,15 @@
 class BearerTokenMissingError(ValueError):
     """Exception raised when a mandatory Bearer token is missing."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Exception raised when requests to a host are short-circuited after repeated failures."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit for {host} is open, retry in {retry_in:.2f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class QueueClosedError(RuntimeError):
+    """Exception raised when putting to, or getting from an exhausted, closed event queue."""
@@ -1,4 +1,4 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterable, Mapping, Sequence
 from typing import IO, Any, Literal
 
 
@@ -23,6 +23,8 @@ FileTypes = (
     | tuple[str | None, FileContent, str | None, Mapping[str, str]]
 )
 RequestFiles = Mapping[str, FileTypes] | Sequence[tuple[str, FileTypes]]
+RequestContent = bytes | AsyncIterable[bytes]
+RequestHeaders = Mapping[str, str]
 
 Method = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
 IncEx = set[int] | set[str] | Mapping[int, Any] | Mapping[str, Any]
@@ -1,6 +1,16 @@
+from collections.abc import AsyncGenerator
+from typing import TypeVar
+
+from botenix.integration.utils.bulk import BulkOperations, BulkResult
 from botenix.integration.utils.http_client import HttpClient
 
 
+T = TypeVar("T")
+
+
 class BaseApiClient:
     def __init__(self, http_client: HttpClient) -> None:
         self.http_client = http_client
+
+    def bulk(self, operations: BulkOperations[T], *, concurrency: int | None = None) -> AsyncGenerator[BulkResult[T]]:
+        return self.http_client.bulk(operations, concurrency=concurrency)
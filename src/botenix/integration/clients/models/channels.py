@@ -0,0 +1,28 @@
+from enum import StrEnum
+
+from pydantic import Field
+
+from botenix.integration.clients.models.common import ApiModel
+
+
+class ChannelType(StrEnum):
+    open = "O"
+    private = "P"
+    direct = "D"
+    group = "G"
+
+
+class Channel(ApiModel):
+    id: str = Field(..., description="Unique ID of the channel")
+    team_id: str = Field("", description="ID of the team, empty for direct and group messages")
+    type: ChannelType = Field(..., description="Type of the channel")
+    name: str = Field(..., description="Unique name of the channel within its team")
+    display_name: str = Field("", description="Human readable name of the channel")
+    header: str = Field("", description="Header of the channel")
+    purpose: str = Field("", description="Purpose of the channel")
+    creator_id: str = Field("", description="ID of the user who created the channel")
+    last_post_at: int = Field(0, description="Timestamp of the last post in the channel")
+    total_msg_count: int = Field(0, description="Number of posts in the channel")
+    create_at: int = Field(0, description="Timestamp of channel creation")
+    update_at: int = Field(0, description="Timestamp of last update")
+    delete_at: int = Field(0, description="Timestamp of archival, 0 for active channels")
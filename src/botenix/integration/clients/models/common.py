@@ -1,8 +1,37 @@
-from pydantic import BaseModel, Field
+import importlib
+import os
 
+from pydantic import BaseModel, ConfigDict, Field
 
-class TimestampMixin(BaseModel):
+
+# Validators are built on first use, so importing the models stays cheap for short-lived processes.
+# ``BOTENIX_DEFER_SCHEMAS=0`` builds them at import instead; ``build_schemas`` builds them all at once.
+DEFER_SCHEMAS = os.environ.get("BOTENIX_DEFER_SCHEMAS", "1") != "0"
+
+_MODEL_MODULES = ("channels", "embed", "emoji", "file_info", "posts", "reaction", "teams", "users")
+
+
+class ApiModel(BaseModel):
+    model_config = ConfigDict(defer_build=DEFER_SCHEMAS)
+
+
+class TimestampMixin(ApiModel):
     create_at: int = Field(..., description="Timestamp in milliseconds when the entity was created")
     update_at: int = Field(..., description="Timestamp in milliseconds when the entity was last updated")
     delete_at: int = Field(..., description="Timestamp in milliseconds when the entity was deleted")
     edit_at: int = Field(..., description="Timestamp in milliseconds when the entity was last edited")
+
+
+def build_schemas() -> int:
+    # Imports every model module and builds the validators still deferred; returns how many were built.
+    for module in _MODEL_MODULES:
+        importlib.import_module(f"botenix.integration.clients.models.{module}")
+    built = 0
+    pending: list[type[ApiModel]] = [ApiModel]
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        if not model.__pydantic_complete__:
+            model.model_rebuild(force=True)
+            built += 1
+    return built
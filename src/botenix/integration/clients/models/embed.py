@@ -1,7 +1,9 @@
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from botenix.integration.clients.models.common import ApiModel
 
 
 class PostEmbedType(StrEnum):
@@ -13,7 +15,7 @@ class PostEmbedType(StrEnum):
     boards = "boards"
 
 
-class PostEmbed(BaseModel):
+class PostEmbed(ApiModel):
     type: PostEmbedType = Field(..., description="Type of embedded content")
     url: str | None = Field(None, description="URL of the embedded content")
     data: Any | None = Field(None, description="Additional data for the embedded content")
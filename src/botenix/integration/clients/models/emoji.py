@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from botenix.integration.clients.models.common import ApiModel
 
-class Emoji(BaseModel):
+
+class Emoji(ApiModel):
     id: str = Field(..., description="Unique ID of the emoji")
     user_id: str | None = Field(None, description="ID of the user who created the emoji")
     name: str | None = Field(None, description="Name of the emoji")
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from botenix.integration.clients.models.common import ApiModel
 
-class FileInfo(BaseModel):
+
+class FileInfo(ApiModel):
     id: str = Field(..., description="Unique ID of the file")
     user_id: str = Field(..., description="ID of the user who created the file")
     post_id: str | None = Field(None, description="ID of the post associated with the file")
@@ -1,34 +1,41 @@
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Generic, Required, Self, TypedDict, TypeVar
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import Field, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
-from botenix.integration.clients.models.common import TimestampMixin
+from botenix.integration.clients.models.common import ApiModel, TimestampMixin
 from botenix.integration.clients.models.embed import PostEmbed
 from botenix.integration.clients.models.emoji import Emoji
 from botenix.integration.clients.models.file_info import FileInfo
 from botenix.integration.clients.models.reaction import Reaction
+from botenix.integration.utils.type_adapters import type_adapters
 
 
-class Priority(BaseModel):
+TPost = TypeVar("TPost", bound="BasePost | LazyPost")
+
+
+class Priority(ApiModel):
     priority: str | None = Field(None, description="The priority label for the post, e.g., 'important' or 'urgent'")
     requested_ack: bool | None = Field(None, description="Whether acknowledgements were requested for the post")
     persistent_notifications: bool | None = Field(None, description="If notifications are persistent")
 
 
-class PostImage(BaseModel):
+class PostImage(ApiModel):
     width: int = Field(..., description="Width of the image in pixels")
     height: int = Field(..., description="Height of the image in pixels")
     format: str = Field(..., description="Format of the image, e.g., 'png', 'jpeg'")
     frame_count: int = Field(0, description="Number of frames in the image if animated")
 
 
-class PostAcknowledgement(BaseModel):
+class PostAcknowledgement(ApiModel):
     user_id: str = Field(..., description="ID of the user who acknowledged the post")
     post_id: str = Field(..., description="ID of the post that was acknowledged")
     acknowledged_at: int = Field(..., description="Timestamp in milliseconds when the post was acknowledged")
 
 
-class PostMetadata(BaseModel):
+class PostMetadata(ApiModel):
     embeds: list[PostEmbed] = Field(default_factory=list, description="List of embeds attached to the post")
     emojis: list[Emoji] = Field(default_factory=list, description="List of emojis used in or reacting to the post")
     files: list[FileInfo] = Field(default_factory=list, description="List of files attached to the post")
@@ -40,7 +47,7 @@ class PostMetadata(BaseModel):
     )
 
 
-class BasePost(BaseModel):
+class BasePost(ApiModel):
     channel_id: str = Field(..., description="The channel ID where the post will be created")
     message: str = Field(..., description="The content of the post, supporting Markdown formatting")
     root_id: str | None = Field(None, description="The root post ID if this post is a reply in a thread")
@@ -60,3 +67,140 @@ class PostResponse(BasePost, TimestampMixin):
     type: str = Field("", description="Type of the post, defining special system messages or custom types")
     pending_post_id: str | None = Field(None, description="Temporary ID for pending posts")
     hashtags: str | None = Field(None, description="Any hashtags associated with the post")
+
+
+_LAZY_POST_OVERHEAD = 512
+
+
+def _compact_json(value: object) -> bytes:
+    # Re-encoded metadata takes a fraction of the memory of the decoded dict tree. orjson leaves
+    # its output buffer over-allocated, so the bytes are copied to their exact size.
+    return bytes(memoryview(orjson.dumps(value)))
+
+
+class _LazyPostFields(TypedDict, total=False):
+    id: Required[str]
+    channel_id: Required[str]
+    user_id: Required[str]
+    message: Required[str]
+    root_id: str
+    type: str
+    create_at: int
+    update_at: int
+    edit_at: int
+    delete_at: int
+    file_ids: list[str] | None
+    props: dict[str, Any] | None
+    metadata: dict[str, Any] | None
+    original_id: str | None
+    pending_post_id: str | None
+    hashtags: str | None
+
+
+class LazyPost:
+    """Compact post for event and listing hot paths.
+
+    The flat post fields are stored in ``__slots__`` and ``metadata`` is kept as
+    compact JSON bytes and validated into :class:`PostMetadata` on first access. ``trusted=True`` skips
+    validation for payloads that come straight from the server. :meth:`to_model` builds the full
+    :class:`PostResponse`. ``LazyPost`` can be used as a ``response_model``, also in ``list[...]``.
+    """
+
+    __slots__ = (
+        "_metadata",
+        "_raw_metadata",
+        "channel_id",
+        "create_at",
+        "delete_at",
+        "edit_at",
+        "file_ids",
+        "hashtags",
+        "id",
+        "message",
+        "original_id",
+        "pending_post_id",
+        "props",
+        "root_id",
+        "type",
+        "update_at",
+        "user_id",
+    )
+
+    def __init__(self, fields: Mapping[str, Any]) -> None:
+        self.id: str = fields["id"]
+        self.channel_id: str = fields["channel_id"]
+        self.user_id: str = fields["user_id"]
+        self.message: str = fields["message"]
+        self.root_id: str = fields.get("root_id") or ""
+        self.type: str = fields.get("type") or ""
+        self.create_at: int = fields.get("create_at", 0)
+        self.update_at: int = fields.get("update_at", 0)
+        self.edit_at: int = fields.get("edit_at", 0)
+        self.delete_at: int = fields.get("delete_at", 0)
+        self.file_ids: list[str] | None = fields.get("file_ids")
+        self.props: dict[str, Any] | None = fields.get("props")
+        self.original_id: str | None = fields.get("original_id")
+        self.pending_post_id: str | None = fields.get("pending_post_id")
+        self.hashtags: str | None = fields.get("hashtags")
+        self._raw_metadata = _compact_json(metadata) if (metadata := fields.get("metadata")) is not None else None
+        self._metadata: PostMetadata | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], *, trusted: bool = False) -> Self:
+        if trusted:
+            return cls(data)
+        return cls(type_adapters.get(_LazyPostFields).validate_python(data))
+
+    @classmethod
+    def from_json(cls, data: bytes | str, *, trusted: bool = False) -> Self:
+        if trusted:
+            return cls(orjson.loads(data))
+        return cls(type_adapters.get(_LazyPostFields).validate_json(data))
+
+    @classmethod
+    def __get_pydantic_core_schema__(  # noqa: PLW3201
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            cls,
+            handler.generate_schema(_LazyPostFields),
+            serialization=core_schema.plain_serializer_function_ser_schema(cls.to_dict),
+        )
+
+    @property
+    def metadata(self) -> PostMetadata | None:
+        if self._metadata is None and self._raw_metadata is not None:
+            self._metadata = type_adapters.get(PostMetadata).validate_json(self._raw_metadata)
+            self._raw_metadata = None
+        return self._metadata
+
+    @property
+    def size(self) -> int:
+        # Rough retained size in bytes (slots, strings and compact metadata), for memory-bounded caches.
+        metadata = len(self._raw_metadata) if self._raw_metadata is not None else 0
+        return _LAZY_POST_OVERHEAD + len(self.message) + metadata
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+        if self._metadata is not None:
+            data["metadata"] = self._metadata.model_dump()
+        elif self._raw_metadata is not None:
+            data["metadata"] = orjson.loads(self._raw_metadata)
+        return data
+
+    def to_model(self) -> PostResponse:
+        return PostResponse.model_validate(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"LazyPost(id={self.id!r}, channel_id={self.channel_id!r})"
+
+
+class PostList(ApiModel, Generic[TPost]):
+    order: list[str] = Field(default_factory=list, description="Post IDs in display order, newest first")
+    posts: dict[str, TPost] = Field(default_factory=dict, description="Posts of the page keyed by ID")
+    next_post_id: str = Field("", description="ID of the post after the page, empty at the newest post")
+    prev_post_id: str = Field("", description="ID of the post before the page, empty at the oldest post")
+    has_next: bool | None = Field(None, description="Whether newer posts exist")
+
+    def ordered(self) -> list[TPost]:
+        return [self.posts[post_id] for post_id in self.order if post_id in self.posts]
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from botenix.integration.clients.models.common import ApiModel
 
-class Reaction(BaseModel):
+
+class Reaction(ApiModel):
     user_id: str = Field(..., description="ID of the user who made the reaction")
     post_id: str = Field(..., description="ID of the post to which the reaction was made")
     emoji_name: str = Field(..., description="Name of the emoji used for the reaction")
@@ -0,0 +1,22 @@
+from enum import StrEnum
+
+from pydantic import Field
+
+from botenix.integration.clients.models.common import ApiModel
+
+
+class TeamType(StrEnum):
+    open = "O"
+    invite = "I"
+
+
+class Team(ApiModel):
+    id: str = Field(..., description="Unique ID of the team")
+    name: str = Field(..., description="Unique name of the team, used in URLs")
+    display_name: str = Field("", description="Human readable name of the team")
+    type: TeamType = Field(TeamType.open, description="Whether anyone can join or invitation is required")
+    description: str = Field("", description="Description of the team")
+    allow_open_invite: bool = Field(False, description="Whether users can join without an invitation")
+    create_at: int = Field(0, description="Timestamp of team creation")
+    update_at: int = Field(0, description="Timestamp of last update")
+    delete_at: int = Field(0, description="Timestamp of deletion")
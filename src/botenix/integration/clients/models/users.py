@@ -0,0 +1,28 @@
+from pydantic import Field
+
+from botenix.integration.clients.models.common import ApiModel
+
+
+class User(ApiModel):
+    id: str = Field(..., description="Unique ID of the user")
+    username: str = Field(..., description="Unique username of the user")
+    first_name: str = Field("", description="First name of the user")
+    last_name: str = Field("", description="Last name of the user")
+    nickname: str = Field("", description="Nickname of the user")
+    email: str | None = Field(None, description="Email address, if visible to the bot")
+    position: str = Field("", description="Position of the user in the organisation")
+    roles: str = Field("", description="Space separated system roles of the user")
+    locale: str | None = Field(None, description="Locale of the user interface")
+    timezone: dict[str, str] | None = Field(None, description="Automatic and manual timezone settings")
+    is_bot: bool = Field(False, description="Indicates if the user is a bot account")
+    create_at: int = Field(0, description="Timestamp of user creation")
+    update_at: int = Field(0, description="Timestamp of last update")
+    delete_at: int = Field(0, description="Timestamp of deactivation, 0 for active users")
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+    @property
+    def display_name(self) -> str:
+        return self.nickname or self.full_name or self.username
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import orjson
+from httpx import HTTPStatusError
+
+from botenix.core.events.event import EventType
+from botenix.integration.clients.models.channels import Channel
+from botenix.integration.clients.models.teams import Team
+from botenix.integration.clients.models.users import User
+from botenix.integration.utils.response_cache import CacheStats, SingleFlight
+from botenix.integration.utils.type_adapters import type_adapters
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Iterable
+
+    from botenix.core.events.event import Event
+    from botenix.integration.utils.http_client import HttpClient
+
+K = TypeVar("K")
+V = TypeVar("V")
+TEntity = TypeVar("TEntity", User, Channel, Team)
+
+
+class EntityCache(Generic[K, V]):
+    """LRU + TTL map with an optional secondary index on a name derived from each value.
+
+    The TTL only covers changes the WebSocket does not report (e.g. channels the bot is not a member of).
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        name_of: Callable[[V], Hashable] | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._name_of = name_of
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._names: dict[Hashable, K] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return self.peek(key) is not None
+
+    def peek(self, key: K) -> V | None:
+        # Like ``get`` but without touching the LRU order or the stats.
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry[1] <= time.monotonic():
+            self.invalidate(key)
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[0]
+
+    def get_by_name(self, name: Hashable) -> V | None:
+        key = self._names.get(name)
+        if key is None:
+            self.stats.misses += 1
+            return None
+        return self.get(key)
+
+    def put(self, key: K, value: V) -> None:
+        self.invalidate(key)
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        if self._name_of is not None:
+            self._names[self._name_of(value)] = key
+        while len(self._entries) > self.max_entries:
+            self.invalidate(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and self._name_of is not None:
+            name = self._name_of(entry[0])
+            # The name may already point to a newer entity that took it over.
+            if self._names.get(name) == key:
+                del self._names[name]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._names.clear()
+
+
+def _decode_entity(value: object, model: type[V]) -> V | None:
+    # Entities arrive as objects (``user_updated``) or as JSON strings (``channel_updated``).
+    if isinstance(value, str | bytes):
+        value = orjson.loads(value)
+    if not isinstance(value, dict):
+        return None
+    return type_adapters.get(model).validate_python(value)
+
+
+class EntityStore:
+    """In-process cache of users, channels, teams and memberships, indexed by id and by name.
+
+    Lookups fill the cache lazily from the REST API (concurrent misses for the same entity share one
+    request); :meth:`observe` keeps it current from WebSocket events, so once warm most lookups in
+    handlers are served without a round trip. Every kind is bounded by its own LRU.
+    Entities returned from the store are shared and must be treated as read-only.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        http_client: HttpClient,
+        *,
+        max_users: int = 10_000,
+        max_channels: int = 10_000,
+        max_teams: int = 1_000,
+        max_memberships: int = 100_000,
+        ttl: float = 600.0,
+    ) -> None:
+        self.http_client = http_client
+        self.users: EntityCache[str, User] = EntityCache(max_users, ttl, lambda user: user.username)
+        self.channels: EntityCache[str, Channel] = EntityCache(
+            max_channels, ttl, lambda channel: (channel.team_id, channel.name)
+        )
+        self.teams: EntityCache[str, Team] = EntityCache(max_teams, ttl, lambda team: team.name)
+        # ``(channel_id, user_id)`` and ``(team_id, user_id)``; negative answers are cached too.
+        self.channel_members: EntityCache[tuple[str, str], bool] = EntityCache(max_memberships, ttl)
+        self.team_members: EntityCache[tuple[str, str], bool] = EntityCache(max_memberships, ttl)
+        self._flights: SingleFlight[Any] = SingleFlight()
+        self._handlers: dict[str, Callable[[Event], None]] = {
+            EventType.user_updated: self._on_user_updated,
+            EventType.channel_updated: self._on_channel_updated,
+            EventType.channel_deleted: self._on_channel_deleted,
+            EventType.user_added: self._on_channel_membership,
+            EventType.user_removed: self._on_channel_membership,
+            EventType.update_team: self._on_team_updated,
+            EventType.delete_team: self._on_team_deleted,
+            EventType.added_to_team: self._on_team_membership,
+            EventType.leave_team: self._on_team_membership,
+        }
+
+    async def _load(self, key: Hashable, fetch: Callable[[], Awaitable[V]]) -> V:
+        return await self._flights.do(key, fetch)  # type: ignore[no-any-return]
+
+    async def _fetch_entity(self, path: str, model: type[TEntity], cache: EntityCache[str, TEntity]) -> TEntity:
+        entity = await self.http_client.get(path, response_model=model)
+        cache.put(entity.id, entity)
+        return entity
+
+    async def get_user(self, user_id: str) -> User:
+        if (user := self.users.get(user_id)) is not None:
+            return user
+        path = f"/api/v4/users/{user_id}"
+        return await self._load(path, lambda: self._fetch_entity(path, User, self.users))
+
+    async def get_user_by_username(self, username: str) -> User:
+        if (user := self.users.get_by_name(username)) is not None:
+            return user
+        path = f"/api/v4/users/username/{username}"
+        return await self._load(path, lambda: self._fetch_entity(path, User, self.users))
+
+    async def get_users(self, user_ids: Iterable[str]) -> dict[str, User]:
+        # Cached users plus one ``/users/ids`` request for all the missing ones; unknown ids are left out.
+        found: dict[str, User] = {}
+        missing: list[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            if (user := self.users.get(user_id)) is not None:
+                found[user_id] = user
+            else:
+                missing.append(user_id)
+        if missing:
+            # ``RequestJson`` only covers objects; the endpoint takes a bare array.
+            users = await self.http_client.post(
+                "/api/v4/users/ids",
+                content=orjson.dumps(missing),
+                headers={"Content-Type": "application/json"},
+                response_model=list[User],
+            )
+            for user in users:
+                self.users.put(user.id, user)
+                found[user.id] = user
+        return found
+
+    async def get_channel(self, channel_id: str) -> Channel:
+        if (channel := self.channels.get(channel_id)) is not None:
+            return channel
+        path = f"/api/v4/channels/{channel_id}"
+        return await self._load(path, lambda: self._fetch_entity(path, Channel, self.channels))
+
+    async def get_channel_by_name(self, team_id: str, name: str) -> Channel:
+        if (channel := self.channels.get_by_name((team_id, name))) is not None:
+            return channel
+        path = f"/api/v4/teams/{team_id}/channels/name/{name}"
+        return await self._load(path, lambda: self._fetch_entity(path, Channel, self.channels))
+
+    async def get_team(self, team_id: str) -> Team:
+        if (team := self.teams.get(team_id)) is not None:
+            return team
+        path = f"/api/v4/teams/{team_id}"
+        return await self._load(path, lambda: self._fetch_entity(path, Team, self.teams))
+
+    async def get_team_by_name(self, name: str) -> Team:
+        if (team := self.teams.get_by_name(name)) is not None:
+            return team
+        path = f"/api/v4/teams/name/{name}"
+        return await self._load(path, lambda: self._fetch_entity(path, Team, self.teams))
+
+    async def is_channel_member(self, channel_id: str, user_id: str) -> bool:
+        if (member := self.channel_members.get((channel_id, user_id))) is not None:
+            return member
+        path = f"/api/v4/channels/{channel_id}/members/{user_id}"
+        return await self._load(path, lambda: self._fetch_membership(path, self.channel_members, (channel_id, user_id)))
+
+    async def is_team_member(self, team_id: str, user_id: str) -> bool:
+        if (member := self.team_members.get((team_id, user_id))) is not None:
+            return member
+        path = f"/api/v4/teams/{team_id}/members/{user_id}"
+        return await self._load(path, lambda: self._fetch_membership(path, self.team_members, (team_id, user_id)))
+
+    async def _fetch_membership(
+        self,
+        path: str,
+        cache: EntityCache[tuple[str, str], bool],
+        key: tuple[str, str],
+    ) -> bool:
+        try:
+            await self.http_client.get(path)
+        except HTTPStatusError as error:
+            if error.response.status_code != HTTPStatus.NOT_FOUND:
+                raise
+            member = False
+        else:
+            member = True
+        cache.put(key, member)
+        return member
+
+    def observe(self, event: Event) -> bool:
+        # Dispatcher stage: applies the event to the store and lets it through to the handlers.
+        handler = self._handlers.get(event.type)
+        if handler is not None:
+            try:
+                handler(event)
+            except ValueError:
+                logger.exception(f"Cannot apply {event!r} to the entity store")
+        return True
+
+    def clear(self) -> None:
+        for cache in (self.users, self.channels, self.teams, self.channel_members, self.team_members):
+            cache.clear()
+
+    def _on_user_updated(self, event: Event) -> None:
+        if (user := _decode_entity(event.data.get("user"), User)) is not None:
+            self.users.put(user.id, user)
+
+    def _on_channel_updated(self, event: Event) -> None:
+        if (channel := _decode_entity(event.data.get("channel"), Channel)) is not None:
+            self.channels.put(channel.id, channel)
+
+    def _on_channel_deleted(self, event: Event) -> None:
+        if (channel_id := event.channel_id) is not None:
+            self.channels.invalidate(channel_id)
+
+    def _on_channel_membership(self, event: Event) -> None:
+        # ``user_removed`` sent to the removed user carries the channel in ``data`` and the user in ``broadcast``.
+        channel_id, user_id = event.channel_id, event.user_id
+        if channel_id and user_id:
+            self.channel_members.put((channel_id, user_id), event.type == EventType.user_added)
+
+    def _on_team_updated(self, event: Event) -> None:
+        if (team := _decode_entity(event.data.get("team"), Team)) is not None:
+            self.teams.put(team.id, team)
+
+    def _on_team_deleted(self, event: Event) -> None:
+        if (team := _decode_entity(event.data.get("team"), Team)) is not None:
+            self.teams.invalidate(team.id)
+
+    def _on_team_membership(self, event: Event) -> None:
+        team_id, user_id = event.team_id, event.user_id
+        if team_id and user_id:
+            self.team_members.put((team_id, user_id), event.type == EventType.added_to_team)
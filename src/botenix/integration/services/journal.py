@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import operator
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Self
+
+import orjson
+from httpx import HTTPError
+
+from botenix.core.events.event import Event, EventType
+from botenix.integration.clients.models.channels import Channel
+from botenix.integration.clients.models.posts import LazyPost, PostList
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from botenix.integration.utils.http_client import HttpClient
+
+
+class EventJournal:
+    """Append-only local journal of handled posts, used to catch up on posts missed while disconnected.
+
+    Use :meth:`observe` as a dispatcher stage and :meth:`done` as a dispatcher done callback.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        flush_interval: float = 1.0,
+        max_recent: int = 10_000,
+        compact_after: int | None = None,
+    ) -> None:
+        if flush_interval <= 0 or max_recent < 1:
+            raise ValueError("Flush interval and recent post count must be positive")
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.max_recent = max_recent
+        self.compact_after = compact_after or 2 * max_recent
+        self.channels: dict[str, int] = {}
+        self.teams: dict[str, int] = {}
+        self.flushes = 0
+        self.compactions = 0
+        self._channel_teams: dict[str, str] = {}
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._in_flight: dict[str, Event] = {}
+        self._buffer: list[bytes] = []
+        self._lines = 0
+        self._file: BinaryIO | None = None
+        self._lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def seen(self, post_id: str) -> bool:
+        # Handled, or being handled.
+        return post_id in self._recent or post_id in self._in_flight
+
+    async def open(self) -> None:
+        if self._file is not None:
+            return
+        await asyncio.to_thread(self._load)
+        self._flusher = asyncio.create_task(self._flush_periodically(), name="botenix-journal")
+        logger.info(f"Event journal {self.path} opened with {len(self._recent)} recent posts")
+
+    def _load(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            for line in self.path.read_bytes().splitlines():
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A line cut short by a crash during a write.
+                    logger.warning(f"Skipping a corrupt line of the event journal {self.path}")
+                    continue
+                self._apply(record)
+                self._lines += 1
+        self._file = self.path.open("ab")
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        if post_id := record.get("id"):
+            self._recent[post_id] = None
+            self._recent.move_to_end(post_id)
+            if len(self._recent) > self.max_recent:
+                self._recent.popitem(last=False)
+        channel_id, team_id, create_at = record.get("channel_id"), record.get("team_id"), record.get("create_at", 0)
+        if channel_id:
+            self.channels[channel_id] = max(self.channels.get(channel_id, 0), create_at)
+            if team_id:
+                self._channel_teams[channel_id] = team_id
+        if team_id:
+            self.teams[team_id] = max(self.teams.get(team_id, 0), create_at)
+
+    def record(self, post: dict[str, Any], team_id: str | None = None) -> None:
+        record = {
+            "id": post["id"],
+            "channel_id": post.get("channel_id"),
+            "team_id": team_id or "",
+            "create_at": post.get("create_at", 0),
+        }
+        self._apply(record)
+        self._buffer.append(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+    def observe(self, event: Event) -> bool:
+        # Dispatcher stage: drops posts that were already handled, the others are in flight until ``done``.
+        if event.type != EventType.posted or (post := event.post) is None or not post.get("id"):
+            return True
+        if self.seen(post["id"]):
+            logger.debug(f"Dropping already handled post {post['id']}")
+            return False
+        self._in_flight[post["id"]] = event
+        return True
+
+    def done(self, event: Event, processed: bool) -> None:
+        # Dispatcher done callback; the identity check skips duplicates this journal dropped itself.
+        if event.type != EventType.posted or (post := event.post) is None:
+            return
+        if self._in_flight.get(post.get("id", "")) is not event:
+            return
+        del self._in_flight[post["id"]]
+        if processed:
+            self.record(post, event.team_id)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except OSError:
+                logger.exception(f"Cannot write the event journal {self.path}")
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if self._file is None or not self._buffer:
+                return
+            self._lines += len(self._buffer)
+            compact = self._lines > self.compact_after
+            # The snapshot already covers the buffered records.
+            data = self._snapshot() if compact else b"".join(self._buffer)
+            self._buffer.clear()
+            await asyncio.to_thread(self._write, data, compact)
+            self.flushes += 1
+
+    def _snapshot(self) -> bytes:
+        lines = [
+            orjson.dumps({
+                "channel_id": channel_id,
+                "team_id": self._channel_teams.get(channel_id, ""),
+                "create_at": create_at,
+            })
+            for channel_id, create_at in self.channels.items()
+        ]
+        lines.extend(orjson.dumps({"id": post_id}) for post_id in self._recent)
+        self._lines = len(lines)
+        return b"\n".join(lines) + b"\n"
+
+    def _write(self, data: bytes, compact: bool) -> None:
+        if self._file is None:
+            return
+        if not compact:
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            return
+        # Written next to the journal and renamed over it, so a crash leaves one complete file.
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        with temporary.open("wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        self._file.close()
+        temporary.replace(self.path)
+        self._file = self.path.open("ab")
+        self.compactions += 1
+        logger.debug(f"Event journal {self.path} compacted")
+
+    async def missed_events(self, http_client: HttpClient) -> list[Event]:
+        # Posts created since the last handled post of each known channel, plus channels of known
+        # teams that have new posts (e.g. joined while offline), oldest first as ``posted`` events.
+        offsets = await self._offsets(http_client)
+        channel_ids = list(offsets)
+        operations = [
+            functools.partial(self._posts_since, http_client, channel_id, offsets[channel_id])
+            for channel_id in channel_ids
+        ]
+        events: list[tuple[int, Event]] = []
+        async for result in http_client.bulk(operations):
+            if not result.ok:
+                logger.warning(f"Cannot catch up channel {channel_ids[result.index]}: {result.error!r}")
+                continue
+            events.extend(result.unwrap())
+        events.sort(key=operator.itemgetter(0))
+        return [event for _, event in events]
+
+    async def _offsets(self, http_client: HttpClient) -> dict[str, int]:
+        offsets = dict(self.channels)
+        listed: set[str] = set()
+        for team_id, team_offset in self.teams.items():
+            try:
+                channels = await http_client.get(
+                    f"/api/v4/users/me/teams/{team_id}/channels", response_model=list[Channel]
+                )
+            except HTTPError as error:
+                logger.warning(f"Cannot list channels of team {team_id} to catch up: {error!r}")
+                continue
+            for channel in channels:
+                # Direct and group channels are listed with every team.
+                if channel.id in listed:
+                    continue
+                listed.add(channel.id)
+                offset = offsets.get(channel.id, team_offset)
+                if channel.last_post_at > offset and not channel.delete_at:
+                    offsets[channel.id] = offset
+                    self._channel_teams.setdefault(channel.id, channel.team_id)
+                else:
+                    offsets.pop(channel.id, None)
+        return offsets
+
+    async def _posts_since(self, http_client: HttpClient, channel_id: str, since: int) -> list[tuple[int, Event]]:
+        # ``since`` returns every post changed since then; edited and deleted older posts are skipped.
+        posts = await http_client.get(
+            f"/api/v4/channels/{channel_id}/posts", params={"since": since}, response_model=PostList[LazyPost]
+        )
+        team_id = self._channel_teams.get(channel_id, "")
+        return [
+            (
+                post.create_at,
+                Event(EventType.posted, {"post": post.to_dict(), "team_id": team_id}, {"channel_id": channel_id}),
+            )
+            for post in posts.posts.values()
+            if post.create_at >= since and not post.delete_at and not self.seen(post.id)
+        ]
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Self
+
+from botenix.exceptions import QueueClosedError
+from botenix.integration.clients.models.posts import PostResponse
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from types import TracebackType
+
+    from botenix.integration.utils.http_client import HttpClient
+
+
+class _Kind(StrEnum):
+    post = "post"
+    patch = "patch"
+    typing = "typing"
+
+
+class _Operation:
+    __slots__ = ("channel_id", "future", "key", "kind", "path", "payload")
+
+    def __init__(
+        self,
+        kind: _Kind,
+        channel_id: str,
+        key: Hashable,
+        path: str,
+        payload: dict[str, Any],
+    ) -> None:
+        self.kind = kind
+        self.channel_id = channel_id
+        self.key = key
+        self.path = path
+        self.payload = payload
+        self.future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Fire-and-forget callers never look at the result; failures are logged by the queue.
+        self.future.add_done_callback(_retrieve_exception)
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class _Recent:
+    # Send times of the last ``interval`` seconds, oldest first, so expired entries are dropped from the front.
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._sent_at: OrderedDict[Hashable, float] = OrderedDict()
+
+    def delay(self, key: Hashable, now: float) -> float:
+        self._expire(now)
+        sent_at = self._sent_at.get(key)
+        return 0.0 if sent_at is None else sent_at + self.interval - now
+
+    def record(self, key: Hashable, now: float) -> None:
+        self._sent_at.pop(key, None)
+        self._sent_at[key] = now
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        while self._sent_at and next(iter(self._sent_at.values())) + self.interval <= now:
+            self._sent_at.popitem(last=False)
+
+
+@dataclass(slots=True)
+class OutboundStats:
+    enqueued: int = 0
+    sent: int = 0
+    coalesced: int = 0
+    typing_skipped: int = 0
+    failed: int = 0
+
+
+class OutboundQueue:
+    """Send queue for posts, post edits and typing notifications.
+
+    Operations of a channel are sent one at a time in the order they were queued. Edits of a post
+    are throttled to one request per ``edit_interval``; while an edit waits for its turn, later
+    edits of the post are merged into it (later fields win), so only the newest state is sent.
+    Typing notifications are sent at most once per ``typing_interval`` for a channel/thread and a
+    pending one is dropped when a post is queued to its channel. :meth:`flush` and :meth:`close`
+    send everything still queued without waiting for the throttling intervals.
+    Every method returns a future with the result, which callers may await or ignore.
+    """
+
+    def __init__(self, http_client: HttpClient, *, edit_interval: float = 0.5, typing_interval: float = 4.0) -> None:
+        self.http_client = http_client
+        self.stats = OutboundStats()
+        self._channels: dict[str, deque[_Operation]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._pending: dict[Hashable, _Operation] = {}
+        self._edits = _Recent(edit_interval)
+        self._typing = _Recent(typing_interval)
+        self._flushing = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return sum(len(operations) for operations in self._channels.values())
+
+    def create_post(
+        self,
+        channel_id: str,
+        message: str,
+        *,
+        root_id: str | None = None,
+        props: dict[str, Any] | None = None,
+        file_ids: list[str] | None = None,
+    ) -> asyncio.Future[PostResponse]:
+        payload = {
+            "channel_id": channel_id,
+            "message": message,
+            "root_id": root_id,
+            "props": props,
+            "file_ids": file_ids,
+        }
+        operations = self._channels.get(channel_id)
+        if operations:
+            # The server clears the typing indicator of a channel once a post arrives.
+            for operation in [operation for operation in operations if operation.kind is _Kind.typing]:
+                self._discard(operations, operation)
+        return self._enqueue(_Operation(_Kind.post, channel_id, None, "/api/v4/posts", _without_none(payload))).future
+
+    def edit_post(
+        self,
+        post_id: str,
+        channel_id: str,
+        *,
+        message: str | None = None,
+        props: dict[str, Any] | None = None,
+        file_ids: list[str] | None = None,
+    ) -> asyncio.Future[PostResponse]:
+        payload = _without_none({"message": message, "props": props, "file_ids": file_ids})
+        key = (_Kind.patch, post_id)
+        if (pending := self._pending.get(key)) is not None:
+            pending.payload.update(payload)
+            self.stats.coalesced += 1
+            return pending.future
+        path = f"/api/v4/posts/{post_id}/patch"
+        return self._enqueue(_Operation(_Kind.patch, channel_id, key, path, payload)).future
+
+    def typing(self, channel_id: str, parent_id: str | None = None) -> asyncio.Future[None]:
+        key = (_Kind.typing, channel_id, parent_id)
+        if (pending := self._pending.get(key)) is not None:
+            self.stats.typing_skipped += 1
+            return pending.future
+        if self._typing.delay(key, time.monotonic()) > 0:
+            self.stats.typing_skipped += 1
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            future.set_result(None)
+            return future
+        payload = _without_none({"channel_id": channel_id, "parent_id": parent_id})
+        path = "/api/v4/users/me/typing"
+        return self._enqueue(_Operation(_Kind.typing, channel_id, key, path, payload)).future
+
+    def _enqueue(self, operation: _Operation) -> _Operation:
+        if self._closed:
+            raise QueueClosedError("Outbound queue is closed")
+        if operation.key is not None:
+            self._pending[operation.key] = operation
+        self._channels.setdefault(operation.channel_id, deque()).append(operation)
+        if operation.channel_id not in self._workers:
+            self._workers[operation.channel_id] = asyncio.create_task(self._work(operation.channel_id))
+        self.stats.enqueued += 1
+        return operation
+
+    def _discard(self, operations: deque[_Operation], operation: _Operation) -> None:
+        operations.remove(operation)
+        self._pending.pop(operation.key, None)
+        operation.future.set_result(None)
+        self.stats.typing_skipped += 1
+
+    async def _work(self, channel_id: str) -> None:
+        operations = self._channels[channel_id]
+        try:
+            while operations:
+                operation = operations[0]
+                if operation.kind is _Kind.patch:
+                    await self._throttle(operation)
+                operations.popleft()
+                # From here on new edits of the post queue a new operation instead of merging into this one.
+                self._pending.pop(operation.key, None)
+                await self._send(operation)
+        finally:
+            del self._workers[channel_id]
+            if operations:
+                # Cancelled with operations left: they will never be sent.
+                for operation in operations:
+                    self._pending.pop(operation.key, None)
+                    operation.future.cancel()
+            del self._channels[channel_id]
+
+    async def _throttle(self, operation: _Operation) -> None:
+        delay = self._edits.delay(operation.key, time.monotonic())
+        if delay > 0 and not self._flushing.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._flushing.wait(), delay)
+
+    async def _send(self, operation: _Operation) -> None:
+        try:
+            if operation.kind is _Kind.post:
+                result: Any = await self.http_client.post(
+                    operation.path, json=operation.payload, response_model=PostResponse
+                )
+            elif operation.kind is _Kind.patch:
+                result = await self.http_client.put(operation.path, json=operation.payload, response_model=PostResponse)
+            else:
+                result = None
+                await self.http_client.post(operation.path, json=operation.payload)
+        except asyncio.CancelledError:
+            operation.future.cancel()
+            raise
+        except Exception as error:  # noqa: BLE001
+            self.stats.failed += 1
+            logger.exception(f"Outbound {operation.kind} to channel {operation.channel_id} failed")
+            operation.future.set_exception(error)
+        else:
+            self.stats.sent += 1
+            operation.future.set_result(result)
+        finally:
+            if operation.kind is _Kind.patch:
+                self._edits.record(operation.key, time.monotonic())
+            elif operation.kind is _Kind.typing:
+                self._typing.record(operation.key, time.monotonic())
+
+    async def flush(self) -> None:
+        # Sends everything queued so far right away, ignoring the throttling intervals.
+        self._flushing.set()
+        try:
+            while self._workers:
+                await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        finally:
+            self._flushing.clear()
+
+    async def close(self) -> None:
+        self._closed = True
+        await self.flush()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+def _without_none(payload: dict[str, Any]) -> dict[str, Any]:
+    return {name: value for name, value in payload.items() if value is not None}
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from botenix.core.events.event import EventType
+from botenix.integration.clients.models.posts import LazyPost, PostList
+from botenix.integration.utils.response_cache import CacheStats, SingleFlight
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from botenix.core.events.event import Event
+    from botenix.integration.utils.http_client import HttpClient
+
+_POST_EVENTS = frozenset({EventType.posted, EventType.post_edited, EventType.post_deleted})
+
+
+class _Thread:
+    """Posts of one thread in ``create_at`` order, with the timestamps in a parallel array for bisection."""
+
+    __slots__ = ("created", "posts", "size")
+
+    def __init__(self) -> None:
+        self.created = array("q")
+        self.posts: list[LazyPost] = []
+        self.size = 0
+
+    def _find(self, post: LazyPost) -> int | None:
+        # Edits and deletions keep ``create_at``, so only posts created in the same millisecond are scanned.
+        index = bisect_left(self.created, post.create_at)
+        while index < len(self.posts) and self.created[index] == post.create_at:
+            if self.posts[index].id == post.id:
+                return index
+            index += 1
+        return None
+
+    # The methods below return the change in size.
+
+    def upsert(self, post: LazyPost) -> int:
+        index = self._find(post)
+        if index is not None:
+            change = post.size - self.posts[index].size
+            self.posts[index] = post
+        else:
+            # New posts nearly always belong at the end, where inserting is cheap.
+            index = bisect_right(self.created, post.create_at)
+            self.created.insert(index, post.create_at)
+            self.posts.insert(index, post)
+            change = post.size
+        self.size += change
+        return change
+
+    def remove(self, post: LazyPost) -> int:
+        index = self._find(post)
+        if index is None:
+            return 0
+        del self.created[index]
+        change = -self.posts.pop(index).size
+        self.size += change
+        return change
+
+    def apply(self, event_type: str, post: LazyPost) -> int:
+        if event_type == EventType.post_deleted or post.delete_at:
+            return self.remove(post)
+        return self.upsert(post)
+
+    def trim(self, max_posts: int) -> int:
+        # Keeps the newest ``max_posts`` posts.
+        excess = len(self.posts) - max_posts
+        if excess <= 0:
+            return 0
+        change = -sum(post.size for post in self.posts[:excess])
+        del self.posts[:excess]
+        del self.created[:excess]
+        self.size += change
+        return change
+
+
+class ThreadIndex:
+    """Recent posts of conversation threads, kept in memory and current from post events.
+
+    A thread (all posts sharing a ``root_id``) is loaded once from ``/posts/{root_id}/thread`` on
+    first lookup; afterwards :meth:`observe` applies new, edited and deleted posts to it, so lookups
+    such as ``await threads.last(root_id, 10)`` are a slice of an in-memory list. Threads nobody has
+    looked up are not tracked. Posts are stored as :class:`LazyPost`; at most ``max_thread_posts`` of
+    the newest posts are kept per thread, and threads are evicted least recently used first once the
+    index holds more than ``max_bytes``. Returned posts are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClient,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_thread_posts: int = 1000,
+    ) -> None:
+        if max_bytes < 1 or max_thread_posts < 1:
+            raise ValueError("Memory budget and posts per thread must be positive")
+        self.http_client = http_client
+        self.max_bytes = max_bytes
+        self.max_thread_posts = max_thread_posts
+        self.stats = CacheStats()
+        self._threads: OrderedDict[str, _Thread] = OrderedDict()
+        self._size = 0
+        self._flights: SingleFlight[_Thread] = SingleFlight()
+        # Posts of threads being loaded, applied once the thread arrives.
+        self._pending: dict[str, list[tuple[str, LazyPost]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def __contains__(self, root_id: str) -> bool:
+        return root_id in self._threads
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def thread(self, root_id: str) -> list[LazyPost]:
+        # All indexed posts of the thread, oldest first; the returned list is a copy.
+        return list((await self._get(root_id)).posts)
+
+    async def last(self, root_id: str, count: int) -> list[LazyPost]:
+        posts = (await self._get(root_id)).posts
+        return posts[-count:] if count > 0 else []
+
+    def peek(self, root_id: str, count: int) -> list[LazyPost] | None:
+        # Like ``last`` without loading: ``None`` when the thread is not indexed.
+        thread = self._threads.get(root_id)
+        if thread is None:
+            return None
+        self._threads.move_to_end(root_id)
+        return thread.posts[-count:] if count > 0 else []
+
+    async def _get(self, root_id: str) -> _Thread:
+        thread = self._threads.get(root_id)
+        if thread is not None:
+            self._threads.move_to_end(root_id)
+            self.stats.hits += 1
+            return thread
+        if root_id in self._flights:
+            self.stats.coalesced += 1
+        return await self._flights.do(root_id, lambda: self._load(root_id))
+
+    async def _load(self, root_id: str) -> _Thread:
+        self._pending[root_id] = []
+        try:
+            page = await self.http_client.get(f"/api/v4/posts/{root_id}/thread", response_model=PostList[LazyPost])
+        except BaseException:
+            del self._pending[root_id]
+            raise
+        self.stats.misses += 1
+        thread = _Thread()
+        for post in sorted(page.posts.values(), key=lambda post: post.create_at):
+            if not post.delete_at:
+                thread.upsert(post)
+        for event_type, post in self._pending.pop(root_id):
+            if event_type == EventType.post_deleted and post.id == root_id:
+                # Deleting the root post deletes the whole thread.
+                return _Thread()
+            thread.apply(event_type, post)
+        thread.trim(self.max_thread_posts)
+        self._threads[root_id] = thread
+        self._size += thread.size
+        self._evict()
+        logger.debug(f"Indexed thread {root_id} with {len(thread.posts)} posts")
+        return thread
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._threads:
+            _, thread = self._threads.popitem(last=False)
+            self._size -= thread.size
+            self.stats.evictions += 1
+
+    def observe(self, event: Event) -> bool:
+        # Dispatcher stage: applies post events to indexed (or loading) threads and lets every event through.
+        if event.type not in _POST_EVENTS:
+            return True
+        root_id = event.root_id
+        if root_id is None or (root_id not in self._threads and root_id not in self._pending):
+            return True
+        post = event.post_model
+        if post is None:
+            return True
+        if root_id in self._pending:
+            self._pending[root_id].append((event.type, post))
+            return True
+        thread = self._threads[root_id]
+        if event.type == EventType.post_deleted and post.id == root_id:
+            # Deleting the root post deletes the whole thread.
+            self.invalidate(root_id)
+            return True
+        self._size += thread.apply(event.type, post) + thread.trim(self.max_thread_posts)
+        self._evict()
+        return True
+
+    def invalidate(self, root_id: str) -> None:
+        thread = self._threads.pop(root_id, None)
+        if thread is not None:
+            self._size -= thread.size
+
+    def clear(self) -> None:
+        self._threads.clear()
+        self._size = 0
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+Operation = Callable[[], Awaitable[T]]
+BulkOperations = Iterable[Operation[T]] | AsyncIterable[Operation[T]]
+
+DEFAULT_CONCURRENCY = 16
+
+
+@dataclass(frozen=True, slots=True)
+class BulkResult(Generic[T]):
+    index: int
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> T:
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+async def _run(index: int, operation: Operation[T]) -> BulkResult[T]:
+    try:
+        return BulkResult(index, await operation())
+    except Exception as error:  # noqa: BLE001
+        return BulkResult(index, error=error)
+
+
+async def _aenumerate(operations: BulkOperations[T]) -> AsyncIterator[tuple[int, Operation[T]]]:
+    if isinstance(operations, AsyncIterable):
+        index = 0
+        async for operation in operations:
+            yield index, operation
+            index += 1
+    else:
+        for item in enumerate(operations):
+            yield item
+
+
+async def bulk(
+    operations: BulkOperations[T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncGenerator[BulkResult[T]]:
+    # Runs the operations (zero-argument callables, e.g. ``functools.partial(client.post, ...)``)
+    # with at most ``concurrency`` in flight and yields one result per operation as it completes;
+    # ``BulkResult.index`` is the position of the operation in ``operations``. A failing operation
+    # yields a result carrying the error and does not stop the others. Operations are only pulled
+    # from ``operations`` when a slot is free, so arbitrarily long (lazy) iterables are fine.
+    if concurrency < 1:
+        raise ValueError("Concurrency must be positive")
+    source = _aenumerate(operations)
+    running: set[asyncio.Task[BulkResult[T]]] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(running) < concurrency:
+                try:
+                    index, operation = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    running.add(asyncio.create_task(_run(index, operation)))
+            if not running:
+                return
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Self
+
+from httpx import AsyncClient, Limits
+
+from botenix.integration.utils.bulk import DEFAULT_CONCURRENCY
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.instrumentation import Instrumentation
+from botenix.integration.utils.rate_limiter import RateLimiter
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from httpx import AsyncBaseTransport
+
+    from botenix.integration.utils.retry import CircuitBreaker, RetryPolicy
+
+# Every pooled connection serves many tenants, so all of them are kept alive between requests. httpx
+# scans its idle connections once per idle connection on every request, so the pool stays small.
+DEFAULT_POOL_LIMITS = Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+class ClientPool:
+    """``HttpClient``s for many bot accounts on one or more servers, sharing one connection pool per server.
+
+    Every ``(base_url, token)`` tenant gets a lightweight client that sends its token per request
+    through the server's shared ``AsyncClient``, with its own ``max_concurrency`` limit and its own
+    buckets in the pool's ``RateLimiter``. Tenants without requests for ``idle_timeout`` seconds are
+    evicted; a client that is still referenced keeps working and is simply created anew on next lookup.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        verify_ssl: bool = True,
+        timeout: float = 10.0,
+        limits: Limits | None = None,
+        http2: bool = False,
+        transport: AsyncBaseTransport | None = None,
+        max_concurrency: int | None = 16,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        instrumentation: Instrumentation | None = None,
+        idle_timeout: float = 600.0,
+    ) -> None:
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.limits = limits or DEFAULT_POOL_LIMITS
+        self.http2 = http2
+        self.transport = transport
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.instrumentation = instrumentation or Instrumentation()
+        self.idle_timeout = idle_timeout
+        self._connections: dict[str, tuple[AsyncClient, asyncio.Semaphore]] = {}
+        self._tenants: dict[tuple[str, str], HttpClient] = {}
+        self._swept_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, tenant: tuple[str, str]) -> bool:
+        return (tenant[0].rstrip("/"), tenant[1]) in self._tenants
+
+    @property
+    def servers(self) -> int:
+        return len(self._connections)
+
+    def client(self, base_url: str, token: str) -> HttpClient:
+        now = time.monotonic()
+        if now - self._swept_at >= self.idle_timeout / 2:
+            self.evict_idle(now)
+
+        base_url = base_url.rstrip("/")
+        client = self._tenants.get((base_url, token))
+        if client is None:
+            connection, slots = self._connection(base_url)
+            client = self._tenants[base_url, token] = HttpClient(
+                base_url,
+                bearer_token=token,
+                rate_limiter=self.rate_limiter,
+                retry_policy=self.retry_policy,
+                circuit_breaker=self.circuit_breaker,
+                limits=self.limits,
+                instrumentation=self.instrumentation,
+                client=connection,
+                connection_slots=slots,
+                max_concurrency=self.max_concurrency,
+            )
+        return client
+
+    def _connection(self, base_url: str) -> tuple[AsyncClient, asyncio.Semaphore]:
+        connection = self._connections.get(base_url)
+        if connection is None:
+            client = AsyncClient(
+                base_url=base_url,
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
+            slots = asyncio.Semaphore(self.limits.max_connections or DEFAULT_CONCURRENCY)
+            connection = self._connections[base_url] = client, slots
+            logger.debug(f"Opened connection pool for {base_url}")
+        return connection
+
+    def remove(self, base_url: str, token: str) -> None:
+        if self._tenants.pop((base_url.rstrip("/"), token), None) is not None:
+            self.rate_limiter.forget(token)
+
+    def evict_idle(self, now: float | None = None) -> int:
+        # The servers' connection pools stay open: idle keep-alive connections expire on their own.
+        now = time.monotonic() if now is None else now
+        self._swept_at = now
+        idle = [tenant for tenant, client in self._tenants.items() if now - client.last_used >= self.idle_timeout]
+        for base_url, token in idle:
+            self.remove(base_url, token)
+        if idle:
+            logger.debug(f"Evicted {len(idle)} idle clients")
+        return len(idle)
+
+    async def close(self) -> None:
+        self._tenants.clear()
+        connections, self._connections = self._connections, {}
+        for client, _ in connections.values():
+            await client.aclose()
+        logger.debug("Client pool closed")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
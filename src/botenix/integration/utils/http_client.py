@@ -1,24 +1,101 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Hashable, Sequence
+from contextlib import nullcontext, suppress
+from http import HTTPStatus
+from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar, cast
 
 import orjson
-from httpx import AsyncClient, HTTPStatusError, RequestError, Response
-from pydantic import BaseModel, TypeAdapter, ValidationError
+from httpx import AsyncClient, HTTPStatusError, Limits, QueryParams, RequestError, Response
+from pydantic import BaseModel, ValidationError
 
 from botenix.integration.annotations import RequestJson, SerializedJson
 from botenix.integration.utils.authentication import BearerAuth
+from botenix.integration.utils.bulk import DEFAULT_CONCURRENCY, bulk
+from botenix.integration.utils.instrumentation import Instrumentation
+from botenix.integration.utils.pagination import DEFAULT_PER_PAGE, Paginator
+from botenix.integration.utils.rate_limiter import RateLimiter, RequestPriority
+from botenix.integration.utils.type_adapters import type_adapters
 from botenix.logger import integration_logger as logger
 
 
 if TYPE_CHECKING:
-    from botenix.integration.annotations import IncEx, Method, RequestFiles, RequestQueryParam
+    import os
+    from collections.abc import Mapping
+    from contextlib import AbstractAsyncContextManager
 
+    from httpx import AsyncBaseTransport
+
+    from botenix.integration.annotations import (
+        IncEx,
+        Method,
+        PrimitiveData,
+        RequestContent,
+        RequestFiles,
+        RequestHeaders,
+        RequestQueryParam,
+    )
+    from botenix.integration.utils.bulk import BulkOperations, BulkResult
+    from botenix.integration.utils.instrumentation import RequestMetrics
+    from botenix.integration.utils.response_cache import CacheEntry, ResponseCache
+    from botenix.integration.utils.retry import CircuitBreaker, RetryPolicy
+
+T = TypeVar("T")
 TRequest = TypeVar("TRequest", bound=BaseModel | Sequence[BaseModel])
 TResponse = TypeVar("TResponse", bound=BaseModel | Sequence[BaseModel] | bytes | SerializedJson)
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Same as httpx's defaults.
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+
+def _encode_json_body(json: RequestJson) -> bytes:
+    # ``str`` and ``bytes`` are treated as already serialized JSON documents.
+    if isinstance(json, bytes):
+        return json
+    if isinstance(json, str):
+        return json.encode()
+    # Non-``str`` keys of nested objects are converted like the standard library encoder does.
+    return orjson.dumps(json if isinstance(json, dict) else dict(json), option=orjson.OPT_NON_STR_KEYS)
+
+
+def _is_json_response(response: Response) -> bool:
+    return "application/json" in response.headers.get("content-type", "")
+
+
+async def _read_response_content(response: Response) -> SerializedJson | bytes:
+    if _is_json_response(response):
+        return cast(SerializedJson, orjson.loads(response.content))
+    return await response.aread()
+
+
+def _validate_response_content(content: bytes, is_json: bool, response_model: type[TResponse]) -> TResponse:
+    response_adapter = type_adapters.get(response_model)
+    try:
+        if is_json:
+            # Validate straight from the body bytes: no intermediate Python dict is built.
+            return response_adapter.validate_json(content)
+        return response_adapter.validate_python(content)
+    except ValidationError as error:
+        logger.error("Response validation failed", exc_info=error)
+        raise
+
+
+async def _iter_file(file_path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    file = await asyncio.to_thread(file_path.open, "rb")
+    try:
+        while chunk := await asyncio.to_thread(file.read, chunk_size):
+            yield chunk
+    finally:
+        file.close()
+
+
 class _MethodHandler:
     def __init__(self, http_client: HttpClient, method: Method) -> None:
         self._http_client = http_client
@@ -32,6 +109,10 @@ class _MethodHandler:
         json: RequestJson | None = None,
         payload: TRequest | None = None,
         files: RequestFiles | None = None,
+        content: RequestContent | None = None,
+        headers: RequestHeaders | None = None,
+        priority: RequestPriority = RequestPriority.DEFAULT,
+        idempotent: bool | None = None,
         request_model: type[TRequest] | None = None,
         response_model: type[TResponse] | None = None,
         include: IncEx | None = None,
@@ -40,7 +121,12 @@ class _MethodHandler:
         exclude_unset: bool = False,
         exclude_defaults: bool = False,
         exclude_none: bool = False,
+        cache: bool = False,
     ) -> TResponse:
+        response_cache = self._http_client.response_cache
+        if cache and response_cache is not None and self._method == "GET":
+            return await self._fetch_cached(response_cache, path, params, headers, response_model, priority)
+
         if payload and request_model:
             json = self._prepare_request_payload(
                 payload,
@@ -53,14 +139,41 @@ class _MethodHandler:
                 exclude_none,
             )
 
-        raw_response = await self._http_client.request(
-            method=self._method,
-            path=path,
-            params=params,
-            json=json,
-            files=files,
+        instrumentation = self._http_client.instrumentation
+        metrics = instrumentation.start(self._method, path)
+        try:
+            raw_response = await self._http_client.send(
+                method=self._method,
+                path=path,
+                params=params,
+                json=json,
+                files=files,
+                content=content,
+                headers=headers,
+                priority=priority,
+                idempotent=idempotent,
+                metrics=metrics,
+            )
+            result: TResponse = await self._prepare_response_content(raw_response, response_model, metrics)
+        except Exception as error:
+            instrumentation.error(metrics, error)
+            raise
+        instrumentation.end(metrics)
+        return result
+
+    def paginate(  # noqa: PLR0913
+        self,
+        path: str,
+        *,
+        model: type[T],
+        params: Mapping[str, PrimitiveData] | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = 2,
+        priority: RequestPriority = RequestPriority.BULK,
+    ) -> Paginator[T]:
+        return Paginator(
+            self, path, model=model, params=params, per_page=per_page, prefetch=prefetch, priority=priority
         )
-        return self._prepare_response_content(raw_response, response_model)
 
     @staticmethod
     def _prepare_request_payload(  # noqa: PLR0913, PLR0917
@@ -72,10 +185,9 @@ class _MethodHandler:
         exclude_unset: bool,
         exclude_defaults: bool,
         exclude_none: bool,
-    ) -> RequestJson | None:
-        serialized_payload: RequestJson = TypeAdapter(request_model).dump_python(
+    ) -> bytes:
+        return type_adapters.get(request_model).dump_json(
             payload,  # type: ignore[arg-type]
-            mode="json",
             include=include,
             exclude=exclude,
             by_alias=by_alias,
@@ -83,37 +195,134 @@ class _MethodHandler:
             exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
         )
-        return serialized_payload
 
     @staticmethod
-    def _prepare_response_content(
-        raw_response: SerializedJson | bytes,
+    async def _prepare_response_content(
+        raw_response: Response,
         response_model: type[TResponse] | None = None,
+        metrics: RequestMetrics | None = None,
     ) -> TResponse:
+        started_at = time.perf_counter() if metrics is not None else 0.0
+        if not response_model:
+            content = cast(TResponse, await _read_response_content(raw_response))
+            if metrics is not None:
+                metrics.decode_time = time.perf_counter() - started_at
+            return content
+        model = _validate_response_content(raw_response.content, _is_json_response(raw_response), response_model)
+        if metrics is not None:
+            metrics.validation_time = time.perf_counter() - started_at
+        return model
+
+    async def _fetch_cached(  # noqa: PLR0913, PLR0917
+        self,
+        response_cache: ResponseCache,
+        path: str,
+        params: RequestQueryParam | None,
+        headers: RequestHeaders | None,
+        response_model: type[TResponse] | None,
+        priority: RequestPriority,
+    ) -> TResponse:
+        instrumentation = self._http_client.instrumentation
+        metrics = instrumentation.start(self._method, path)
+
+        async def send(revalidation_headers: RequestHeaders | None) -> Response:
+            # Only the request that actually goes out reports network time and status.
+            return await self._http_client.send(
+                self._method,
+                path,
+                params=params,
+                headers={**(headers or {}), **(revalidation_headers or {})},
+                priority=priority,
+                metrics=metrics,
+            )
+
+        key = (path, str(QueryParams(params)))
+        try:
+            entry = await response_cache.fetch(key, send)
+            decoded = self._decode_cached(response_cache, key, entry, response_model, metrics)
+        except Exception as error:
+            instrumentation.error(metrics, error)
+            raise
+        instrumentation.end(metrics)
+        return decoded
+
+    @staticmethod
+    def _decode_cached(
+        response_cache: ResponseCache,
+        key: Hashable,
+        entry: CacheEntry,
+        response_model: type[TResponse] | None,
+        metrics: RequestMetrics | None,
+    ) -> TResponse:
+        with suppress(KeyError, TypeError):
+            return cast(TResponse, entry.decoded[response_model])
+
+        started_at = time.perf_counter() if metrics is not None else 0.0
         if response_model:
-            response_adapter = TypeAdapter(response_model)
-            try:
-                return response_adapter.validate_python(raw_response)
-            except ValidationError as error:
-                logger.error("Response validation failed", exc_info=error)
-                raise
-        return cast(TResponse, raw_response)
+            decoded = _validate_response_content(entry.content, entry.is_json, response_model)
+            if metrics is not None:
+                metrics.validation_time = time.perf_counter() - started_at
+        else:
+            decoded = cast(TResponse, orjson.loads(entry.content) if entry.is_json else entry.content)
+            if metrics is not None:
+                metrics.decode_time = time.perf_counter() - started_at
+        with suppress(TypeError):
+            response_cache.add_decoded(key, entry, response_model, decoded)
+        return decoded
 
 
 class HttpClient:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         base_url: str,
         verify_ssl: bool = True,
         timeout: float = 10.0,
         bearer_token: str | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        limits: Limits | None = None,
+        http2: bool = False,
+        transport: AsyncBaseTransport | None = None,
+        instrumentation: Instrumentation | None = None,
+        client: AsyncClient | None = None,
+        connection_slots: asyncio.Semaphore | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
-        self._client = AsyncClient(
+        self.response_cache = response_cache
+        self.instrumentation = instrumentation or Instrumentation()
+        limits = limits or DEFAULT_LIMITS
+        # More concurrent bulk operations than pooled connections would only queue inside the pool.
+        self.bulk_concurrency = min(
+            limits.max_connections or DEFAULT_CONCURRENCY, max_concurrency or DEFAULT_CONCURRENCY, DEFAULT_CONCURRENCY
+        )
+        self.last_used = time.monotonic()
+        self._rate_limiter = rate_limiter
+        self._rate_limit_credential = bearer_token or base_url
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        # The token is sent per request, so a ``client`` (and its connection pool) can be shared
+        # between clients of several bot accounts; a shared client is left open by ``close``.
+        self._auth = BearerAuth(bearer_token) if bearer_token else None
+        self._owns_client = client is None
+        self._client = client or AsyncClient(
             base_url=base_url,
             timeout=timeout,
             verify=verify_ssl,
-            auth=BearerAuth(bearer_token) if bearer_token else None,
+            limits=limits,
+            # Requires the ``http2`` extra; all requests to the host are multiplexed on one connection.
+            http2=http2,
+            transport=transport,
+        )
+        self._concurrency: AbstractAsyncContextManager[None] = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
         )
+        # Shared by the clients of a shared ``client``: requests beyond its connections wait here,
+        # since httpx's pool rescans every queued request whenever a connection is released.
+        self._connection_slots: AbstractAsyncContextManager[None] = connection_slots or nullcontext()
+        self._host = self._client.base_url.netloc.decode()
 
         self.get = _MethodHandler(self, "GET")
         self.post = _MethodHandler(self, "POST")
@@ -121,6 +330,10 @@ class HttpClient:
         self.patch = _MethodHandler(self, "PATCH")
         self.delete = _MethodHandler(self, "DELETE")
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
     async def request(
         self,
         method: Method,
@@ -130,28 +343,223 @@ class HttpClient:
         json: RequestJson | None = None,
         files: RequestFiles | None = None,
     ) -> SerializedJson | bytes:
-        logger.debug(f"Sending {method} request to {path}")
+        response = await self.send(method, path, params=params, json=json, files=files)
+        return await _read_response_content(response)
+
+    async def send(  # noqa: PLR0913
+        self,
+        method: Method,
+        path: str,
+        *,
+        params: RequestQueryParam | None = None,
+        json: RequestJson | None = None,
+        files: RequestFiles | None = None,
+        content: RequestContent | None = None,
+        headers: RequestHeaders | None = None,
+        priority: RequestPriority = RequestPriority.DEFAULT,
+        idempotent: bool | None = None,
+        metrics: RequestMetrics | None = None,
+    ) -> Response:
+        if json is not None and files is None and content is None:
+            content, headers = _encode_json_body(json), {**_JSON_HEADERS, **(headers or {})}
+        if metrics is not None:
+            # Started by the caller, which also reports the end once the response is decoded.
+            return await self._send(method, path, params, files, content, headers, priority, idempotent, metrics)
+
+        metrics = self.instrumentation.start(method, path)
         try:
-            response = await self._client.request(
-                method=method,
-                url=path,
-                params=params,
-                json=json,
-                files=files,
-            )
-            response.raise_for_status()
-            return await self._fetch_response_content(response)
+            response = await self._send(method, path, params, files, content, headers, priority, idempotent, metrics)
+        except Exception as error:
+            self.instrumentation.error(metrics, error)
+            raise
+        self.instrumentation.end(metrics)
+        return response
+
+    async def _send(  # noqa: PLR0913, PLR0917
+        self,
+        method: Method,
+        path: str,
+        params: RequestQueryParam | None,
+        files: RequestFiles | None,
+        content: RequestContent | None,
+        headers: RequestHeaders | None,
+        priority: RequestPriority,
+        idempotent: bool | None,
+        metrics: RequestMetrics | None,
+    ) -> Response:
+        # Streamed bodies are consumed by the first attempt and cannot be replayed.
+        retry_policy = self._retry_policy if content is None or isinstance(content, bytes) else None
+        if metrics is not None and isinstance(content, bytes):
+            metrics.bytes_sent = len(content)
+
+        attempt = 1
+        while True:
+            if metrics is not None:
+                metrics.attempts = attempt
+            rate_limit_key = await self._before_request(method, path, priority, metrics)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sending {method} request to {path}")
+            try:
+                started_at = time.perf_counter() if metrics is not None else 0.0
+                try:
+                    async with self._concurrency, self._connection_slots:
+                        response = await self._client.request(
+                            method=method,
+                            url=path,
+                            params=params,
+                            content=content,
+                            files=files,
+                            headers=headers,
+                            auth=self._auth,
+                        )
+                finally:
+                    if metrics is not None:
+                        metrics.network_time += time.perf_counter() - started_at
+                self._after_response(rate_limit_key, response, metrics)
+                # 304 only answers conditional requests, which callers handle themselves.
+                if response.status_code != HTTPStatus.NOT_MODIFIED:
+                    response.raise_for_status()
+                return response
+            except (HTTPStatusError, RequestError) as error:
+                self._record_transport_error(error)
+                delay = retry_policy.retry_delay(method, attempt, error, idempotent) if retry_policy else None
+                if delay is None:
+                    logger.exception(f"{error.__class__.__name__} for {path}")
+                    raise
+                logger.warning(f"{error.__class__.__name__} for {path}, retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+            except BaseException:
+                self._release_probe()
+                raise
+
+    async def _before_request(
+        self,
+        method: Method,
+        path: str,
+        priority: RequestPriority,
+        metrics: RequestMetrics | None = None,
+    ) -> Hashable | None:
+        self.last_used = time.monotonic()
+        if self._circuit_breaker:
+            self._circuit_breaker.before_request(self._host)
+        if not self._rate_limiter:
+            return None
+        rate_limit_key = self._rate_limiter.bucket_key(self._rate_limit_credential, method, path)
+        started_at = time.perf_counter() if metrics is not None else 0.0
+        try:
+            await self._rate_limiter.acquire(rate_limit_key, priority)
+        except BaseException:
+            self._release_probe()
+            raise
+        if metrics is not None:
+            metrics.wait_time += time.perf_counter() - started_at
+        return rate_limit_key
+
+    def _record_transport_error(self, error: HTTPStatusError | RequestError) -> None:
+        # Status errors were already recorded by ``_after_response``.
+        if isinstance(error, RequestError) and self._circuit_breaker:
+            self._circuit_breaker.record_failure(self._host)
+
+    def _release_probe(self) -> None:
+        # For requests that end without an outcome, such as cancelled ones.
+        if self._circuit_breaker:
+            self._circuit_breaker.release_probe(self._host)
+
+    def _after_response(
+        self,
+        rate_limit_key: Hashable | None,
+        response: Response,
+        metrics: RequestMetrics | None = None,
+    ) -> None:
+        if metrics is not None:
+            metrics.status_code = response.status_code
+            metrics.bytes_received += len(response.content)
+        if self._rate_limiter and rate_limit_key is not None:
+            self._rate_limiter.update(rate_limit_key, response.status_code, response.headers)
+        if self._circuit_breaker:
+            if response.is_server_error:
+                self._circuit_breaker.record_failure(self._host)
+            else:
+                self._circuit_breaker.record_success(self._host)
+
+    async def stream(
+        self,
+        method: Method,
+        path: str,
+        *,
+        params: RequestQueryParam | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        priority: RequestPriority = RequestPriority.DEFAULT,
+    ) -> AsyncIterator[bytes]:
+        rate_limit_key = await self._before_request(method, path, priority)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Streaming {method} request to {path}")
+        try:
+            async with (
+                self._concurrency,
+                self._connection_slots,
+                self._client.stream(method=method, url=path, params=params, auth=self._auth) as response,
+            ):
+                self._after_response(rate_limit_key, response)
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
         except (HTTPStatusError, RequestError) as error:
+            self._record_transport_error(error)
             logger.exception(f"{error.__class__.__name__} for {path}")
             raise
+        except BaseException:
+            self._release_probe()
+            raise
 
-    @staticmethod
-    async def _fetch_response_content(response: Response) -> SerializedJson | bytes:
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            return cast(SerializedJson, orjson.loads(response.content))
-        return await response.aread()
+    async def download(
+        self,
+        path: str,
+        destination: str | os.PathLike[str],
+        *,
+        params: RequestQueryParam | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        destination = Path(destination)
+        partial = destination.with_name(f"{destination.name}.part")
+        written = 0
+        file = await asyncio.to_thread(partial.open, "wb")
+        try:
+            async for chunk in self.stream("GET", path, params=params, chunk_size=chunk_size):
+                written += await asyncio.to_thread(file.write, chunk)
+        except BaseException:
+            file.close()
+            partial.unlink(missing_ok=True)
+            raise
+        file.close()
+        partial.replace(destination)
+        return written
+
+    async def upload(  # noqa: PLR0913
+        self,
+        path: str,
+        source: str | os.PathLike[str],
+        *,
+        params: RequestQueryParam | None = None,
+        response_model: type[TResponse] | None = None,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> TResponse:
+        source = Path(source)
+        headers = {"Content-Type": content_type, "Content-Length": str(source.stat().st_size)}
+        return await self.post(
+            path,
+            params=params,
+            content=_iter_file(source, chunk_size),
+            headers=headers,
+            response_model=response_model,
+        )
+
+    def bulk(self, operations: BulkOperations[T], *, concurrency: int | None = None) -> AsyncGenerator[BulkResult[T]]:
+        return bulk(operations, concurrency=concurrency or self.bulk_concurrency)
 
     async def close(self) -> None:
-        await self._client.aclose()
-        logger.debug("HTTP client session closed")
+        if self._owns_client:
+            await self._client.aclose()
+            logger.debug("HTTP client session closed")
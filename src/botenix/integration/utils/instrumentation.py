@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import re
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Protocol
+
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+# Mattermost IDs are 26 lowercase base32 characters.
+_ID_SEGMENT = re.compile(r"(?<=/)[a-z0-9]{26}(?=/|$)")
+# Names in lookups such as ``/users/username/{name}``, ``/teams/name/{name}`` or ``/emoji/name/{name}``,
+# and plugin ids, which are free-form.
+_NAME_SEGMENT = re.compile(r"(/(?:name|username|email|plugins)/)[^/]+")
+OTHER_ROUTE = "other"
+
+# Upper bounds in seconds, from 0.5 ms to ~65 s in powers of two; the last bucket is unbounded.
+DEFAULT_BUCKETS = tuple(0.0005 * 2**power for power in range(18))
+
+
+@lru_cache(maxsize=4096)
+def route_template(path: str) -> str:
+    return _NAME_SEGMENT.sub(r"\1{name}", _ID_SEGMENT.sub("{id}", path.split("?", 1)[0]))
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    method: str
+    path: str
+    route: str
+    started_at: float = field(default_factory=time.perf_counter)
+    status_code: int | None = None
+    attempts: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    wait_time: float = 0.0
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    validation_time: float = 0.0
+    total_time: float = 0.0
+    error: BaseException | None = None
+
+
+class RequestHook:
+    """Base class of instrumentation hooks; override the stages of interest.
+
+    ``wait_time`` is spent in the rate limiter, ``network_time`` in the transport (all attempts),
+    ``decode_time`` in JSON decoding and ``validation_time`` in model validation, which for
+    ``response_model`` requests includes decoding since pydantic validates the raw body.
+    """
+
+    def on_start(self, metrics: RequestMetrics) -> None:
+        pass
+
+    def on_end(self, metrics: RequestMetrics) -> None:
+        pass
+
+    def on_error(self, metrics: RequestMetrics, error: BaseException) -> None:
+        pass
+
+
+class Instrumentation:
+    """Hooks registered on an ``HttpClient``; without hooks no metrics are collected at all."""
+
+    __slots__ = ("hooks",)
+
+    def __init__(self, hooks: Iterable[RequestHook] = ()) -> None:
+        self.hooks = list(hooks)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self.hooks.remove(hook)
+
+    def start(self, method: str, path: str) -> RequestMetrics | None:
+        if not self.hooks:
+            return None
+        metrics = RequestMetrics(method, path, route_template(path))
+        for hook in self.hooks:
+            _call_hook(hook.on_start, metrics)
+        return metrics
+
+    def end(self, metrics: RequestMetrics | None) -> None:
+        if metrics is None:
+            return
+        metrics.total_time = time.perf_counter() - metrics.started_at
+        for hook in self.hooks:
+            _call_hook(hook.on_end, metrics)
+
+    def error(self, metrics: RequestMetrics | None, error: BaseException) -> None:
+        if metrics is None:
+            return
+        metrics.total_time = time.perf_counter() - metrics.started_at
+        metrics.error = error
+        for hook in self.hooks:
+            _call_hook(hook.on_error, metrics, error)
+
+
+def _call_hook(method: Callable[..., None], *args: object) -> None:
+    # A broken hook must never fail the request it observes.
+    try:
+        method(*args)
+    except Exception:  # noqa: BLE001
+        logger.exception(f"Instrumentation hook {method!r} failed")
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram: recording is a binary search and an increment."""
+
+    __slots__ = ("bounds", "count", "counts", "max", "total")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(value, self.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        # Upper bound of the bucket holding the percentile, capped by the largest value seen.
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+
+@dataclass(slots=True)
+class RouteStats:
+    total: LatencyHistogram = field(default_factory=LatencyHistogram)
+    network: LatencyHistogram = field(default_factory=LatencyHistogram)
+    decode: LatencyHistogram = field(default_factory=LatencyHistogram)
+    validation: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: dict[int, int] = field(default_factory=dict)
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+class MetricsExporter(Protocol):
+    def export(self, stats: Mapping[tuple[str, str], RouteStats]) -> None: ...
+
+
+class LoggingExporter:
+    def export(self, stats: Mapping[tuple[str, str], RouteStats]) -> None:  # noqa: PLR6301
+        for (method, route), route_stats in sorted(stats.items()):
+            total = route_stats.total
+            logger.info(
+                f"{method} {route}: {total.count} requests, {route_stats.errors} errors, "
+                f"p50 {total.percentile(0.5) * 1e3:.1f} ms, p99 {total.percentile(0.99) * 1e3:.1f} ms"
+            )
+
+
+class HistogramAggregator(RequestHook):
+    """Aggregates request metrics into latency histograms per ``(method, route template)``.
+
+    Route templates only replace ids and known name segments, so other free-form paths are
+    aggregated per path; past ``max_routes`` keys, new ones go to ``(method, OTHER_ROUTE)``.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS, *, max_routes: int = 1000) -> None:
+        self.bounds = tuple(bounds)
+        self.max_routes = max_routes
+        self.routes: dict[tuple[str, str], RouteStats] = {}
+
+    def _stats(self, metrics: RequestMetrics) -> RouteStats:
+        key = (metrics.method, metrics.route)
+        stats = self.routes.get(key)
+        if stats is None and len(self.routes) >= self.max_routes:
+            key = (metrics.method, OTHER_ROUTE)
+            stats = self.routes.get(key)
+        if stats is None:
+            bounds = self.bounds
+            stats = self.routes[key] = RouteStats(
+                LatencyHistogram(bounds), LatencyHistogram(bounds), LatencyHistogram(bounds), LatencyHistogram(bounds)
+            )
+        return stats
+
+    def on_end(self, metrics: RequestMetrics) -> None:
+        stats = self._stats(metrics)
+        stats.total.record(metrics.total_time)
+        stats.network.record(metrics.network_time)
+        stats.decode.record(metrics.decode_time)
+        stats.validation.record(metrics.validation_time)
+        if metrics.status_code is not None:
+            stats.statuses[metrics.status_code] = stats.statuses.get(metrics.status_code, 0) + 1
+        stats.bytes_sent += metrics.bytes_sent
+        stats.bytes_received += metrics.bytes_received
+
+    def on_error(self, metrics: RequestMetrics, error: BaseException) -> None:  # noqa: ARG002
+        self.on_end(metrics)
+        self._stats(metrics).errors += 1
+
+    def export(self, exporter: MetricsExporter, *, reset: bool = False) -> None:
+        exporter.export(self.routes)
+        if reset:
+            self.reset()
+
+    def reset(self) -> None:
+        self.routes = {}
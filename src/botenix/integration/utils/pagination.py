@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar
+
+from botenix.integration.clients.models.posts import PostList, PostResponse, TPost
+from botenix.integration.utils.rate_limiter import RequestPriority
+
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Mapping
+    from types import TracebackType
+
+    from botenix.integration.annotations import PrimitiveData
+    from botenix.integration.utils.http_client import _MethodHandler
+
+T = TypeVar("T")
+
+DEFAULT_PER_PAGE = 60
+MAX_PER_PAGE = 200
+
+
+class _PrefetchingIterator(ABC, Generic[T]):
+    # Yields items page by page while the next pages are already being requested. At most
+    # ``len(self._pending)`` pages are in flight or buffered, so memory stays bounded.
+
+    def __init__(self, method: _MethodHandler, path: str, per_page: int, priority: RequestPriority) -> None:
+        if not 0 < per_page <= MAX_PER_PAGE:
+            raise ValueError(f"per_page must be between 1 and {MAX_PER_PAGE}")
+        self._method = method
+        self._path = path
+        self.per_page = per_page
+        self.priority = priority
+        self.pages_fetched = 0
+        self._items: deque[T] = deque()
+        self._pending: deque[asyncio.Task[list[T]]] = deque()
+        self._finished = False
+
+    def _schedule(self, fetch: Coroutine[Any, Any, list[T]]) -> None:
+        self._pending.append(asyncio.create_task(fetch))
+
+    @abstractmethod
+    def _fill(self) -> None: ...
+
+    @abstractmethod
+    def _on_page(self, page: list[T]) -> None: ...
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._items:
+            if not self._finished:
+                self._fill()
+            if not self._pending:
+                raise StopAsyncIteration
+            try:
+                page = await self._pending.popleft()
+            except BaseException:
+                await self.aclose()
+                raise
+            self.pages_fetched += 1
+            self._on_page(page)
+            self._items.extend(page)
+        return self._items.popleft()
+
+    async def collect(self) -> list[T]:
+        # Everything up to the end; only for result sets known to be small.
+        return [item async for item in self]
+
+    async def aclose(self) -> None:
+        self._finished = True
+        self._items.clear()
+        pending, self._pending = list(self._pending), deque()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+class Paginator(_PrefetchingIterator[T]):
+    """Iterates the items of a ``page``/``per_page`` list endpoint, validated into ``model``.
+
+    Up to ``prefetch`` pages after the one being consumed are requested concurrently. The first
+    page shorter than ``per_page`` marks the end; requests already sent for later pages are
+    cancelled. Use ``async with`` (or :meth:`aclose`) when breaking out of the loop early.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        method: _MethodHandler,
+        path: str,
+        *,
+        model: type[T],
+        params: Mapping[str, PrimitiveData] | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: int = 2,
+        start_page: int = 0,
+        priority: RequestPriority = RequestPriority.BULK,
+    ) -> None:
+        super().__init__(method, path, per_page, priority)
+        self.model = model
+        self.params = dict(params or {})
+        self.prefetch = max(prefetch, 1)
+        self._response_model: type[list[T]] = list[model]  # type: ignore[valid-type]
+        self._next_page = start_page
+
+    def _fill(self) -> None:
+        while len(self._pending) < self.prefetch:
+            params = {**self.params, "page": self._next_page, "per_page": self.per_page}
+            self._next_page += 1
+            self._schedule(
+                self._method(self._path, params=params, response_model=self._response_model, priority=self.priority)
+            )
+
+    def _on_page(self, page: list[T]) -> None:
+        if len(page) < self.per_page:
+            self._finished = True
+            for task in self._pending:
+                task.cancel()
+            self._pending.clear()
+
+
+class PostCursor(_PrefetchingIterator[TPost]):
+    """Walks a post list endpoint (``PostList`` responses) backwards with the ``before`` cursor.
+
+    Each page names the cursor of the next one, so pages cannot be requested in parallel; instead
+    the next page is requested as soon as a page arrives, while its posts are being consumed.
+    Posts are yielded newest first and memory stays bounded by two pages, whatever the channel size.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        method: _MethodHandler,
+        path: str,
+        *,
+        model: type[TPost] = PostResponse,  # type: ignore[assignment]
+        params: Mapping[str, PrimitiveData] | None = None,
+        per_page: int = MAX_PER_PAGE,
+        before: str | None = None,
+        priority: RequestPriority = RequestPriority.BULK,
+    ) -> None:
+        super().__init__(method, path, per_page, priority)
+        self.model = model
+        self.params = dict(params or {})
+        self.cursor = before
+        self._response_model: type[PostList[TPost]] = PostList[model]  # type: ignore[valid-type]
+        self._started = False
+
+    async def _fetch(self, before: str | None) -> list[TPost]:
+        params: dict[str, PrimitiveData] = {**self.params, "per_page": self.per_page}
+        if before:
+            params["before"] = before
+        page = await self._method(
+            self._path,
+            params=params,
+            response_model=self._response_model,
+            priority=self.priority,
+        )
+        if page.order:
+            self.cursor = page.order[-1]
+        if len(page.order) < self.per_page:
+            self._finished = True
+        return page.ordered()
+
+    def _fill(self) -> None:
+        if not self._started:
+            self._started = True
+            self._schedule(self._fetch(self.cursor))
+
+    def _on_page(self, page: list[TPost]) -> None:  # noqa: ARG002
+        if not self._finished:
+            self._schedule(self._fetch(self.cursor))
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import multiprocessing
+import time
+from collections.abc import Callable, Hashable, Mapping
+from enum import IntEnum
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    from multiprocessing.sharedctypes import SynchronizedArray
+
+RouteClassifier = Callable[[str, str], str]
+
+
+class RequestPriority(IntEnum):
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+
+def single_route_class(method: str, path: str) -> str:  # noqa: ARG001
+    # Mattermost applies one budget per session/user, regardless of the route.
+    return "api"
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    __slots__ = ("blocked_until", "capacity", "drainer", "max_rate", "rate", "tokens", "updated_at", "waiters")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = self.max_rate = rate
+        self.capacity = self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self.drainer: asyncio.Task[None] | None = None
+
+    def locked(self) -> AbstractContextManager[object]:  # noqa: PLR6301
+        return contextlib.nullcontext()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_take(self, now: float) -> bool:
+        if now < self.blocked_until:
+            return False
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def delay(self, now: float) -> float:
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+def _shared_field(index: int) -> property:
+    def get(bucket: _SharedTokenBucket) -> float:
+        return bucket.state[index]
+
+    def set_(bucket: _SharedTokenBucket, value: float) -> None:
+        bucket.state[index] = value
+
+    return property(get, set_)
+
+
+class _SharedTokenBucket(_TokenBucket):
+    # Bucket whose budget lives in shared memory: forked processes draw from the same tokens, while
+    # each process keeps its own waiters. ``time.monotonic`` is system-wide, so timestamps agree.
+    __slots__ = ("state",)
+
+    rate = _shared_field(0)
+    max_rate = _shared_field(1)
+    capacity = _shared_field(2)
+    tokens = _shared_field(3)
+    updated_at = _shared_field(4)
+    blocked_until = _shared_field(5)
+
+    def __init__(self, state: SynchronizedArray[float]) -> None:
+        self.state = state
+        self.waiters = []
+        self.drainer = None
+
+    def locked(self) -> AbstractContextManager[object]:
+        return self.state.get_lock()
+
+    def try_take(self, now: float) -> bool:
+        with self.locked():
+            return super().try_take(now)
+
+
+class RateLimiter:
+    """Client-side token buckets that keep requests under the Mattermost rate limit.
+
+    One bucket exists per ``(credential, route class)`` pair. Buckets start from the configured
+    ``rate``/``burst`` (Mattermost defaults) and then follow the ``X-RateLimit-*`` headers of each
+    response. Requests that would exceed the budget wait in a priority queue instead of hitting a 429.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 100,
+        *,
+        route_classifier: RouteClassifier = single_route_class,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate limit must allow at least one request")
+        self.rate = rate
+        self.burst = burst
+        self.route_classifier = route_classifier
+        self._buckets: dict[Hashable, _TokenBucket] = {}
+        self._sequence = itertools.count()
+        self._shared: SynchronizedArray[float] | None = None
+
+    @property
+    def shared(self) -> bool:
+        return self._shared is not None
+
+    def share(self) -> None:
+        # Moves the budget to shared memory before worker processes are forked: afterwards every
+        # bucket of this limiter, in every process, draws from one budget of ``rate``/``burst``.
+        if self._shared is None:
+            state = [self.rate, self.rate, self.burst, self.burst, time.monotonic(), 0.0]
+            self._shared = multiprocessing.get_context("fork").Array("d", state)
+            self._buckets.clear()
+
+    def bucket_key(self, credential: Hashable, method: str, path: str) -> Hashable:
+        return credential, self.route_classifier(method, path)
+
+    def _bucket(self, key: Hashable) -> _TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if self._shared is not None:
+                bucket = self._buckets[key] = _SharedTokenBucket(self._shared)
+            else:
+                bucket = self._buckets[key] = _TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def forget(self, credential: Hashable) -> None:
+        # Drops the idle buckets of ``credential``, e.g. of a bot account that is no longer used.
+        idle = [
+            key
+            for key, bucket in self._buckets.items()
+            if isinstance(key, tuple) and key[0] == credential and not bucket.waiters
+        ]
+        for key in idle:
+            del self._buckets[key]
+
+    def queue_size(self, key: Hashable) -> int:
+        bucket = self._buckets.get(key)
+        return sum(not future.done() for *_, future in bucket.waiters) if bucket else 0
+
+    async def acquire(self, key: Hashable, priority: RequestPriority = RequestPriority.DEFAULT) -> None:
+        bucket = self._bucket(key)
+        if not bucket.waiters and bucket.try_take(time.monotonic()):
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(bucket.waiters, (priority, next(self._sequence), future))
+        if bucket.drainer is None or bucket.drainer.done():
+            bucket.drainer = asyncio.create_task(self._drain(bucket))
+        await future
+
+    @staticmethod
+    async def _drain(bucket: _TokenBucket) -> None:
+        while bucket.waiters:
+            if bucket.waiters[0][2].done():
+                heapq.heappop(bucket.waiters)
+                continue
+            now = time.monotonic()
+            if bucket.try_take(now):
+                heapq.heappop(bucket.waiters)[2].set_result(None)
+            else:
+                await asyncio.sleep(bucket.delay(now))
+
+    def update(self, key: Hashable, status_code: int, headers: Mapping[str, str]) -> None:
+        bucket = self._bucket(key)
+        with bucket.locked():
+            self._update(bucket, status_code, headers)
+
+    @staticmethod
+    def _update(bucket: _TokenBucket, status_code: int, headers: Mapping[str, str]) -> None:
+        now = time.monotonic()
+        bucket.refill(now)
+
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if limit:
+            bucket.capacity = limit
+        if remaining is not None:
+            # An exhausted budget refills at ``rate``; Mattermost's ``Reset`` is the whole-second
+            # time until the bucket is full again, so it is not used to delay the next request.
+            bucket.tokens = min(bucket.tokens, remaining)
+
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = _header_float(headers, "Retry-After") or reset or 1 / bucket.rate
+            bucket.tokens = 0
+            bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+            bucket.rate = max(bucket.max_rate / 16, bucket.rate / 2)
+            logger.warning(f"Rate limit exceeded, slowing down to {bucket.rate:.2f} requests/s")
+        elif bucket.rate < bucket.max_rate:
+            bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate / 100)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    from httpx import Response
+
+    from botenix.integration.annotations import RequestHeaders
+
+T = TypeVar("T")
+
+_ENTRY_OVERHEAD = 256
+# Estimated memory of a decoded value per byte of body: pydantic models and plain JSON objects take
+# three to six times the body (more with heavy post metadata), ``LazyPost`` lists about as much.
+_DECODED_FACTOR = 4
+
+
+class SingleFlight(Generic[T]):
+    """Merges concurrent calls with the same key into one in-flight awaitable."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = asyncio.ensure_future(factory())
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        # A cancelled caller must not cancel the request other callers are waiting for.
+        return await asyncio.shield(flight)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class CacheEntry:
+    __slots__ = ("content", "decoded", "decoded_size", "etag", "expires_at", "is_json")
+
+    def __init__(self, content: bytes, is_json: bool, etag: str | None, expires_at: float) -> None:
+        self.content = content
+        self.is_json = is_json
+        self.etag = etag
+        self.expires_at = expires_at
+        # Decoded values per response model, so a 304 or a fresh hit skips validation too.
+        self.decoded: dict[Any, Any] = {}
+        self.decoded_size = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + _ENTRY_OVERHEAD + self.decoded_size
+
+
+class ResponseCache:
+    """LRU + TTL cache of GET response bodies with ``ETag`` revalidation and request coalescing.
+
+    Values returned from the cache are shared between callers and must be treated as read-only.
+    ``max_bytes`` bounds the bodies plus an estimate of the decoded values kept with them.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._flights: SingleFlight[CacheEntry] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def fetch(
+        self,
+        key: Hashable,
+        send: Callable[[RequestHeaders | None], Awaitable[Response]],
+    ) -> CacheEntry:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+        if key in self._flights:
+            self.stats.coalesced += 1
+        return await self._flights.do(key, lambda: self._revalidate(key, entry, send))
+
+    async def _revalidate(
+        self,
+        key: Hashable,
+        entry: CacheEntry | None,
+        send: Callable[[RequestHeaders | None], Awaitable[Response]],
+    ) -> CacheEntry:
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = await send(headers)
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            self.stats.revalidated += 1
+            entry.expires_at = time.monotonic() + self.ttl
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            return entry
+
+        self.stats.misses += 1
+        entry = CacheEntry(
+            content=response.content,
+            is_json="application/json" in response.headers.get("content-type", ""),
+            etag=response.headers.get("ETag"),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._store(key, entry)
+        return entry
+
+    def _store(self, key: Hashable, entry: CacheEntry) -> None:
+        self.invalidate(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._size += entry.size
+        self._evict()
+
+    def add_decoded(self, key: Hashable, entry: CacheEntry, response_model: object, value: object) -> None:
+        # Keeps a decoded value with its entry; raises ``TypeError`` for an unhashable model.
+        if response_model in entry.decoded:
+            return
+        entry.decoded[response_model] = value
+        added = _DECODED_FACTOR * len(entry.content)
+        entry.decoded_size += added
+        if self._entries.get(key) is entry:
+            self._size += added
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
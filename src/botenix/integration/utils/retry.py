@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from httpx import HTTPStatusError, RequestError
+
+from botenix.exceptions import CircuitOpenError
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for transport errors and retryable status codes.
+
+    Only idempotent methods are retried unless the caller passes ``idempotent=True`` for the request.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 10.0
+    retry_statuses: frozenset[int] = frozenset({
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    })
+    idempotent_methods: frozenset[str] = frozenset({"GET", "PUT", "DELETE"})
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))  # noqa: S311
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        error: HTTPStatusError | RequestError,
+        idempotent: bool | None = None,
+    ) -> float | None:
+        if attempt >= self.max_attempts:
+            return None
+        if not (method in self.idempotent_methods if idempotent is None else idempotent):
+            return None
+        if isinstance(error, RequestError):
+            return self.backoff(attempt)
+        if error.response.status_code not in self.retry_statuses:
+            return None
+        if self.respect_retry_after and (retry_after := _parse_retry_after(error.response.headers)) is not None:
+            return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+class CircuitState(StrEnum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+@dataclass(slots=True)
+class _Circuit:
+    state: CircuitState = CircuitState.closed
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """Per-host breaker: fails fast while a host is down and lets a few half-open probes through to detect recovery."""
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    _circuits: dict[str, _Circuit] = field(default_factory=dict, init=False, repr=False)
+
+    def state(self, host: str) -> CircuitState:
+        circuit = self._circuits.get(host)
+        return circuit.state if circuit else CircuitState.closed
+
+    def before_request(self, host: str) -> None:
+        circuit = self._circuits.setdefault(host, _Circuit())
+        if circuit.state is CircuitState.closed:
+            return
+        if circuit.state is CircuitState.open:
+            retry_in = circuit.opened_at + self.recovery_timeout - time.monotonic()
+            if retry_in > 0:
+                raise CircuitOpenError(host, retry_in)
+            circuit.state, circuit.probes = CircuitState.half_open, 0
+            logger.info(f"Circuit for {host} is half-open, probing")
+        if circuit.probes >= self.half_open_max_calls:
+            raise CircuitOpenError(host, 0.0)
+        circuit.probes += 1
+
+    def release_probe(self, host: str) -> None:
+        # A request that ends without an outcome, e.g. cancelled while waiting for the rate limiter
+        # or the response, gives its probe slot back; otherwise the circuit would stay half-open.
+        circuit = self._circuits.get(host)
+        if circuit and circuit.state is CircuitState.half_open and circuit.probes:
+            circuit.probes -= 1
+
+    def record_success(self, host: str) -> None:
+        circuit = self._circuits.get(host)
+        if circuit and (circuit.failures or circuit.state is not CircuitState.closed):
+            if circuit.state is not CircuitState.closed:
+                logger.info(f"Circuit for {host} is closed")
+            self._circuits[host] = _Circuit()
+
+    def record_failure(self, host: str) -> None:
+        circuit = self._circuits.setdefault(host, _Circuit())
+        circuit.failures += 1
+        if circuit.state is CircuitState.half_open or circuit.failures >= self.failure_threshold:
+            if circuit.state is not CircuitState.open:
+                logger.warning(f"Circuit for {host} is open after {circuit.failures} failures")
+            circuit.state, circuit.opened_at = CircuitState.open, time.monotonic()
@@ -0,0 +1,38 @@
+from typing import Any, TypeVar, cast
+
+from pydantic import TypeAdapter
+
+
+T = TypeVar("T")
+
+
+class TypeAdapterRegistry:
+    """Keeps one compiled ``TypeAdapter`` per type so validators are built only once."""
+
+    def __init__(self) -> None:
+        self._adapters: dict[Any, TypeAdapter[Any]] = {}
+
+    def get(self, type_: type[T]) -> TypeAdapter[T]:
+        try:
+            return cast(TypeAdapter[T], self._adapters[type_])
+        except KeyError:
+            adapter = self._adapters[type_] = TypeAdapter(type_)
+            return adapter
+        except TypeError:
+            # Unhashable annotations (e.g. ``Annotated`` with unhashable metadata) cannot be cached.
+            return TypeAdapter(type_)
+
+    def clear(self) -> None:
+        self._adapters.clear()
+
+    def __len__(self) -> int:
+        return len(self._adapters)
+
+    def __contains__(self, type_: object) -> bool:
+        try:
+            return type_ in self._adapters
+        except TypeError:
+            return False
+
+
+type_adapters = TypeAdapterRegistry()
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import ssl
+from typing import TYPE_CHECKING, Self
+
+import orjson
+from httpx import URL
+from websockets.asyncio.client import connect
+from websockets.exceptions import InvalidHandshake, WebSocketException
+
+from botenix.core.events.event import Event, EventType
+from botenix.core.events.event_queue import EventQueue, OverflowPolicy
+from botenix.exceptions import QueueClosedError
+from botenix.integration.utils.authentication import BearerAuth
+from botenix.logger import integration_logger as logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from types import TracebackType
+
+    from websockets.asyncio.client import ClientConnection
+
+    GapCallback = Callable[[int, int], Awaitable[None] | None]
+
+
+class WebSocketClient:
+    """Client for the Mattermost ``/api/v4/websocket`` event stream.
+
+    Reconnects with exponential backoff and asks the server to resume the previous connection so
+    missed events are replayed. ``seq`` numbers are tracked per connection: skipped numbers, and
+    new connections the server could not resume, are reported to ``on_gap(expected, received)``.
+    Decoded events are buffered in a bounded :class:`EventQueue` and consumed with ``async for``;
+    if the reader fails for any other reason than a lost connection, iteration raises its error.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        bearer_token: str,
+        *,
+        verify_ssl: bool = True,
+        max_queue_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        ping_interval: float | None = 20.0,
+        on_gap: GapCallback | None = None,
+    ) -> None:
+        url = URL(base_url)
+        self.url = str(url.copy_with(scheme="wss" if url.scheme == "https" else "ws").join("/api/v4/websocket"))
+        self._auth = BearerAuth(bearer_token)
+        self._ssl = None if verify_ssl else ssl._create_unverified_context()  # noqa: S323, SLF001
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ping_interval = ping_interval
+        self.on_gap = on_gap
+        self.queue = EventQueue(max_queue_size, overflow)
+
+        self.connection_id: str | None = None
+        self.received = 0
+        self.gaps = 0
+        self.reconnects = 0
+        self._expected_seq: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._error: Exception | None = None
+        self._connected = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def _connection_url(self) -> str:
+        if self.connection_id is None or self._expected_seq is None:
+            return self.url
+        return f"{self.url}?connection_id={self.connection_id}&sequence_number={self._expected_seq}"
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="botenix-websocket")
+
+    async def wait_connected(self) -> None:
+        connected = asyncio.ensure_future(self._connected.wait())
+        try:
+            await asyncio.wait({connected, *filter(None, [self._task])}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            connected.cancel()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            await self._connect()
+        except Exception as error:  # noqa: BLE001
+            logger.exception("WebSocket reader stopped")
+            self._error = error
+        finally:
+            # Consumers of the queue would otherwise wait forever.
+            await self.queue.close()
+
+    async def _connect(self) -> None:
+        attempt = 0
+        while not self.queue.closed:
+            try:
+                async with connect(
+                    self._connection_url(),
+                    additional_headers={"Authorization": f"Bearer {self._auth.token}"},
+                    ssl=self._ssl if self.url.startswith("wss") else None,
+                    ping_interval=self.ping_interval,
+                    max_size=None,
+                ) as connection:
+                    logger.info(f"WebSocket connected to {self.url}")
+                    attempt = 0
+                    self._connected.set()
+                    await self._read(connection)
+            except QueueClosedError:
+                break
+            except (OSError, TimeoutError, WebSocketException) as error:
+                if isinstance(error, InvalidHandshake):
+                    logger.exception("WebSocket handshake failed")
+                else:
+                    logger.warning(f"WebSocket connection lost: {error!r}")
+            self._connected.clear()
+            if self.queue.closed:
+                break
+            attempt += 1
+            self.reconnects += 1
+            delay = random.uniform(0, min(self.max_reconnect_delay, self.reconnect_delay * 2 ** (attempt - 1)))  # noqa: S311
+            logger.info(f"Reconnecting WebSocket in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _read(self, connection: ClientConnection) -> None:
+        async for frame in connection:
+            try:
+                event = Event.from_json(frame)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping malformed WebSocket frame {frame[:200]!r}")
+                continue
+            if event is None:
+                continue
+            if event.seq is not None and not await self._track_sequence(event):
+                continue
+            self.received += 1
+            await self.queue.put(event)
+
+    async def _track_sequence(self, event: Event) -> bool:
+        seq = event.seq or 0
+        if event.type == EventType.hello:
+            connection_id = event.data.get("connection_id")
+            if connection_id is not None and connection_id == self.connection_id:
+                # Resumed: the server replays what was missed and keeps counting where it stopped.
+                return True
+            if self._expected_seq is not None:
+                await self._report_gap(self._expected_seq, seq)
+            self.connection_id = connection_id
+        elif self._expected_seq is not None:
+            if seq < self._expected_seq:
+                # Replayed after a resumed connection and already delivered.
+                return False
+            if seq > self._expected_seq:
+                await self._report_gap(self._expected_seq, seq)
+        self._expected_seq = seq + 1
+        return True
+
+    async def _report_gap(self, expected: int, received: int) -> None:
+        self.gaps += 1
+        logger.warning(f"WebSocket sequence gap: expected {expected}, received {received}")
+        if self.on_gap is None:
+            return
+        try:
+            result = self.on_gap(expected, received)
+            if result is not None:
+                await result
+        except Exception:  # noqa: BLE001
+            logger.exception("WebSocket gap callback failed")
+
+    def __aiter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __anext__(self) -> Event:
+        try:
+            return await self.queue.get()
+        except QueueClosedError:
+            if self._error is not None:
+                raise self._error from None
+            raise StopAsyncIteration from None
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.queue.close()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._connected.clear()
+        logger.debug("WebSocket client closed")
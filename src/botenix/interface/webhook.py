@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import parse_qsl
+
+import orjson
+
+from botenix.core.events.event import Event, EventType
+from botenix.logger import core_logger as logger
+
+
+try:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.background import BackgroundTask
+    from starlette.responses import Response
+    from starlette.routing import Route
+except ImportError as error:  # pragma: no cover
+    raise ImportError("The webhook server requires the `webhook` extra: pip install 'botenix[webhook]'") from error
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+
+    from starlette.requests import Request
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+    from botenix.core.dispatcher import Dispatcher
+
+
+def _json_response(content: object, status_code: int = 200, background: BackgroundTask | None = None) -> Response:
+    return Response(orjson.dumps(content), status_code, media_type="application/json", background=background)
+
+
+def _token_from_payload(event_type: EventType, payload: Mapping[str, Any]) -> str | None:
+    # Interactive actions and dialogs carry no token of their own: the integration puts one
+    # into the button ``context`` or the dialog ``state`` when it creates them.
+    if event_type is EventType.post_action:
+        context = payload.get("context")
+        return context.get("token") if isinstance(context, dict) else None
+    if event_type is EventType.dialog_submission:
+        return cast(str | None, payload.get("state"))
+    return cast(str | None, payload.get("token"))
+
+
+async def _read_payload(request: Request) -> dict[str, Any]:
+    body = await request.body()
+    if "application/x-www-form-urlencoded" in request.headers.get("content-type", ""):
+        # Slash commands and form-encoded outgoing webhooks; no multipart parser needed.
+        return dict(parse_qsl(body.decode(), keep_blank_values=True))
+    payload = orjson.loads(body)
+    if not isinstance(payload, dict):
+        raise TypeError("Payload must be a JSON object")
+    return payload
+
+
+class WebhookApp:
+    """ASGI app receiving outgoing webhooks, slash commands, interactive actions and dialog submissions.
+
+    Every request is turned into an :class:`Event` for the dispatcher and acknowledged with an
+    empty ``200`` as soon as its token is checked; the handler runs after the response is sent,
+    and replies through the REST API or the ``response_url`` of the payload.
+    Without ``tokens`` requests are not authenticated.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, *, tokens: Iterable[str] = (), path_prefix: str = "/hooks") -> None:
+        self.dispatcher = dispatcher
+        self._tokens = tuple(token.encode() for token in tokens)
+        routes = {
+            "outgoing": EventType.outgoing_webhook,
+            "command": EventType.slash_command,
+            "action": EventType.post_action,
+            "dialog": EventType.dialog_submission,
+        }
+        self.app = Starlette(
+            routes=[
+                Route(f"{path_prefix}/{path}", self._endpoint(event_type), methods=["POST"])
+                for path, event_type in routes.items()
+            ],
+            lifespan=self._lifespan,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+    @asynccontextmanager
+    async def _lifespan(self, _: Starlette) -> AsyncIterator[None]:
+        if not self._tokens:
+            logger.warning("Webhook server started without tokens, requests are not authenticated")
+        self.dispatcher.build()
+        yield
+        await self.dispatcher.close()
+
+    def is_authorized(self, token: str | None) -> bool:
+        if not self._tokens:
+            return True
+        candidate = (token or "").encode()
+        # Compare against every token so the time taken does not reveal which one matched.
+        matches = [hmac.compare_digest(candidate, expected) for expected in self._tokens]
+        return any(matches)
+
+    def _endpoint(self, event_type: EventType) -> Callable[[Request], Awaitable[Response]]:
+        async def endpoint(request: Request) -> Response:
+            try:
+                payload = await _read_payload(request)
+            except (orjson.JSONDecodeError, TypeError, UnicodeDecodeError):
+                return _json_response({"error": "Malformed payload"}, 400)
+            token = _token_from_payload(event_type, payload)
+            if token is None and (authorization := request.headers.get("authorization")):
+                token = authorization.removeprefix("Token ").strip()
+            if not self.is_authorized(token):
+                return _json_response({"error": "Invalid token"}, 401)
+            return _json_response({}, background=BackgroundTask(self.dispatcher.feed_event, Event(event_type, payload)))
+
+        return endpoint
+
+
+def _bind_socket(host: str, port: int, *, reuse_port: bool) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    # An explicit protocol lets asyncio enable TCP_NODELAY on accepted connections; with ``proto=0``
+    # it skips them and every small response waits out the delayed ACK (~40 ms).
+    sock = socket.socket(family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        # Every worker binds its own socket and the kernel balances connections between them.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def _serve(app_factory: Callable[[], ASGIApp], host: str, port: int, reuse_port: bool) -> None:
+    sock = _bind_socket(host, port, reuse_port=reuse_port)
+    server = uvicorn.Server(uvicorn.Config(app_factory(), log_level="warning", access_log=False, lifespan="on"))
+    logger.info(f"Webhook worker {os.getpid()} listening on {host}:{port}")
+    asyncio.run(server.serve(sockets=[sock]))
+
+
+def run_webhook_server(
+    app_factory: Callable[[], ASGIApp],
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    *,
+    workers: int = 1,
+) -> None:
+    # Each worker builds its own app (and dispatcher) after the fork, so no event loop, client
+    # or executor is shared between processes.
+    if workers < 1:
+        raise ValueError("At least one worker is required")
+    if workers == 1:
+        _serve(app_factory, host, port, reuse_port=False)
+        return
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("Multiple webhook workers need SO_REUSEPORT, which this platform lacks")
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_serve, args=(app_factory, host, port, True), name=f"botenix-webhook-{index}")
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # Turn SIGTERM into SystemExit so the workers are stopped with the parent instead of orphaned.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
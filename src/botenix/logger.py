@@ -4,3 +4,4 @@ import logging
 logger = logging.getLogger("botenix")
 
 integration_logger = logger.getChild("integration")
+core_logger = logger.getChild("core")
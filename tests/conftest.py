@@ -0,0 +1,20 @@
+from collections.abc import Mapping
+
+import orjson
+
+from botenix.core.events.event import Event, EventType
+
+
+def post_event(  # noqa: PLR0913
+    message: str = "hi",
+    *,
+    event_type: str = EventType.posted,
+    channel_id: str = "c1",
+    team_id: str | None = None,
+    received_at: float | None = None,
+    post: Mapping[str, object] | None = None,
+    **data: object,
+) -> Event:
+    fields = {"id": "p1", "channel_id": channel_id, "message": message, **(post or {})}
+    broadcast = {"channel_id": channel_id} if team_id is None else {"channel_id": channel_id, "team_id": team_id}
+    return Event(event_type, {"post": orjson.dumps(fields).decode(), **data}, broadcast, None, received_at)
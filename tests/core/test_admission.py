@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from botenix.core.admission import AdmissionController, Priority, ShedReason, classify
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from tests.conftest import post_event
+
+
+BOT_ID = "b" * 26
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("botenix.core.admission.time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def test_classify() -> None:
+    assert classify(Event(EventType.slash_command, {"command": "/deploy"})) is Priority.high
+    assert classify(post_event("hi", channel_type="D")) is Priority.high
+    mentioned = post_event("@bot hi", mentions=orjson.dumps([BOT_ID]).decode())
+    assert classify(mentioned, BOT_ID) is Priority.high
+    assert classify(mentioned) is Priority.low
+    assert classify(post_event("chatter"), BOT_ID) is Priority.low
+    assert classify(Event(EventType.channel_updated, {})) is Priority.normal
+
+
+def test_short_bursts_are_not_shed(clock: Clock) -> None:
+    admission = AdmissionController(target=0.05, interval=0.5)
+
+    for _ in range(4):
+        assert admission.observe(post_event("chatter", received_at=clock.now - 0.2))
+        clock.now += 0.1
+
+    assert not admission.shedding
+    assert admission.stats.total_shed == 0
+
+
+def test_sustained_overload_sheds_low_priority_until_the_delay_recovers(clock: Clock) -> None:
+    admission = AdmissionController(target=0.05, interval=0.5, user_id=BOT_ID)
+    assert admission.observe(post_event("chatter", received_at=clock.now - 0.2))
+    clock.now += 0.6
+
+    assert not admission.observe(post_event("chatter", received_at=clock.now - 0.2))
+    assert admission.observe(post_event("hi", received_at=clock.now - 0.2, channel_type="D"))
+    assert admission.observe(Event(EventType.channel_updated, {}, received_at=clock.now - 0.2))
+    assert admission.shedding
+
+    assert admission.observe(post_event("chatter", received_at=clock.now))
+    assert not admission.shedding
+    assert admission.stats.shed == {ShedReason.overload: 1}
+    assert admission.stats.admitted == {Priority.low: 2, Priority.high: 1, Priority.normal: 1}
+    assert admission.stats.overloads == 1
+    assert admission.stats.peak_delay == pytest.approx(0.2)
+
+    # An overload right after the last episode resumes shedding without waiting another interval.
+    clock.now += 0.1
+    assert not admission.observe(post_event("chatter", received_at=clock.now - 0.2))
+    assert admission.stats.overloads == 1
+
+
+def test_low_priority_events_are_sampled_while_shedding(clock: Clock) -> None:
+    admission = AdmissionController(target=0.05, interval=0.5, sample_rate=0.25)
+    admission.observe(post_event("chatter", received_at=clock.now - 0.2))
+    clock.now += 0.6
+
+    admitted = [admission.observe(post_event("chatter", received_at=clock.now - 0.2)) for _ in range(8)]
+
+    assert admitted == [False, False, False, True] * 2
+    assert admission.stats.sampled == 2
+    assert admission.stats.shed[ShedReason.overload] == 6
+
+
+def test_expired_events_are_shed_unless_high_priority(clock: Clock) -> None:
+    admission = AdmissionController(max_delay=5.0)
+
+    assert not admission.observe(Event(EventType.channel_updated, {}, received_at=clock.now - 6))
+    assert admission.observe(Event(EventType.slash_command, {"command": "/deploy"}, received_at=clock.now - 6))
+    assert admission.stats.shed == {ShedReason.expired: 1}
+
+
+async def test_shed_events_are_not_dispatched(clock: Clock) -> None:
+    admission = AdmissionController(target=0.05, interval=0.5)
+    dispatcher = Dispatcher()
+    dispatcher.add_stage(admission.observe)
+    handled: list[str | None] = []
+
+    @dispatcher.message()
+    async def record(event: Event) -> None:
+        handled.append(event.text)
+
+    await dispatcher.feed_event(post_event("first", received_at=clock.now - 0.2))
+    clock.now += 0.6
+    await dispatcher.feed_event(post_event("shed", received_at=clock.now - 0.2))
+    await dispatcher.feed_event(post_event("direct", received_at=clock.now - 0.2, channel_type="D"))
+
+    assert handled == ["first", "direct"]
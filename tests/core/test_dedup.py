@@ -0,0 +1,93 @@
+import pytest
+
+from botenix.core.dedup import DedupFilter, event_key
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from tests.conftest import post_event
+
+
+def test_event_keys() -> None:
+    webhook = Event(EventType.outgoing_webhook, {"post_id": "p1", "text": "hi"})
+
+    assert event_key(post_event("p1")) == "posted:p1"
+    assert event_key(webhook) == "outgoing_webhook:p1"
+    assert event_key(post_event(event_type=EventType.post_edited, post={"edit_at": 1})) != event_key(
+        post_event(event_type=EventType.post_edited, post={"edit_at": 2})
+    )
+    assert event_key(Event(EventType.typing, {}, {"channel_id": "c1"})) is None
+
+
+async def test_duplicates_are_dropped_per_event_type() -> None:
+    dedup = DedupFilter(capacity=1000)
+    dispatcher = Dispatcher()
+    dispatcher.add_stage(dedup.observe)
+    handled: list[str | None] = []
+
+    @dispatcher.message()
+    async def record(event: Event) -> None:
+        handled.append(event.text)
+
+    await dispatcher.feed_event(post_event("p1"))
+    await dispatcher.feed_event(post_event("p1"))
+    await dispatcher.feed_event(post_event("p2", post={"id": "p2"}))
+
+    assert handled == ["p1", "p2"]
+    assert (dedup.stats.checked, dedup.stats.duplicates) == (3, 1)
+
+
+async def test_message_handler_runs_after_the_webhook_copy() -> None:
+    dedup = DedupFilter(capacity=1000)
+    dispatcher = Dispatcher()
+    dispatcher.add_stage(dedup.observe)
+    handled: list[str | None] = []
+
+    @dispatcher.message()
+    async def record(event: Event) -> None:
+        handled.append(event.text)
+
+    webhook = Event(EventType.outgoing_webhook, {"post_id": "p1", "text": "p1"})
+    await dispatcher.feed_event(webhook)
+    await dispatcher.feed_event(webhook)
+    await dispatcher.feed_event(post_event("p1"))
+
+    assert handled == ["p1"]
+    assert dedup.stats.duplicates == 1
+
+
+def test_keys_are_forgotten_after_two_windows() -> None:
+    dedup = DedupFilter(capacity=3, error_rate=1e-6, window=3600)
+    assert not dedup.add("a")
+    for key in ("b", "c", "d"):
+        dedup.add(key)
+    assert dedup.stats.rotations == 1
+    assert "a" in dedup
+    assert dedup.add("a")
+
+    for key in ("e", "f", "g", "h", "i", "j"):
+        dedup.add(key)
+    assert "d" not in dedup
+    assert not dedup.add("d")
+
+
+def test_memory_is_fixed_and_false_positive_rate_is_bounded() -> None:
+    dedup = DedupFilter(capacity=20_000, error_rate=0.01)
+    assert dedup.memory == 16 * dedup.blocks
+    assert dedup.memory < 20_000 * 4
+
+    for index in range(20_000):
+        dedup.add(f"known-{index}")
+    false_positives = sum(f"new-{index}" in dedup for index in range(20_000))
+
+    assert all(f"known-{index}" in dedup for index in range(20_000))
+    assert false_positives < 20_000 * 0.02
+    assert dedup.memory < 20_000 * 4
+
+    dedup.clear()
+    assert "known-1" not in dedup
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(ValueError, match="error rate"):
+        DedupFilter(error_rate=1)
+    with pytest.raises(ValueError, match="Capacity"):
+        DedupFilter(capacity=0)
@@ -0,0 +1,204 @@
+import re
+from typing import Any
+
+import pytest
+
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.core.router import Router
+from tests.conftest import post_event
+
+
+@pytest.fixture
+def calls() -> list[Any]:
+    return []
+
+
+@pytest.fixture
+def dispatcher(calls: list[Any]) -> Dispatcher:
+    dispatcher = Dispatcher()
+
+    @dispatcher.message(command="deploy")
+    async def deploy(event: Event) -> None:  # noqa: ARG001
+        calls.append("deploy")
+
+    @dispatcher.message(regexp=r"ticket #(?P<number>\d+)")
+    async def ticket(event: Event, match: re.Match[str]) -> None:  # noqa: ARG001
+        calls.append(("ticket", match.group("number")))
+
+    @dispatcher.message(prefix="hello")
+    async def hello(event: Event) -> None:  # noqa: ARG001
+        calls.append("hello")
+
+    @dispatcher.message(channel_id="c2")
+    async def channel_two(event: Event) -> None:  # noqa: ARG001
+        calls.append("channel_two")
+
+    @dispatcher.event(EventType.reaction_added)
+    async def reaction(event: Event) -> None:  # noqa: ARG001
+        calls.append("reaction")
+
+    return dispatcher
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        (post_event("!deploy production"), ["deploy"]),
+        (post_event("/DEPLOY"), ["deploy"]),
+        (post_event("see ticket #42 please"), [("ticket", "42")]),
+        (post_event("hello there"), ["hello"]),
+        (post_event("anything", channel_id="c2"), ["channel_two"]),
+        (Event(EventType.reaction_added, {}, {"channel_id": "c1"}), ["reaction"]),
+        (post_event("nothing matches"), []),
+        (Event(EventType.typing, {}, {"channel_id": "c1"}), []),
+    ],
+)
+async def test_routing(dispatcher: Dispatcher, calls: list[Any], event: Event, expected: list[Any]) -> None:
+    handled = await dispatcher.feed_event(event)
+
+    assert handled is bool(expected)
+    assert calls == expected
+
+
+async def test_first_registered_handler_wins_across_nested_routers(calls: list[Any]) -> None:
+    dispatcher = Dispatcher()
+    child, grandchild = Router("child"), Router("grandchild")
+    dispatcher.include_router(child)
+    child.include_router(grandchild)
+
+    @grandchild.message(regexp="help")
+    async def nested(event: Event) -> None:  # noqa: ARG001
+        calls.append("nested")
+
+    @child.message(prefix="!help")
+    async def child_help(event: Event) -> None:  # noqa: ARG001
+        calls.append("child")
+
+    @dispatcher.message(lambda event: event.channel_id == "other", prefix="!")
+    async def root(event: Event) -> None:  # noqa: ARG001
+        calls.append("root")
+
+    await dispatcher.feed_event(post_event("!help"))
+    await dispatcher.feed_event(post_event("need help"))
+
+    assert calls == ["child", "nested"]
+
+
+async def test_filters_fall_back_to_later_text_handlers(calls: list[Any]) -> None:
+    dispatcher = Dispatcher()
+
+    @dispatcher.message(lambda _: False, regexp="deploy")
+    async def never(event: Event) -> None:  # noqa: ARG001
+        calls.append("never")
+
+    @dispatcher.message(regexp=r"(\w+) \1")
+    async def repeated(event: Event) -> None:  # noqa: ARG001
+        calls.append("repeated")
+
+    @dispatcher.message(regexp=re.compile(r"DEPLOY", re.IGNORECASE))
+    async def deploy(event: Event) -> None:  # noqa: ARG001
+        calls.append("deploy")
+
+    await dispatcher.feed_event(post_event("please deploy"))
+    await dispatcher.feed_event(post_event("deploy deploy"))
+
+    assert calls == ["deploy", "repeated"]
+
+
+async def test_command_and_pattern_are_combined(calls: list[Any]) -> None:
+    dispatcher = Dispatcher()
+
+    @dispatcher.message(command="ban", regexp=r"@\w+")
+    async def ban(event: Event) -> None:  # noqa: ARG001
+        calls.append("ban")
+
+    assert not await dispatcher.feed_event(post_event("!ban"))
+    assert await dispatcher.feed_event(post_event("!ban @spammer"))
+    assert calls == ["ban"]
+
+
+async def test_scopes_by_team(calls: list[Any]) -> None:
+    dispatcher = Dispatcher()
+
+    @dispatcher.message(team_id="t2")
+    async def team_two(event: Event) -> None:  # noqa: ARG001
+        calls.append("team_two")
+
+    assert not await dispatcher.feed_event(post_event("hi", team_id="t1"))
+    assert await dispatcher.feed_event(post_event("hi", team_id="t2"))
+
+
+async def test_context_is_injected_by_parameter_name(calls: list[Any]) -> None:
+    dispatcher = Dispatcher()
+    dispatcher.context["bot"] = "the-bot"
+
+    @dispatcher.message(command="who")
+    async def who(event: Event, bot: str) -> None:  # noqa: ARG001
+        calls.append(bot)
+
+    @dispatcher.message()
+    async def everything(event: Event, **kwargs: object) -> None:  # noqa: ARG001
+        calls.append(sorted(kwargs))
+
+    await dispatcher.feed_event(post_event("!who"))
+    await dispatcher.feed_event(post_event("other"))
+
+    assert calls == ["the-bot", ["bot", "match"]]
+
+
+async def test_handler_errors_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    dispatcher = Dispatcher()
+
+    @dispatcher.message()
+    async def broken(event: Event) -> None:
+        raise RuntimeError(event.text)
+
+    assert await dispatcher.feed_event(post_event("boom"))
+    assert "broken failed" in caplog.text
+
+
+async def test_stages_run_before_routing_and_can_drop_events(dispatcher: Dispatcher, calls: list[Any]) -> None:
+    seen: list[str | None] = []
+
+    @dispatcher.add_stage
+    def record(event: Event) -> bool:
+        seen.append(event.text)
+        return True
+
+    dispatcher.add_stage(lambda event: event.text != "!deploy staging")
+
+    assert await dispatcher.feed_event(post_event("!deploy production"))
+    assert not await dispatcher.feed_event(post_event("!deploy staging"))
+    assert not await dispatcher.feed_event(post_event("nothing matches"))
+    assert seen == ["!deploy production", "!deploy staging", "nothing matches"]
+    assert calls == ["deploy"]
+
+
+def test_include_router_rejects_cycles_and_double_inclusion() -> None:
+    parent, child = Router("parent"), Router("child")
+    parent.include_router(child)
+
+    with pytest.raises(ValueError, match="already included"):
+        Router().include_router(child)
+    with pytest.raises(ValueError, match="cycle"):
+        child.include_router(parent)
+
+
+async def test_handlers_added_after_the_first_event_are_dispatched(dispatcher: Dispatcher, calls: list[Any]) -> None:
+    assert not await dispatcher.feed_event(post_event("!status"))
+    router = dispatcher.include_router(Router("late"))
+
+    @router.message(command="status")
+    async def status(event: Event) -> None:  # noqa: ARG001
+        calls.append("status")
+
+    assert await dispatcher.feed_event(post_event("!status"))
+    nested = router.include_router(Router("nested"))
+
+    @nested.message(command="version")
+    async def version(event: Event) -> None:  # noqa: ARG001
+        calls.append("version")
+
+    assert await dispatcher.feed_event(post_event("!version"))
+    assert calls == ["status", "version"]
@@ -0,0 +1,109 @@
+import asyncio
+
+import orjson
+import pytest
+
+from botenix.core.events.event import Event, EventType
+from botenix.core.events.event_queue import EventQueue, OverflowPolicy
+from botenix.exceptions import QueueClosedError
+
+
+def make_event(seq: int) -> Event:
+    post = orjson.dumps({"id": f"post-{seq}", "channel_id": "channel", "message": "hi"}).decode()
+    return Event(EventType.posted, {"post": post}, {"channel_id": "channel", "team_id": "team"}, seq)
+
+
+def test_event_from_json_decodes_post_lazily() -> None:
+    raw = orjson.dumps({
+        "event": "posted",
+        "data": {"post": orjson.dumps({"id": "p1", "channel_id": "c1"}).decode(), "user_id": "u1"},
+        "broadcast": {"team_id": "t1", "channel_id": ""},
+        "seq": 3,
+    })
+
+    event = Event.from_json(raw)
+
+    assert event is not None
+    assert (event.type, event.seq) == ("posted", 3)
+    assert event.post == {"id": "p1", "channel_id": "c1"}
+    assert event.post is event.post
+    assert (event.channel_id, event.team_id, event.user_id) == ("c1", "t1", "u1")
+    assert Event.from_json(event.to_json()).post == event.post  # type: ignore[union-attr]
+
+
+def test_action_replies_are_not_events() -> None:
+    assert Event.from_json(b'{"status": "OK", "seq_reply": 1}') is None
+
+
+async def test_queue_preserves_order() -> None:
+    queue = EventQueue(maxsize=10)
+    for seq in range(5):
+        await queue.put(make_event(seq))
+
+    assert [(await queue.get()).seq for _ in range(5)] == list(range(5))
+
+
+async def test_block_policy_waits_for_consumer() -> None:
+    queue = EventQueue(maxsize=1, overflow=OverflowPolicy.block)
+    await queue.put(make_event(0))
+
+    producer = asyncio.create_task(queue.put(make_event(1)))
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    assert (await queue.get()).seq == 0
+    await producer
+    assert (await queue.get()).seq == 1
+
+
+async def test_drop_oldest_policy() -> None:
+    queue = EventQueue(maxsize=2, overflow=OverflowPolicy.drop_oldest)
+    for seq in range(5):
+        await queue.put(make_event(seq))
+
+    assert queue.dropped == 3
+    assert [(await queue.get()).seq for _ in range(2)] == [3, 4]
+
+
+async def test_spill_policy_keeps_every_event_in_order() -> None:
+    queue = EventQueue(maxsize=2, overflow=OverflowPolicy.spill)
+    sent = [make_event(seq) for seq in range(10)]
+    for event in sent:
+        await queue.put(event)
+
+    assert queue.spilled == 8
+    assert queue.qsize() == 10
+    events = [await queue.get() for _ in range(10)]
+    assert [event.seq for event in events] == list(range(10))
+    assert [event.received_at for event in events] == [event.received_at for event in sent]
+    assert events[-1].post == {"id": "post-9", "channel_id": "channel", "message": "hi"}
+    assert queue.spilled == 0
+
+
+async def test_closed_queue_drains_then_stops() -> None:
+    queue = EventQueue(maxsize=2)
+    await queue.put(make_event(0))
+    await queue.close()
+
+    assert (await queue.get()).seq == 0
+    with pytest.raises(QueueClosedError):
+        await queue.get()
+    with pytest.raises(QueueClosedError):
+        await queue.put(make_event(1))
+
+
+async def test_close_wakes_blocked_producer() -> None:
+    queue = EventQueue(maxsize=1)
+    await queue.put(make_event(0))
+    producer = asyncio.create_task(queue.put(make_event(1)))
+    await asyncio.sleep(0)
+
+    await queue.close()
+
+    with pytest.raises(QueueClosedError):
+        await producer
+
+
+def test_invalid_queue_size() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        EventQueue(maxsize=0)
@@ -0,0 +1,141 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event
+from botenix.core.executor import HandlerExecutor, Ordering
+from botenix.exceptions import QueueClosedError
+from tests.conftest import post_event
+
+
+async def test_events_of_one_channel_run_in_order() -> None:
+    executor = HandlerExecutor(shards=4, max_concurrency=8)
+    seen: list[tuple[str, int]] = []
+
+    async def job(channel_id: str, index: int) -> None:
+        # Earlier jobs sleep longer: without ordering they would finish last.
+        await asyncio.sleep(0.005 * (5 - index))
+        seen.append((channel_id, index))
+
+    for index in range(5):
+        for channel_id in ("a", "b"):
+            await executor.submit(post_event(channel_id=channel_id), partial(job, channel_id, index))
+    await executor.close()
+
+    for channel_id in ("a", "b"):
+        assert [index for channel, index in seen if channel == channel_id] == list(range(5))
+    assert executor.stats().processed == 10
+
+
+async def test_shards_run_concurrently_up_to_the_cap() -> None:
+    executor = HandlerExecutor(shards=8, max_concurrency=2)
+    peak = 0
+
+    async def job() -> None:
+        nonlocal peak
+        peak = max(peak, executor.running)
+        await asyncio.sleep(0.01)
+
+    channels = [f"channel-{index}" for index in range(20)]
+    for channel_id in channels:
+        await executor.submit(post_event(channel_id=channel_id), job)
+    await executor.join()
+
+    assert peak == 2
+    await executor.close()
+
+
+async def test_slow_channel_does_not_block_others_on_its_shard() -> None:
+    executor = HandlerExecutor(shards=1, max_concurrency=4)
+    release = asyncio.Event()
+    done: list[str] = []
+
+    async def job(channel_id: str) -> None:
+        if channel_id == "slow":
+            await release.wait()
+        done.append(channel_id)
+
+    for channel_id in ("slow", "slow", "a", "b", "c"):
+        await executor.submit(post_event(channel_id=channel_id), partial(job, channel_id))
+    await asyncio.sleep(0.01)
+
+    assert done == ["a", "b", "c"]
+    assert executor.stats().queue_depths == (1,)
+    release.set()
+    await executor.close()
+    assert done == ["a", "b", "c", "slow", "slow"]
+
+
+def test_thread_ordering_groups_replies_with_their_root() -> None:
+    executor = HandlerExecutor(ordering=Ordering.thread)
+
+    root = post_event(channel_id="a", post={"id": "root"})
+    reply = post_event(channel_id="b", post={"id": "reply", "root_id": "root"})
+
+    assert executor.shard_key(root) == executor.shard_key(reply) == "root"
+    assert HandlerExecutor().shard_key(reply) == "b"
+
+
+async def test_full_shard_queue_applies_backpressure() -> None:
+    executor = HandlerExecutor(shards=1, shard_queue_size=1)
+    release = asyncio.Event()
+
+    await executor.submit(post_event(channel_id="a"), release.wait)
+    await asyncio.sleep(0)
+    await executor.submit(post_event(channel_id="a"), release.wait)
+    blocked = asyncio.create_task(executor.submit(post_event(channel_id="a"), release.wait))
+    await asyncio.sleep(0.01)
+
+    assert not blocked.done()
+    assert executor.queue_depth() == 1
+    release.set()
+    await blocked
+    await executor.close()
+
+
+async def test_failures_and_latency_are_recorded(caplog: pytest.LogCaptureFixture) -> None:
+    executor = HandlerExecutor(shards=2)
+
+    async def broken() -> None:
+        raise RuntimeError
+
+    await executor.submit(post_event(channel_id="a"), broken)
+    await executor.submit(post_event(channel_id="b"), lambda: asyncio.sleep(0.01))
+    await executor.close()
+    stats = executor.stats()
+
+    assert (stats.processed, stats.failed, stats.queue_depth) == (2, 1, 0)
+    assert stats.latency_max >= 0.01
+    assert "Handler job failed" in caplog.text
+    with pytest.raises(QueueClosedError):
+        await executor.submit(post_event(channel_id="a"), broken)
+
+
+async def test_dispatcher_submits_handlers_to_executor() -> None:
+    dispatcher = Dispatcher(executor=HandlerExecutor())
+    handled: list[str | None] = []
+
+    @dispatcher.message()
+    async def echo(event: Event) -> None:
+        handled.append(event.channel_id)
+
+    assert await dispatcher.feed_event(post_event(channel_id="a"))
+    await dispatcher.close()
+
+    assert handled == ["a"]
+
+
+async def test_handler_failures_are_counted_by_the_executor() -> None:
+    dispatcher = Dispatcher(executor=HandlerExecutor())
+
+    @dispatcher.message()
+    async def broken(event: Event) -> None:
+        raise RuntimeError(event.text)
+
+    await dispatcher.feed_event(post_event(channel_id="a"))
+    await dispatcher.close()
+
+    assert dispatcher.executor is not None
+    assert dispatcher.executor.stats().failed == 1
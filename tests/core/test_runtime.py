@@ -0,0 +1,125 @@
+import asyncio
+import multiprocessing
+import os
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator
+from multiprocessing.queues import SimpleQueue
+
+import pytest
+
+from botenix.core.bot import Bot
+from botenix.core.events.event import Event, EventType
+from botenix.core.runtime import ShardedRuntime, jump_hash
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.rate_limiter import RateLimiter
+from tests.conftest import post_event
+
+
+Handled = tuple[int, str | None, str | None]
+
+
+def make_bot(results: SimpleQueue[Handled]) -> Bot:
+    bot = Bot("token", "http://testserver.com")
+
+    @bot.message()
+    async def record(event: Event) -> None:
+        if event.text == "crash":
+            os._exit(1)
+        results.put((os.getpid(), event.channel_id, event.text))
+
+    return bot
+
+
+def drain(results: SimpleQueue[Handled]) -> list[Handled]:
+    handled = []
+    while not results.empty():
+        handled.append(results.get())
+    return handled
+
+
+@pytest.fixture
+def results() -> SimpleQueue[Handled]:
+    return multiprocessing.get_context("fork").SimpleQueue()
+
+
+def test_jump_hash_is_stable_and_moves_few_keys() -> None:
+    keys = [f"channel-{index}" for index in range(2000)]
+    before = [jump_hash(key, 4) for key in keys]
+    after = [jump_hash(key, 5) for key in keys]
+
+    assert before == [jump_hash(key, 4) for key in keys]
+    assert set(before) == {0, 1, 2, 3}
+    assert min(Counter(before).values()) > 400
+    moved = [(old, new) for old, new in zip(before, after, strict=True) if old != new]
+    assert all(new == 4 for _, new in moved)
+    assert 300 < len(moved) < 500
+    with pytest.raises(ValueError, match="bucket"):
+        jump_hash("key", 0)
+
+
+async def test_events_of_a_channel_are_handled_in_order_by_one_worker(results: SimpleQueue[Handled]) -> None:
+    runtime = ShardedRuntime(make_bot(results), 3)
+    await runtime.start()
+    events = [post_event(f"m{index}", channel_id=f"c{index % 6}") for index in range(60)]
+    await runtime.serve(_aiter(events))
+    await runtime.stop()
+
+    handled = drain(results)
+    assert len(handled) == 60
+    assert sum(runtime.routed) == 60
+    by_channel: dict[str | None, list[Handled]] = defaultdict(list)
+    for item in handled:
+        by_channel[item[1]].append(item)
+    for channel_id, items in by_channel.items():
+        assert len({pid for pid, *_ in items}) == 1
+        assert [text for *_, text in items] == [f"m{index}" for index in range(60) if f"c{index % 6}" == channel_id]
+    assert all(pid is not None for pid in runtime.pids())
+
+
+async def test_crashed_worker_is_restarted(results: SimpleQueue[Handled]) -> None:
+    runtime = ShardedRuntime(make_bot(results), 2, restart_delay=0.01)
+    await runtime.start()
+    pids = runtime.pids()
+    crash = post_event("crash", channel_id="c1")
+    await runtime.feed_event(crash)
+
+    async with asyncio.timeout(5):
+        while runtime.restarts == 0:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+    await runtime.feed_event(post_event("after", channel_id="c1"))
+    await runtime.stop()
+
+    index = runtime.worker_for(crash)
+    assert runtime.pids()[index] != pids[index]
+    assert [text for *_, text in drain(results)] == ["after"]
+
+
+async def test_rate_limit_budget_is_shared_with_workers(results: SimpleQueue[Handled]) -> None:
+    limiter = RateLimiter(rate=0.001, burst=10)
+    bot = make_bot(results)
+    bot.http_client = HttpClient("http://testserver.com", rate_limiter=limiter)
+
+    @bot.event(EventType.typing)
+    async def spend(event: Event) -> None:  # noqa: ARG001
+        for _ in range(4):
+            await limiter.acquire("key")
+        results.put((os.getpid(), None, "spent"))
+
+    runtime = ShardedRuntime(bot, 2)
+    await runtime.start()
+    await runtime.feed_event(Event(EventType.typing, {}, {"channel_id": "c1"}))
+    await runtime.stop()
+
+    assert limiter.shared
+    assert [text for *_, text in drain(results)] == ["spent"]
+    assert limiter._bucket("key").tokens == pytest.approx(6, abs=0.1)  # noqa: SLF001
+
+
+def test_invalid_worker_count() -> None:
+    with pytest.raises(ValueError, match="worker"):
+        ShardedRuntime(Bot("token"), 0)
+
+
+async def _aiter(events: list[Event]) -> AsyncIterator[Event]:
+    for event in events:
+        yield event
@@ -0,0 +1,111 @@
+import asyncio
+from collections.abc import AsyncIterator
+from functools import partial
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from botenix.integration.clients.base import BaseApiClient
+from botenix.integration.utils.bulk import BulkResult, Operation, bulk
+from botenix.integration.utils.http_client import HttpClient
+
+
+async def test_bulk_runs_operations_under_the_limit() -> None:
+    running = peak = 0
+
+    async def operation(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (value % 3))
+        running -= 1
+        return value * 2
+
+    results = [result async for result in bulk((partial(operation, value) for value in range(50)), concurrency=5)]
+
+    assert peak == 5
+    assert sorted(result.index for result in results) == list(range(50))
+    assert all(result.unwrap() == result.index * 2 for result in results)
+
+
+async def test_failures_are_reported_per_item() -> None:
+    async def operation(value: int) -> int:
+        if value % 2:
+            raise ValueError(value)
+        return value
+
+    results = {result.index: result async for result in bulk(partial(operation, value) for value in range(4))}
+
+    assert [results[index].ok for index in range(4)] == [True, False, True, False]
+    assert isinstance(results[1].error, ValueError)
+    with pytest.raises(ValueError, match="3"):
+        results[3].unwrap()
+
+
+async def test_async_iterable_of_operations_is_consumed_lazily() -> None:
+    pulled = 0
+
+    async def echo(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    async def operations() -> AsyncIterator[Operation[int]]:
+        nonlocal pulled
+        for value in range(100):
+            pulled += 1
+            yield partial(echo, value)
+
+    async for result in bulk(operations(), concurrency=3):
+        assert pulled <= result.index + 4
+        if result.index >= 5:
+            break
+
+
+async def test_breaking_out_cancels_running_operations() -> None:
+    cancelled = 0
+
+    async def operation(delay: float) -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    results = bulk([partial(operation, 0), partial(operation, 10), partial(operation, 10)], concurrency=3)
+    async for _ in results:
+        break
+    await results.aclose()
+
+    assert cancelled == 2
+
+
+async def test_bulk_posts_through_the_client(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_callback(lambda request: httpx.Response(201, json={"channel": request.url.path}), is_reusable=True)
+    client = BaseApiClient(HttpClient("http://testserver.com", limits=httpx.Limits(max_connections=4)))
+    channels = [f"c{index}" for index in range(10)]
+
+    results: list[BulkResult[object]] = [
+        result
+        async for result in client.bulk(
+            partial(client.http_client.post, f"/api/v4/{channel}", json={"message": "hi"}) for channel in channels
+        )
+    ]
+
+    assert client.http_client.bulk_concurrency == 4
+    assert sorted(result.unwrap()["channel"] for result in results) == sorted(f"/api/v4/{c}" for c in channels)  # type: ignore[index]
+    await client.http_client.close()
+
+
+async def test_bulk_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="Concurrency"):
+        await anext(bulk([], concurrency=0))
+
+
+async def test_custom_transport_and_http2() -> None:
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, json={"http2": True}))
+    client = HttpClient("http://testserver.com", http2=True, transport=transport)
+
+    assert await client.get("/api/v4/system/ping") == {"http2": True}
+    await client.close()
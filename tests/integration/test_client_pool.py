@@ -0,0 +1,80 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
+
+from botenix.integration.utils.client_pool import ClientPool
+
+
+@pytest.fixture
+async def pool() -> AsyncGenerator[ClientPool]:
+    pool = ClientPool(idle_timeout=60)
+    yield pool
+    await pool.close()
+
+
+async def test_tenants_share_one_connection_pool_per_server(pool: ClientPool, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_callback(
+        lambda request: Response(200, json={"authorization": request.headers["Authorization"]}), is_reusable=True
+    )
+
+    first = pool.client("http://one.test/", "token-1")
+    second = pool.client("http://one.test", "token-2")
+    other_server = pool.client("http://two.test", "token-1")
+
+    assert pool.client("http://one.test", "token-1") is first
+    assert (len(pool), pool.servers) == (3, 2)
+    assert first._client is second._client  # noqa: SLF001
+    assert first._client is not other_server._client  # noqa: SLF001
+    assert await first.get("/api/v4/users/me") == {"authorization": "Bearer token-1"}
+    assert await second.get("/api/v4/users/me") == {"authorization": "Bearer token-2"}
+
+
+async def test_closing_a_tenant_keeps_the_shared_connections_open(pool: ClientPool, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={}, is_reusable=True)
+    first = pool.client("http://one.test", "token-1")
+    second = pool.client("http://one.test", "token-2")
+
+    await first.close()
+
+    assert await second.get("/api/v4/users/me") == {}
+
+
+async def test_each_tenant_has_its_own_concurrency_limit(httpx_mock: HTTPXMock) -> None:
+    in_flight = {"token-1": 0, "token-2": 0}
+    peak = dict(in_flight)
+
+    async def respond(request: Request) -> Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        in_flight[token] += 1
+        peak[token] = max(peak[token], in_flight[token])
+        await asyncio.sleep(0.01)
+        in_flight[token] -= 1
+        return Response(200, json={})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    async with ClientPool(max_concurrency=2) as pool:
+        clients = [pool.client("http://one.test", "token-1"), pool.client("http://one.test", "token-2")]
+        await asyncio.gather(*(client.get("/api/v4/users/me") for client in clients for _ in range(6)))
+
+    assert peak == {"token-1": 2, "token-2": 2}
+
+
+async def test_idle_tenants_are_evicted_with_their_rate_limit_buckets(pool: ClientPool, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={}, is_reusable=True)
+    idle = pool.client("http://one.test", "token-1")
+    active = pool.client("http://one.test", "token-2")
+    await idle.get("/api/v4/users/me")
+    await active.get("/api/v4/users/me")
+    assert len(pool.rate_limiter._buckets) == 2  # noqa: SLF001
+
+    idle.last_used -= 61
+
+    assert pool.evict_idle() == 1
+    assert ("http://one.test", "token-1") not in pool
+    assert ("http://one.test", "token-2") in pool
+    assert len(pool.rate_limiter._buckets) == 1  # noqa: SLF001
+    assert pool.client("http://one.test", "token-1") is not idle
+    assert await idle.get("/api/v4/users/me") == {}
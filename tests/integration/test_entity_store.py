@@ -0,0 +1,170 @@
+import asyncio
+import operator
+from collections.abc import AsyncIterator
+
+import httpx
+import orjson
+import pytest
+from pytest_httpx import HTTPXMock
+
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.integration.clients.models.channels import ChannelType
+from botenix.integration.clients.models.users import User
+from botenix.integration.services.entity_store import EntityCache, EntityStore
+from botenix.integration.utils.http_client import HttpClient
+
+
+BASE_URL = "http://testserver.com"
+
+
+def user(user_id: str, username: str, **fields: object) -> dict[str, object]:
+    return {"id": user_id, "username": username, **fields}
+
+
+def channel(channel_id: str, name: str, team_id: str = "t1") -> dict[str, object]:
+    return {"id": channel_id, "team_id": team_id, "type": "O", "name": name, "display_name": name.title()}
+
+
+@pytest.fixture
+async def store() -> AsyncIterator[EntityStore]:
+    store = EntityStore(HttpClient(BASE_URL))
+    yield store
+    await store.http_client.close()
+
+
+def test_cache_evicts_least_recently_used_and_keeps_name_index() -> None:
+    cache: EntityCache[str, str] = EntityCache(2, ttl=60, name_of=str.upper)
+    cache.put("a", "a")
+    cache.put("b", "b")
+    assert cache.get("a") == "a"
+    cache.put("c", "c")
+
+    assert "b" not in cache
+    assert cache.get_by_name("B") is None
+    assert cache.get_by_name("A") == "a"
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_cache_expires_entries() -> None:
+    cache: EntityCache[str, str] = EntityCache(10, ttl=0)
+    cache.put("a", "a")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_renamed_entity_is_indexed_by_its_new_name_only() -> None:
+    cache: EntityCache[str, dict[str, str]] = EntityCache(10, ttl=60, name_of=operator.itemgetter("name"))
+    cache.put("u1", {"name": "old"})
+    cache.put("u1", {"name": "new"})
+
+    assert cache.get_by_name("old") is None
+    assert cache.get_by_name("new") == {"name": "new"}
+
+
+async def test_lookups_hit_the_api_once(httpx_mock: HTTPXMock, store: EntityStore) -> None:
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/users/u1", json=user("u1", "alice", first_name="Alice"))
+
+    first, second = await asyncio.gather(store.get_user("u1"), store.get_user("u1"))
+
+    assert first is second
+    assert first.display_name == "Alice"
+    assert await store.get_user_by_username("alice") is first
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_lookup_by_name_fills_the_id_index(httpx_mock: HTTPXMock, store: EntityStore) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v4/teams/t1/channels/name/town-square", json=channel("c1", "town-square")
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/teams/name/core", json={"id": "t1", "name": "core"})
+
+    town_square = await store.get_channel_by_name("t1", "town-square")
+
+    assert town_square.type is ChannelType.open
+    assert await store.get_channel("c1") is town_square
+    assert (await store.get_team_by_name("core")).id == "t1"
+    assert (await store.get_team("t1")).name == "core"
+
+
+async def test_get_users_requests_only_missing_ids(httpx_mock: HTTPXMock, store: EntityStore) -> None:
+    store.users.put("u1", User.model_validate(user("u1", "alice")))
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/users/ids", json=[user("u2", "bob")])
+
+    users = await store.get_users(["u1", "u2", "u3", "u1"])
+
+    assert sorted(users) == ["u1", "u2"]
+    assert orjson.loads(httpx_mock.get_requests()[0].content) == ["u2", "u3"]
+
+
+async def test_memberships_are_cached_including_negative_answers(httpx_mock: HTTPXMock, store: EntityStore) -> None:
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/channels/c1/members/u1", json={"channel_id": "c1"})
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/teams/t1/members/u1", status_code=404)
+
+    assert await store.is_channel_member("c1", "u1")
+    assert await store.is_channel_member("c1", "u1")
+    assert not await store.is_team_member("t1", "u1")
+    assert not await store.is_team_member("t1", "u1")
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_membership_errors_are_raised(httpx_mock: HTTPXMock, store: EntityStore) -> None:
+    httpx_mock.add_response(status_code=403)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await store.is_channel_member("c1", "u1")
+
+
+async def test_events_update_the_store(store: EntityStore) -> None:
+    events = [
+        Event(EventType.user_updated, {"user": user("u1", "alice")}),
+        Event(EventType.channel_updated, {"channel": orjson.dumps(channel("c1", "town-square")).decode()}),
+        Event(EventType.update_team, {"team": orjson.dumps({"id": "t1", "name": "core"}).decode()}),
+        Event(EventType.user_added, {"user_id": "u1", "team_id": "t1"}, {"channel_id": "c1"}),
+        Event(EventType.added_to_team, {"team_id": "t1", "user_id": "u1"}),
+    ]
+    for event in events:
+        assert store.observe(event)
+
+    assert (await store.get_user_by_username("alice")).id == "u1"
+    assert (await store.get_channel_by_name("t1", "town-square")).id == "c1"
+    assert (await store.get_team_by_name("core")).id == "t1"
+    assert await store.is_channel_member("c1", "u1")
+    assert await store.is_team_member("t1", "u1")
+
+    store.observe(Event(EventType.user_updated, {"user": user("u1", "alice2")}))
+    store.observe(Event(EventType.user_removed, {"channel_id": "c1", "remover_id": "u2"}, {"user_id": "u1"}))
+    store.observe(Event(EventType.leave_team, {"team_id": "t1", "user_id": "u1"}))
+    store.observe(Event(EventType.channel_deleted, {"channel_id": "c1"}))
+    store.observe(Event(EventType.delete_team, {"team": orjson.dumps({"id": "t1", "name": "core"}).decode()}))
+
+    assert store.users.get_by_name("alice") is None
+    assert store.users.get_by_name("alice2") is not None
+    assert not await store.is_channel_member("c1", "u1")
+    assert not await store.is_team_member("t1", "u1")
+    assert "c1" not in store.channels
+    assert "t1" not in store.teams
+
+
+async def test_malformed_events_are_logged(store: EntityStore, caplog: pytest.LogCaptureFixture) -> None:
+    assert store.observe(Event(EventType.channel_updated, {"channel": "{not json"}))
+    assert store.observe(Event(EventType.user_updated, {"user": {"id": "u1"}}))
+
+    assert len(store.users) == 0
+    assert "Cannot apply" in caplog.text
+
+
+async def test_store_observes_events_before_handlers(store: EntityStore) -> None:
+    dispatcher = Dispatcher()
+    dispatcher.add_stage(store.observe)
+    seen: list[str] = []
+
+    @dispatcher.event(EventType.user_updated)
+    async def on_user_updated(event: Event) -> None:  # noqa: ARG001
+        seen.append((await store.get_user("u1")).username)
+
+    await dispatcher.feed_event(Event(EventType.user_updated, {"user": user("u1", "alice")}))
+
+    assert seen == ["alice"]
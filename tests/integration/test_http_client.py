@@ -1,14 +1,18 @@
+import tracemalloc
 from collections.abc import AsyncGenerator, Sequence
 from contextlib import nullcontext as does_not_raise
+from pathlib import Path
 from typing import Any
 
 import orjson
 import pytest
-from httpx import RequestError
+from httpx import HTTPStatusError, RequestError
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
-from pytest_httpx import HTTPXMock
+from pytest_httpx import HTTPXMock, IteratorStream
 
+from botenix.integration.annotations import RequestJson
 from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.type_adapters import type_adapters
 
 
 class TestRequestModel(BaseModel):
@@ -275,3 +279,106 @@ async def test_request_with_serialization_parameters(  # noqa: PLR0913, PLR0917
     assert request.method == "POST"
     assert request.url == "http://testserver.com/test-path"
     assert orjson.loads(request.content) == expected_payload
+
+
+async def test_response_model_validated_from_raw_bytes(
+    http_client: HttpClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_loads(_: bytes) -> None:
+        raise AssertionError("response body must not be decoded into a dict")
+
+    monkeypatch.setattr(orjson, "loads", fail_loads)
+    httpx_mock.add_response(url="http://testserver.com/test-path", json=[{"id": 1, "name": "John", "age": 30}])
+
+    response = await http_client.get("/test-path", response_model=list[TestResponseModel])
+
+    assert response == [TestResponseModel(id=1, name="John", age=30)]
+    assert list[TestResponseModel] in type_adapters
+
+
+@pytest.mark.parametrize(
+    ("json", "expected_content"),
+    [
+        ({"name": "John", "tags": ["a", "b"]}, b'{"name":"John","tags":["a","b"]}'),
+        ('{"name":"John"}', b'{"name":"John"}'),
+        (b'{"name":"John"}', b'{"name":"John"}'),
+        ({"props": {1: "one", 2.5: "half", None: "none"}}, b'{"props":{"1":"one","2.5":"half","null":"none"}}'),
+    ],
+)
+async def test_json_body_is_sent_as_encoded_bytes(
+    http_client: HttpClient, httpx_mock: HTTPXMock, json: RequestJson, expected_content: bytes
+) -> None:
+    httpx_mock.add_response(url="http://testserver.com/test-path", json={"success": True})
+
+    await http_client.post("/test-path", json=json)
+
+    request = httpx_mock.get_request()
+    assert request
+    assert request.headers["content-type"] == "application/json"
+    assert request.content == expected_content
+
+
+async def test_payload_is_dumped_straight_to_json_bytes(http_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://testserver.com/test-path", json={"success": True})
+
+    await http_client.post("/test-path", request_model=TestRequestModel, payload=TestRequestModel(name="John", age=30))
+
+    request = httpx_mock.get_request()
+    assert request
+    assert request.headers["content-type"] == "application/json"
+    assert request.content == b'{"name":"John","age":30}'
+
+
+async def test_stream_yields_bounded_chunks(http_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://testserver.com/files/1", stream=IteratorStream([b"a" * 100, b"b" * 100]))
+
+    chunks = [chunk async for chunk in http_client.stream("GET", "/files/1", chunk_size=64)]
+
+    assert b"".join(chunks) == b"a" * 100 + b"b" * 100
+    assert max(len(chunk) for chunk in chunks) <= 64
+
+
+async def test_download_keeps_memory_flat(http_client: HttpClient, httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    chunk, chunks_count = b"x" * 64 * 1024, 256
+    httpx_mock.add_response(
+        url="http://testserver.com/files/1", stream=IteratorStream(chunk for _ in range(chunks_count))
+    )
+    destination = tmp_path / "file.bin"
+
+    tracemalloc.start()
+    written = await http_client.download("/files/1", destination)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert written == len(chunk) * chunks_count
+    assert destination.stat().st_size == written
+    assert peak < written / 8
+
+
+async def test_download_error_removes_partial_file(
+    http_client: HttpClient, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    httpx_mock.add_response(url="http://testserver.com/files/1", status_code=404)
+    destination = tmp_path / "file.bin"
+
+    with pytest.raises(HTTPStatusError):
+        await http_client.download("/files/1", destination)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_upload_streams_file_from_disk(http_client: HttpClient, httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    source = tmp_path / "upload.bin"
+    source.write_bytes(b"y" * 200_000)
+    httpx_mock.add_response(url="http://testserver.com/files?channel_id=c1", json={"id": 1, "name": "n", "age": 1})
+
+    response = await http_client.upload(
+        "/files", source, params={"channel_id": "c1"}, response_model=TestResponseModel, chunk_size=4096
+    )
+
+    request = httpx_mock.get_request()
+    assert request
+    assert request.headers["content-length"] == "200000"
+    assert request.headers["content-type"] == "application/octet-stream"
+    assert request.content == source.read_bytes()
+    assert response == TestResponseModel(id=1, name="n", age=1)
@@ -0,0 +1,202 @@
+import logging
+from collections.abc import Mapping
+
+import httpx
+import pytest
+from pydantic import BaseModel
+from pytest_httpx import HTTPXMock
+
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.instrumentation import (
+    HistogramAggregator,
+    Instrumentation,
+    LatencyHistogram,
+    LoggingExporter,
+    RequestHook,
+    RequestMetrics,
+    RouteStats,
+    route_template,
+)
+from botenix.integration.utils.response_cache import ResponseCache
+
+
+POST_ID = "a" * 26
+CHANNEL_ID = "b1" * 13
+
+
+class Channel(BaseModel):
+    id: str
+
+
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, RequestMetrics]] = []
+
+    def on_start(self, metrics: RequestMetrics) -> None:
+        self.events.append(("start", metrics))
+
+    def on_end(self, metrics: RequestMetrics) -> None:
+        self.events.append(("end", metrics))
+
+    def on_error(self, metrics: RequestMetrics, error: BaseException) -> None:  # noqa: ARG002
+        self.events.append(("error", metrics))
+
+
+class BrokenHook(RequestHook):
+    def on_end(self, metrics: RequestMetrics) -> None:  # noqa: PLR6301
+        raise RuntimeError(metrics.path)
+
+
+class CollectingExporter:
+    def __init__(self) -> None:
+        self.exported: dict[tuple[str, str], RouteStats] = {}
+
+    def export(self, stats: Mapping[tuple[str, str], RouteStats]) -> None:
+        self.exported = dict(stats)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        (f"/api/v4/posts/{POST_ID}", "/api/v4/posts/{id}"),
+        (f"/api/v4/channels/{CHANNEL_ID}/posts?page=1", "/api/v4/channels/{id}/posts"),
+        ("/api/v4/users/me", "/api/v4/users/me"),
+        ("/api/v4/users/username/alice", "/api/v4/users/username/{name}"),
+        ("/api/v4/teams/name/core/channels/name/town-square", "/api/v4/teams/name/{name}/channels/name/{name}"),
+        ("/api/v4/plugins/com.mattermost.calls/enable", "/api/v4/plugins/{name}/enable"),
+    ],
+)
+def test_route_template(path: str, expected: str) -> None:
+    assert route_template(path) == expected
+
+
+def test_no_metrics_without_hooks() -> None:
+    instrumentation = Instrumentation()
+
+    assert instrumentation.start("GET", "/api/v4/users/me") is None
+    instrumentation.end(None)
+    instrumentation.error(None, RuntimeError())
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram([0.001, 0.01, 0.1])
+    for value in [0.0005] * 90 + [0.05] * 9 + [0.5]:
+        histogram.record(value)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.5) == 0.001
+    assert histogram.percentile(0.99) == 0.1
+    assert histogram.percentile(1.0) == 0.5
+    assert histogram.mean == pytest.approx(0.00995)
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+async def test_hooks_see_every_stage(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={"id": CHANNEL_ID}, is_reusable=True)
+    hook = RecordingHook()
+    client = HttpClient("http://testserver.com", instrumentation=Instrumentation([hook]))
+
+    await client.post(f"/api/v4/channels/{CHANNEL_ID}", json={"name": "town"}, response_model=Channel)
+    await client.get(f"/api/v4/channels/{CHANNEL_ID}")
+
+    assert [stage for stage, _ in hook.events] == ["start", "end", "start", "end"]
+    validated, decoded = hook.events[1][1], hook.events[3][1]
+    assert validated.route == "/api/v4/channels/{id}"
+    assert validated.status_code == 200
+    assert validated.attempts == 1
+    assert validated.bytes_sent > 0
+    assert validated.bytes_received == len(f'{{"id":"{CHANNEL_ID}"}}')
+    assert validated.validation_time > 0
+    assert validated.decode_time == 0
+    assert decoded.decode_time > 0
+    assert validated.total_time >= validated.network_time > 0
+    await client.close()
+
+
+async def test_error_hook_on_failed_request(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=404)
+    aggregator = HistogramAggregator()
+    client = HttpClient("http://testserver.com", instrumentation=Instrumentation([aggregator]))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get(f"/api/v4/posts/{POST_ID}")
+
+    stats = aggregator.routes["GET", "/api/v4/posts/{id}"]
+    assert stats.errors == 1
+    assert stats.statuses == {404: 1}
+    await client.close()
+
+
+async def test_send_reports_its_own_metrics(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(content=b"pong")
+    hook = RecordingHook()
+    client = HttpClient("http://testserver.com", instrumentation=Instrumentation([hook]))
+
+    await client.send("GET", "/api/v4/system/ping")
+
+    assert [stage for stage, _ in hook.events] == ["start", "end"]
+    assert hook.events[1][1].bytes_received == 4
+    await client.close()
+
+
+async def test_cached_requests_are_reported(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={"id": CHANNEL_ID})
+    hook = RecordingHook()
+    client = HttpClient(
+        "http://testserver.com", instrumentation=Instrumentation([hook]), response_cache=ResponseCache(ttl=60)
+    )
+
+    for _ in range(2):
+        await client.get(f"/api/v4/channels/{CHANNEL_ID}", cache=True, response_model=Channel)
+
+    assert [stage for stage, _ in hook.events] == ["start", "end", "start", "end"]
+    miss, hit = hook.events[1][1], hook.events[3][1]
+    assert miss.status_code == 200
+    assert miss.network_time > 0
+    assert miss.validation_time > 0
+    assert (hit.status_code, hit.network_time, hit.validation_time) == (None, 0, 0)
+    await client.close()
+
+
+async def test_failing_hook_does_not_fail_the_request(httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture) -> None:
+    httpx_mock.add_response(json={"status": "OK"})
+    client = HttpClient("http://testserver.com", instrumentation=Instrumentation([BrokenHook()]))
+
+    assert await client.get("/api/v4/system/ping") == {"status": "OK"}
+    assert "Instrumentation hook" in caplog.text
+    await client.close()
+
+
+def test_aggregator_folds_routes_past_the_limit() -> None:
+    aggregator = HistogramAggregator(max_routes=2)
+
+    for path in ("/a", "/b", "/c", "/d", "/a"):
+        metrics = RequestMetrics("GET", path, route_template(path))
+        aggregator.on_end(metrics)
+
+    assert {route: stats.total.count for (_, route), stats in aggregator.routes.items()} == {
+        "/a": 2,
+        "/b": 1,
+        "other": 2,
+    }
+
+
+async def test_aggregator_export(httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    httpx_mock.add_response(json={"id": POST_ID}, is_reusable=True)
+    aggregator = HistogramAggregator()
+    client = HttpClient("http://testserver.com", instrumentation=Instrumentation())
+    client.instrumentation.add_hook(aggregator)
+    for _ in range(3):
+        await client.get(f"/api/v4/posts/{POST_ID}")
+
+    exporter = CollectingExporter()
+    aggregator.export(exporter)
+    aggregator.export(LoggingExporter(), reset=True)
+
+    stats = exporter.exported["GET", "/api/v4/posts/{id}"]
+    assert stats.total.count == stats.network.count == 3
+    assert stats.statuses == {200: 3}
+    assert "GET /api/v4/posts/{id}: 3 requests, 0 errors" in caplog.text
+    assert aggregator.routes == {}
+    await client.close()
@@ -0,0 +1,195 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import orjson
+import pytest
+from pytest_httpx import HTTPXMock
+
+from botenix.core.bot import Bot
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.integration.services.journal import EventJournal
+from botenix.integration.utils.http_client import HttpClient
+
+
+BASE_URL = "http://testserver.com"
+
+
+def post(post_id: str, channel_id: str, create_at: int, **fields: object) -> dict[str, object]:
+    return {
+        "id": post_id,
+        "channel_id": channel_id,
+        "user_id": "u1",
+        "message": post_id,
+        "create_at": create_at,
+        **fields,
+    }
+
+
+def posted(post_id: str, channel_id: str = "c1", create_at: int = 100, team_id: str = "t1") -> Event:
+    data = {"post": orjson.dumps(post(post_id, channel_id, create_at)).decode(), "team_id": team_id}
+    return Event(EventType.posted, data, {"channel_id": channel_id})
+
+
+def handle(journal: EventJournal, event: Event) -> bool:
+    # What the dispatcher does for a post whose handler runs to completion.
+    accepted = journal.observe(event)
+    if accepted:
+        journal.done(event, True)
+    return accepted
+
+
+def post_list(*posts: dict[str, object]) -> dict[str, object]:
+    return {"order": [item["id"] for item in posts], "posts": {item["id"]: item for item in posts}}
+
+
+@pytest.fixture
+async def journal(tmp_path: Path) -> AsyncIterator[EventJournal]:
+    journal = EventJournal(tmp_path / "journal.jsonl", flush_interval=60)
+    await journal.open()
+    yield journal
+    await journal.close()
+
+
+async def test_handled_posts_are_dropped_when_delivered_again(journal: EventJournal) -> None:
+    assert handle(journal, posted("p1"))
+    assert not handle(journal, posted("p1"))
+    assert journal.observe(Event(EventType.typing, {}, {"channel_id": "c1"}))
+
+    assert journal.seen("p1")
+    assert journal.channels == {"c1": 100}
+    assert journal.teams == {"t1": 100}
+
+
+async def test_writes_are_batched_until_flush(journal: EventJournal) -> None:
+    for index in range(10):
+        handle(journal, posted(f"p{index}", create_at=index))
+    assert journal.path.read_bytes() == b""
+
+    await journal.flush()
+
+    assert journal.flushes == 1
+    assert len(journal.path.read_bytes().splitlines()) == 10
+
+
+async def test_state_is_restored_and_corrupt_tail_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    async with EventJournal(path) as journal:
+        handle(journal, posted("p1", "c1", 100))
+        handle(journal, posted("p2", "c2", 200, team_id=""))
+    with path.open("ab") as file:
+        file.write(b'{"id": "p3", "chan')
+
+    async with EventJournal(path) as restored:
+        assert restored.seen("p1")
+        assert restored.seen("p2")
+        assert not restored.seen("p3")
+        assert restored.channels == {"c1": 100, "c2": 200}
+        assert restored.teams == {"t1": 100}
+
+
+async def test_compaction_keeps_offsets_and_recent_posts(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    async with EventJournal(path, max_recent=5, compact_after=8) as journal:
+        for index in range(20):
+            handle(journal, posted(f"p{index}", f"c{index % 2}", create_at=index))
+            await journal.flush()
+        assert journal.compactions > 0
+
+    async with EventJournal(path, max_recent=5) as restored:
+        assert restored.channels == {"c0": 18, "c1": 19}
+        assert [restored.seen(f"p{index}") for index in (14, 15, 19)] == [False, True, True]
+    assert len(path.read_bytes().splitlines()) < 12
+    assert not path.with_name("journal.jsonl.tmp").exists()
+
+
+async def test_missed_events_are_fetched_since_the_last_handled_post(
+    journal: EventJournal, httpx_mock: HTTPXMock
+) -> None:
+    handle(journal, posted("p1", "c1", 100))
+    handle(journal, posted("p2", "c2", 500))
+    channels = [
+        {"id": "c1", "team_id": "t1", "type": "O", "name": "one", "last_post_at": 300},
+        {"id": "c2", "team_id": "t1", "type": "O", "name": "two", "last_post_at": 500},
+        {"id": "c3", "team_id": "t1", "type": "O", "name": "joined", "last_post_at": 600},
+    ]
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/users/me/teams/t1/channels", json=channels)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v4/channels/c1/posts?since=100",
+        json=post_list(
+            post("p4", "c1", 300),
+            post("p3", "c1", 200),
+            post("p1", "c1", 100),
+            post("p0", "c1", 50, edit_at=150),
+            post("gone", "c1", 250, delete_at=260),
+        ),
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/channels/c3/posts?since=500", json=post_list(post("p5", "c3", 600)))
+    client = HttpClient(BASE_URL)
+
+    events = await journal.missed_events(client)
+
+    assert [(event.post_model.id, event.channel_id, event.team_id) for event in events if event.post_model] == [
+        ("p3", "c1", "t1"),
+        ("p4", "c1", "t1"),
+        ("p5", "c3", "t1"),
+    ]
+    assert [journal.observe(event) for event in events] == [True, True, True]
+    await client.close()
+
+
+async def test_posts_are_recorded_once_handled(journal: EventJournal) -> None:
+    dispatcher = Dispatcher()
+    dispatcher.add_stage(journal.observe)
+    # Sheds p2, like an ``AdmissionController`` added after the journal.
+    dispatcher.add_stage(lambda event: event.text != "p2")
+    dispatcher.add_done_callback(journal.done)
+    release = asyncio.Event()
+
+    @dispatcher.message()
+    async def slow(event: Event) -> None:  # noqa: ARG001
+        await release.wait()
+
+    handler = asyncio.create_task(dispatcher.feed_event(posted("p1")))
+    await asyncio.sleep(0)
+    assert not await dispatcher.feed_event(posted("p1"))
+    assert journal.seen("p1")
+    assert journal.channels == {}
+
+    release.set()
+    await handler
+    assert not await dispatcher.feed_event(posted("p2", create_at=200))
+
+    assert journal.channels == {"c1": 100}
+    assert not journal.seen("p2")
+
+
+async def test_bot_catches_up_and_drops_duplicates(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    journal = EventJournal(tmp_path / "journal.jsonl")
+    bot = Bot("token", BASE_URL, journal=journal)
+    handled: list[str | None] = []
+
+    @bot.message()
+    async def record(event: Event) -> None:
+        handled.append(event.text)
+
+    await journal.open()
+    bot.dispatcher.build()
+    await bot.dispatcher.feed_event(posted("p1"))
+    assert bot.dispatcher.executor is not None
+    await bot.dispatcher.executor.join()
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v4/users/me/teams/t1/channels", json=[])
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v4/channels/c1/posts?since=100",
+        json=post_list(post("p2", "c1", 200), post("p1", "c1", 100)),
+    )
+
+    assert await bot.catch_up() == 1
+    await bot.dispatcher.feed_event(posted("p2", create_at=200))
+    await bot.close()
+
+    assert handled == ["p1", "p2"]
+    assert journal.path.read_bytes().count(b"\n") == 2
+    with pytest.raises(ValueError, match="journal"):
+        bot.run(workers=2)
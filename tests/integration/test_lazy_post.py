@@ -0,0 +1,93 @@
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from botenix.core.events.event import Event, EventType
+from botenix.integration.clients.models.posts import LazyPost, PostMetadata, PostResponse
+from botenix.integration.utils.type_adapters import type_adapters
+
+
+POST = {
+    "id": "post-id",
+    "create_at": 1,
+    "update_at": 2,
+    "edit_at": 0,
+    "delete_at": 0,
+    "user_id": "user-id",
+    "channel_id": "channel-id",
+    "root_id": "root-id",
+    "message": "hello",
+    "type": "",
+    "props": {"from_bot": "true"},
+    "file_ids": [],
+    "hashtags": "",
+    "metadata": {
+        "reactions": [{"user_id": "u", "post_id": "post-id", "emoji_name": "+1", "channel_id": "channel-id"}],
+        "images": {"https://example.com/a.png": {"width": 1, "height": 2, "format": "png"}},
+    },
+}
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_lazy_post_fields(trusted: bool) -> None:
+    post = LazyPost.from_json(orjson.dumps(POST), trusted=trusted)
+
+    assert (post.id, post.channel_id, post.user_id, post.root_id, post.message) == (
+        "post-id",
+        "channel-id",
+        "user-id",
+        "root-id",
+        "hello",
+    )
+    assert post.props == {"from_bot": "true"}
+    assert not hasattr(post, "__dict__")
+
+
+def test_metadata_is_validated_once_on_access() -> None:
+    post = LazyPost.from_dict(POST)
+
+    metadata = post.metadata
+
+    assert isinstance(metadata, PostMetadata)
+    assert metadata.reactions[0].emoji_name == "+1"
+    assert post.metadata is metadata
+
+
+def test_untrusted_input_is_validated() -> None:
+    with pytest.raises(ValidationError):
+        LazyPost.from_dict({**POST, "message": None})
+    with pytest.raises(ValidationError):
+        LazyPost.from_json(orjson.dumps({"id": "post-id"}))
+
+
+def test_invalid_metadata_fails_on_access() -> None:
+    post = LazyPost.from_dict({**POST, "metadata": {"images": {"a": {"width": "wide"}}}}, trusted=True)
+
+    with pytest.raises(ValidationError):
+        _ = post.metadata
+
+
+def test_to_model_round_trips() -> None:
+    post = LazyPost.from_dict(POST)
+
+    model = post.to_model()
+
+    assert model == PostResponse.model_validate(POST)
+
+
+def test_lazy_post_as_response_model() -> None:
+    adapter = type_adapters.get(list[LazyPost])
+
+    posts = adapter.validate_json(orjson.dumps([POST, {**POST, "id": "second"}]))
+
+    assert [post.id for post in posts] == ["post-id", "second"]
+    assert orjson.loads(adapter.dump_json(posts))[1]["id"] == "second"
+
+
+def test_event_post_model() -> None:
+    event = Event(EventType.posted, {"post": orjson.dumps(POST).decode()})
+
+    assert event.post_model is not None
+    assert event.post_model is event.post_model
+    assert event.post_model.root_id == event.root_id == "root-id"
+    assert Event(EventType.typing).post_model is None
@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+import orjson
+import pytest
+
+from botenix.exceptions import QueueClosedError
+from botenix.integration.services.outbound import OutboundQueue
+from botenix.integration.utils.http_client import HttpClient
+
+
+def post(payload: dict[str, object], post_id: str = "p1") -> dict[str, object]:
+    return {
+        "id": post_id,
+        "user_id": "bot",
+        "channel_id": "c1",
+        "message": "",
+        "create_at": 1,
+        "update_at": 1,
+        "delete_at": 0,
+        "edit_at": 0,
+        **payload,
+    }
+
+
+class Server:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, dict[str, object]]] = []
+        self.fail = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.001)
+        payload = orjson.loads(request.content)
+        self.requests.append((request.method, request.url.path, payload))
+        if self.fail:
+            return httpx.Response(500)
+        if request.url.path.endswith("/typing"):
+            return httpx.Response(200, json={"status": "OK"})
+        return httpx.Response(200, json=post(payload, post_id=f"p{len(self.requests)}"))
+
+
+@pytest.fixture
+def server() -> Server:
+    return Server()
+
+
+@pytest.fixture
+async def queue(server: Server) -> AsyncIterator[OutboundQueue]:
+    client = HttpClient("http://testserver.com", transport=httpx.MockTransport(server))
+    queue = OutboundQueue(client, edit_interval=0.05, typing_interval=10)
+    yield queue
+    await queue.close()
+    await client.close()
+
+
+async def test_posts_keep_channel_order(queue: OutboundQueue, server: Server) -> None:
+    futures = [queue.create_post("c1" if index % 2 else "c2", f"m{index}") for index in range(10)]
+
+    posts = await asyncio.gather(*futures)
+
+    assert [posted.message for posted in posts] == [f"m{index}" for index in range(10)]
+    for channel_id in ("c1", "c2"):
+        sent = [payload["message"] for _, _, payload in server.requests if payload["channel_id"] == channel_id]
+        assert sent == [f"m{index}" for index in range(10) if (channel_id == "c1") == bool(index % 2)]
+
+
+async def test_edits_are_merged_and_the_last_state_is_sent(queue: OutboundQueue, server: Server) -> None:
+    futures = [queue.edit_post("p1", "c1", message=f"progress {percent}%") for percent in range(101)]
+    queue.edit_post("p1", "c1", props={"done": True})
+    await asyncio.gather(*futures)
+    await queue.flush()
+
+    edits = [
+        payload for method, path, payload in server.requests if method == "PUT" and path == "/api/v4/posts/p1/patch"
+    ]
+    assert edits == [{"message": "progress 100%", "props": {"done": True}}]
+    assert queue.stats.coalesced == 101
+
+
+async def test_edits_are_throttled(queue: OutboundQueue, server: Server) -> None:
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    message = ""
+    while loop.time() - started_at < 0.2:
+        message = str(loop.time())
+        queue.edit_post("p1", "c1", message=message)
+        await asyncio.sleep(0.001)
+    await queue.flush()
+
+    # One edit per 50 ms interval, plus the first one and the final flush.
+    assert 3 <= len(server.requests) <= 7
+    assert server.requests[-1][2]["message"] == message
+
+
+async def test_typing_is_deduplicated_and_dropped_by_posts(queue: OutboundQueue, server: Server) -> None:
+    await queue.typing("c1")
+    await queue.typing("c1")
+    queue.typing("c2")
+    queue.typing("c2", parent_id="root")
+    queue.create_post("c2", "done")
+    await queue.flush()
+
+    paths = [(path, payload["channel_id"]) for _, path, payload in server.requests]
+    assert paths == [("/api/v4/users/me/typing", "c1"), ("/api/v4/posts", "c2")]
+    assert queue.stats.typing_skipped == 3
+
+
+async def test_close_flushes_pending_edits_immediately(queue: OutboundQueue, server: Server) -> None:
+    await queue.edit_post("p1", "c1", message="first")
+    queue.edit_post("p1", "c1", message="final")
+    queue._edits.interval = 60  # noqa: SLF001
+
+    async with asyncio.timeout(1):
+        await queue.close()
+
+    assert [payload["message"] for _, _, payload in server.requests] == ["first", "final"]
+    with pytest.raises(QueueClosedError):
+        queue.create_post("c1", "too late")
+
+
+async def test_failures_are_reported_and_do_not_stop_the_channel(
+    queue: OutboundQueue,
+    server: Server,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    server.fail = True
+    failed = queue.create_post("c1", "lost")
+    with pytest.raises(httpx.HTTPStatusError):
+        await failed
+    server.fail = False
+
+    assert (await queue.create_post("c1", "delivered")).message == "delivered"
+    assert queue.stats.failed == 1
+    assert "Outbound post to channel c1 failed" in caplog.text
@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+import httpx
+import pytest
+from pydantic import BaseModel
+from pytest_httpx import HTTPXMock
+
+from botenix.integration.clients.models.posts import LazyPost
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.pagination import Paginator, PostCursor
+
+
+class User(BaseModel):
+    id: str
+
+
+def make_post(index: int) -> dict[str, str]:
+    return {"id": f"p{index}", "channel_id": "c1", "user_id": "u1", "message": f"message {index}"}
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[HttpClient]:
+    client = HttpClient(base_url="http://testserver.com")
+    yield client
+    await client.close()
+
+
+def users_endpoint(
+    total: int, delay: float = 0.0
+) -> tuple[list[int], Callable[[httpx.Request], Awaitable[httpx.Response]]]:
+    in_flight: list[int] = [0, 0]
+
+    async def callback(request: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(delay)
+        in_flight[0] -= 1
+        page, per_page = int(request.url.params["page"]), int(request.url.params["per_page"])
+        users = [{"id": f"u{index}"} for index in range(page * per_page, min(total, (page + 1) * per_page))]
+        return httpx.Response(200, json=users)
+
+    return in_flight, callback
+
+
+async def test_paginator_yields_every_item_in_order(client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    in_flight, callback = users_endpoint(total=25, delay=0.01)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    users = await client.get.paginate("/api/v4/users", model=User, per_page=10, prefetch=3).collect()
+
+    assert [user.id for user in users] == [f"u{index}" for index in range(25)]
+    assert in_flight[1] == 3
+
+
+async def test_paginator_stops_on_an_exact_multiple(client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    _, callback = users_endpoint(total=20)
+    httpx_mock.add_callback(callback, is_reusable=True)
+    paginator = Paginator(client.get, "/api/v4/users", model=User, per_page=10, prefetch=1, params={"active": True})
+
+    users = await paginator.collect()
+
+    assert len(users) == 20
+    assert paginator.pages_fetched == 3
+    assert all(request.url.params["active"] == "true" for request in httpx_mock.get_requests())
+
+
+async def test_breaking_early_cancels_prefetched_pages(client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    _, callback = users_endpoint(total=1000, delay=0.01)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    async with client.get.paginate("/api/v4/users", model=User, per_page=10, prefetch=4) as users:
+        async for user in users:
+            if user.id == "u5":
+                break
+
+    assert len(httpx_mock.get_requests()) <= 5
+    assert [user async for user in users] == []
+
+
+async def test_paginator_propagates_errors(client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=500, is_reusable=True)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get.paginate("/api/v4/users", model=User, prefetch=2).collect()
+
+
+def test_per_page_is_bounded(client: HttpClient) -> None:
+    with pytest.raises(ValueError, match="per_page"):
+        Paginator(client.get, "/api/v4/users", model=User, per_page=500)
+
+
+async def test_post_cursor_walks_backwards(client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    posts = [make_post(index) for index in range(7, 0, -1)]
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        per_page = int(request.url.params["per_page"])
+        before = request.url.params.get("before")
+        start = next(i for i, post in enumerate(posts) if post["id"] == before) + 1 if before else 0
+        page = posts[start : start + per_page]
+        return httpx.Response(
+            200,
+            json={
+                "order": [post["id"] for post in page],
+                "posts": {post["id"]: post for post in page},
+                "prev_post_id": posts[start + per_page]["id"] if start + per_page < len(posts) else "",
+            },
+        )
+
+    httpx_mock.add_callback(callback, is_reusable=True)
+    cursor = PostCursor(client.get, "/api/v4/channels/c1/posts", model=LazyPost, per_page=3)
+
+    received = [post async for post in cursor]
+
+    assert [post.id for post in received] == [f"p{index}" for index in range(7, 0, -1)]
+    assert all(isinstance(post, LazyPost) for post in received)
+    assert [request.url.params.get("before") for request in httpx_mock.get_requests()] == [None, "p5", "p2"]
+    assert cursor.cursor == "p1"
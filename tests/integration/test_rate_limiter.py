@@ -0,0 +1,125 @@
+import asyncio
+import math
+import time
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.rate_limiter import RateLimiter, RequestPriority
+
+
+class FakeRateLimitedServer:
+    """Token bucket server that answers like Mattermost's ``throttled`` middleware."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.served = 0
+        self.rejected = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:  # noqa: ARG002
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        headers = {"X-RateLimit-Limit": str(self.burst)}
+        if self.tokens < 1:
+            self.rejected += 1
+            reset = math.ceil((1 - self.tokens) / self.rate)
+            headers |= {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset), "Retry-After": str(reset)}
+            return httpx.Response(429, headers=headers, json={"message": "too many requests"})
+        self.tokens -= 1
+        self.served += 1
+        reset = math.ceil((self.burst - self.tokens) / self.rate)
+        headers |= {"X-RateLimit-Remaining": str(int(self.tokens)), "X-RateLimit-Reset": str(reset)}
+        return httpx.Response(200, headers=headers, json={"ok": True})
+
+
+@pytest.fixture
+async def limited_client() -> AsyncGenerator[HttpClient]:
+    client = HttpClient(
+        base_url="http://testserver.com",
+        bearer_token="test-token",
+        rate_limiter=RateLimiter(rate=200, burst=20),
+    )
+    yield client
+    await client.close()
+
+
+async def test_sustained_throughput_without_429(limited_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    server = FakeRateLimitedServer(rate=200, burst=20)
+    httpx_mock.add_callback(server, is_reusable=True)
+    requests_count = 300
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(limited_client.get("/api/v4/users/me") for _ in range(requests_count)))
+    elapsed = time.monotonic() - started_at
+
+    ideal = (requests_count - server.burst) / server.rate
+    assert server.rejected == 0
+    assert server.served == requests_count
+    assert elapsed < ideal * 1.3
+
+
+async def test_429_blocks_bucket_until_reset() -> None:
+    limiter = RateLimiter(rate=1000, burst=10)
+    key = limiter.bucket_key("token", "GET", "/api/v4/users/me")
+    await limiter.acquire(key)
+
+    limiter.update(key, 429, {"Retry-After": "0.2"})
+    started_at = time.monotonic()
+    await limiter.acquire(key)
+
+    assert time.monotonic() - started_at >= 0.19
+
+
+async def test_exhausted_remaining_waits_for_next_token() -> None:
+    limiter = RateLimiter(rate=10, burst=10)
+    key = limiter.bucket_key("token", "GET", "/api/v4/users/me")
+
+    limiter.update(key, 200, {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1"})
+    started_at = time.monotonic()
+    await limiter.acquire(key)
+
+    assert 0.09 <= time.monotonic() - started_at < 0.5
+
+
+async def test_interactive_requests_are_served_first() -> None:
+    limiter = RateLimiter(rate=100, burst=1)
+    key = limiter.bucket_key("token", "POST", "/api/v4/posts")
+    await limiter.acquire(key)
+    served: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(key, priority)
+        served.append(name)
+
+    bulk = [asyncio.create_task(request(f"bulk-{n}", RequestPriority.BULK)) for n in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("interactive", RequestPriority.INTERACTIVE))
+    await asyncio.gather(*bulk, interactive)
+
+    assert served[0] == "interactive"
+    assert limiter.queue_size(key) == 0
+
+
+async def test_cancelled_waiter_is_skipped() -> None:
+    limiter = RateLimiter(rate=50, burst=1)
+    key = limiter.bucket_key("token", "GET", "/")
+    await limiter.acquire(key)
+
+    cancelled = asyncio.create_task(limiter.acquire(key))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.wait_for(limiter.acquire(key), timeout=1)
+
+    assert cancelled.cancelled()
+
+
+def test_invalid_configuration() -> None:
+    with pytest.raises(ValueError, match="at least one request"):
+        RateLimiter(rate=0)
@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+from pydantic import BaseModel
+from pytest_httpx import HTTPXMock
+
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.response_cache import ResponseCache, SingleFlight
+
+
+class User(BaseModel):
+    id: str
+    username: str
+
+
+@pytest.fixture
+async def cached_client() -> AsyncGenerator[HttpClient]:
+    client = HttpClient(base_url="http://testserver.com", response_cache=ResponseCache(ttl=60))
+    yield client
+    await client.close()
+
+
+async def test_concurrent_identical_gets_are_coalesced(cached_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    async def slow_user(_: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": "u1", "username": "john"})
+
+    httpx_mock.add_callback(slow_user)
+
+    users = await asyncio.gather(
+        *(cached_client.get("/api/v4/users/u1", response_model=User, cache=True) for _ in range(20))
+    )
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(user is users[0] for user in users)
+    assert cached_client.response_cache is not None
+    assert cached_client.response_cache.stats.misses == 1
+    assert cached_client.response_cache.stats.coalesced == 19
+
+
+async def test_fresh_entry_is_served_from_cache(cached_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={"id": "u1", "username": "john"})
+
+    first: dict[str, str] = await cached_client.get("/api/v4/users/u1", params={"a": 1}, cache=True)
+    second: dict[str, str] = await cached_client.get("/api/v4/users/u1", params={"a": 1}, cache=True)
+
+    assert first == second == {"id": "u1", "username": "john"}
+    assert cached_client.response_cache is not None
+    assert cached_client.response_cache.stats.hits == 1
+
+
+async def test_expired_entry_is_revalidated_with_etag(httpx_mock: HTTPXMock) -> None:
+    cache = ResponseCache(ttl=0)
+    client = HttpClient(base_url="http://testserver.com", response_cache=cache)
+    httpx_mock.add_response(json={"id": "u1", "username": "john"}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+    first = await client.get("/api/v4/users/u1", response_model=User, cache=True)
+    second = await client.get("/api/v4/users/u1", response_model=User, cache=True)
+
+    assert second is first
+    assert cache.stats.revalidated == 1
+    assert cache.stats.misses == 1
+    await client.close()
+
+
+async def test_uncached_calls_bypass_the_cache(cached_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json={"id": "u1", "username": "john"}, is_reusable=True)
+
+    await cached_client.get("/api/v4/users/u1")
+    await cached_client.get("/api/v4/users/u1")
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert cached_client.response_cache is not None
+    assert len(cached_client.response_cache) == 0
+
+
+async def test_lru_eviction_respects_entry_and_byte_bounds(httpx_mock: HTTPXMock) -> None:
+    cache = ResponseCache(ttl=60, max_entries=2, max_bytes=4096)
+    client = HttpClient(base_url="http://testserver.com", response_cache=cache)
+    httpx_mock.add_response(content=b"x" * 10, is_reusable=True)
+
+    for user_id in ("u1", "u2", "u1", "u3"):
+        await client.get(f"/api/v4/users/{user_id}", cache=True)
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 1
+    assert cache.size <= cache.max_bytes
+
+    httpx_mock.add_response(url="http://testserver.com/huge", content=b"x" * 8192)
+    await client.get("/huge", cache=True)
+    assert len(cache) == 2
+    await client.close()
+
+
+async def test_decoded_values_count_towards_the_byte_bound(httpx_mock: HTTPXMock) -> None:
+    body = b'{"id": "u1", "username": "alice"}'
+    cache = ResponseCache(ttl=60, max_bytes=2048)
+    client = HttpClient(base_url="http://testserver.com", response_cache=cache)
+    httpx_mock.add_response(content=body, headers={"Content-Type": "application/json"}, is_reusable=True)
+
+    await client.get("/api/v4/users/u1", cache=True)
+    raw_and_decoded = cache.size
+    await client.get("/api/v4/users/u1", cache=True, response_model=User)
+    await client.get("/api/v4/users/u1", cache=True, response_model=User)
+
+    assert cache.size - raw_and_decoded == raw_and_decoded - 256 - len(body) > len(body)
+    cache.max_bytes = cache.size - 1
+    await client.get("/api/v4/users/u2", cache=True)
+    assert cache.size <= cache.max_bytes
+    assert cache.stats.evictions == 1
+    await client.close()
+
+
+async def test_singleflight_survives_cancelled_caller() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    started = asyncio.Event()
+
+    async def compute() -> int:
+        started.set()
+        await asyncio.sleep(0.01)
+        return 42
+
+    leader = asyncio.create_task(flights.do("key", compute))
+    await started.wait()
+    follower = asyncio.create_task(flights.do("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 42
+    assert len(flights) == 0
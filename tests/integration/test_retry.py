@@ -0,0 +1,154 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from botenix.exceptions import CircuitOpenError
+from botenix.integration.utils.http_client import HttpClient
+from botenix.integration.utils.retry import CircuitBreaker, CircuitState, RetryPolicy
+
+
+FAST_RETRIES = RetryPolicy(max_attempts=3, backoff_base=0.001, backoff_max=0.001)
+
+
+@pytest.fixture
+async def retrying_client() -> AsyncGenerator[HttpClient]:
+    client = HttpClient(base_url="http://testserver.com", bearer_token="test-token", retry_policy=FAST_RETRIES)
+    yield client
+    await client.close()
+
+
+async def test_get_is_retried_after_server_error(retrying_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_exception(httpx.ConnectError("connection refused"))
+    httpx_mock.add_response(json={"ok": True})
+
+    assert await retrying_client.get("/api/v4/users/me") == {"ok": True}
+    assert len(httpx_mock.get_requests()) == 3
+
+
+async def test_retries_are_bounded(retrying_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=502, is_reusable=True)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await retrying_client.get("/api/v4/users/me")
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+async def test_post_is_not_retried_by_default(retrying_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await retrying_client.post("/api/v4/posts", json={"message": "hi"})
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_post_is_retried_when_caller_opts_in(retrying_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(json={"id": "post"})
+
+    assert await retrying_client.post("/api/v4/posts", json={"message": "hi"}, idempotent=True) == {"id": "post"}
+    assert [request.content for request in httpx_mock.get_requests()] == [b'{"message":"hi"}'] * 2
+
+
+async def test_client_errors_are_not_retried(retrying_client: HttpClient, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await retrying_client.get("/api/v4/users/unknown")
+
+
+def make_status_error(status_code: int, retry_after: str) -> httpx.HTTPStatusError:
+    response = httpx.Response(
+        status_code, headers={"Retry-After": retry_after}, request=httpx.Request("GET", "http://x")
+    )
+    return httpx.HTTPStatusError(str(status_code), request=response.request, response=response)
+
+
+@pytest.mark.parametrize(("retry_after", "expected"), [("1.5", 1.5), ("120", 60.0)])
+def test_retry_after_seconds_is_respected(retry_after: str, expected: float) -> None:
+    assert RetryPolicy().retry_delay("GET", 1, make_status_error(429, retry_after)) == expected
+
+
+def test_retry_after_http_date_is_respected() -> None:
+    retry_after = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+    assert RetryPolicy().retry_delay("GET", 1, make_status_error(503, retry_after)) == pytest.approx(30, abs=2)
+
+
+def test_invalid_retry_after_falls_back_to_backoff() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+    assert 0 <= (policy.retry_delay("GET", 2, make_status_error(503, "soon")) or 0) <= 4
+
+
+async def test_circuit_breaker_fails_fast_and_recovers(httpx_mock: HTTPXMock) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.0)
+    client = HttpClient(base_url="http://testserver.com", circuit_breaker=breaker)
+    httpx_mock.add_response(status_code=500)
+    httpx_mock.add_exception(httpx.ConnectError("connection refused"))
+    httpx_mock.add_response(json={"ok": True})
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPError):
+            await client.get("/api/v4/system/ping")
+    assert breaker.state("testserver.com") is CircuitState.open
+
+    assert await client.get("/api/v4/system/ping") == {"ok": True}
+    assert breaker.state("testserver.com") is CircuitState.closed
+    await client.close()
+
+
+def test_open_circuit_rejects_requests() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure("host")
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request("host")
+
+    assert error.value.host == "host"
+    assert error.value.retry_in > 59
+
+
+def test_half_open_allows_limited_probes() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, half_open_max_calls=1)
+    breaker.record_failure("host")
+
+    breaker.before_request("host")
+    assert breaker.state("host") is CircuitState.half_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+
+    breaker.record_failure("host")
+    assert breaker.state("host") is CircuitState.open
+
+
+async def test_cancelled_probe_releases_its_slot(httpx_mock: HTTPXMock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, half_open_max_calls=1)
+    client = HttpClient(base_url="http://testserver.com", circuit_breaker=breaker)
+    breaker.record_failure("testserver.com")
+    started = asyncio.Event()
+
+    async def hang(_request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    httpx_mock.add_callback(hang)
+    httpx_mock.add_response(json={"ok": True})
+    probe: asyncio.Task[object] = asyncio.create_task(client.get("/api/v4/system/ping"))
+    await started.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert breaker.state("testserver.com") is CircuitState.half_open
+
+    assert await client.get("/api/v4/system/ping") == {"ok": True}
+    assert breaker.state("testserver.com") is CircuitState.closed
+    await client.close()
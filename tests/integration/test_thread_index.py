@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from botenix.core.events.event import EventType
+from botenix.integration.services.thread_index import ThreadIndex
+from botenix.integration.utils.http_client import HttpClient
+from tests.conftest import post_event
+
+
+BASE_URL = "http://testserver.com"
+THREAD_URL = f"{BASE_URL}/api/v4/posts/root/thread"
+
+
+def post(post_id: str, create_at: int, root_id: str = "root", **fields: object) -> dict[str, object]:
+    return {
+        "id": post_id,
+        "channel_id": "c1",
+        "user_id": "u1",
+        "message": f"message {post_id}",
+        "root_id": "" if post_id == root_id else root_id,
+        "create_at": create_at,
+        **fields,
+    }
+
+
+def thread(*posts: dict[str, object]) -> dict[str, object]:
+    ordered = sorted(posts, key=lambda post: -int(post["create_at"]))  # type: ignore[call-overload]
+    return {"order": [post["id"] for post in ordered], "posts": {post["id"]: post for post in posts}}
+
+
+def messages(posts: list) -> list[str]:  # type: ignore[type-arg]
+    return [post.message for post in posts]
+
+
+@pytest.fixture
+async def threads() -> AsyncIterator[ThreadIndex]:
+    threads = ThreadIndex(HttpClient(BASE_URL))
+    yield threads
+    await threads.http_client.close()
+
+
+async def test_thread_is_loaded_once_in_create_at_order(httpx_mock: HTTPXMock, threads: ThreadIndex) -> None:
+    httpx_mock.add_response(
+        url=THREAD_URL, json=thread(post("reply", 3), post("root", 1), post("deleted", 2, delete_at=5))
+    )
+
+    first, second = await asyncio.gather(threads.thread("root"), threads.last("root", 1))
+
+    assert messages(first) == ["message root", "message reply"]
+    assert messages(second) == ["message reply"]
+    assert messages(await threads.last("root", 10)) == ["message root", "message reply"]
+    assert len(httpx_mock.get_requests()) == 1
+    assert (threads.stats.misses, threads.stats.hits) == (1, 1)
+
+
+async def test_post_events_update_indexed_threads(httpx_mock: HTTPXMock, threads: ThreadIndex) -> None:
+    httpx_mock.add_response(url=THREAD_URL, json=thread(post("root", 1), post("a", 2), post("b", 3)))
+    await threads.thread("root")
+
+    threads.observe(post_event(post=post("c", 4)))
+    threads.observe(post_event(post=post("late", 2)))
+    threads.observe(post_event(event_type=EventType.post_edited, post=post("a", 2, message="edited", edit_at=10)))
+    threads.observe(post_event(event_type=EventType.post_deleted, post=post("b", 3, delete_at=11)))
+    threads.observe(post_event(post=post("other", 5, root_id="elsewhere")))
+
+    assert messages(threads.peek("root", 10) or []) == ["message root", "edited", "message late", "message c"]
+    assert threads.peek("elsewhere", 10) is None
+    assert threads.size == sum(post.size for post in threads.peek("root", 10) or [])
+
+    threads.observe(post_event(event_type=EventType.post_deleted, post=post("root", 1, delete_at=12)))
+    assert "root" not in threads
+    assert threads.size == 0
+
+
+async def test_posts_arriving_while_a_thread_loads_are_applied(httpx_mock: HTTPXMock, threads: ThreadIndex) -> None:
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        loading.set()
+        await release.wait()
+        return httpx.Response(200, json=thread(post("root", 1)))
+
+    httpx_mock.add_callback(respond, url=THREAD_URL)
+    lookup = asyncio.create_task(threads.thread("root"))
+    await loading.wait()
+    threads.observe(post_event(post=post("reply", 2)))
+    release.set()
+
+    assert messages(await lookup) == ["message root", "message reply"]
+
+
+async def test_memory_is_bounded_by_evicting_cold_threads(httpx_mock: HTTPXMock) -> None:
+    for root_id in ("t1", "t2", "t3"):
+        posts = [post(root_id, 1, root_id), *(post(f"{root_id}-{index}", index + 2, root_id) for index in range(5))]
+        httpx_mock.add_response(url=f"{BASE_URL}/api/v4/posts/{root_id}/thread", json=thread(*posts))
+    threads = ThreadIndex(HttpClient(BASE_URL), max_thread_posts=4)
+    await threads.thread("t1")
+    # The threads are the same size, so two of them fit.
+    threads.max_bytes = 2 * threads.size
+
+    await threads.thread("t2")
+    await threads.last("t1", 1)
+    await threads.thread("t3")
+
+    assert len(await threads.last("t3", 10)) == 4
+    assert "t1" in threads
+    assert "t2" not in threads
+    assert threads.stats.evictions >= 1
+    assert threads.size <= threads.max_bytes
+    await threads.http_client.close()
@@ -0,0 +1,49 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from botenix.integration.utils.type_adapters import TypeAdapterRegistry
+
+
+class Item(BaseModel):
+    id: int
+
+
+def test_adapter_is_built_once_per_type() -> None:
+    registry = TypeAdapterRegistry()
+
+    adapter = registry.get(Item)
+
+    assert registry.get(Item) is adapter
+    assert registry.get(list[Item]) is registry.get(list[Item])
+    assert registry.get(list[Item]) is not registry.get(Item)  # type: ignore[comparison-overlap]
+    assert len(registry) == 2
+    assert list[Item] in registry
+
+
+def test_validate_json_from_cached_adapter() -> None:
+    registry = TypeAdapterRegistry()
+
+    items = registry.get(list[Item]).validate_json(b'[{"id": 1}, {"id": 2}]')
+
+    assert items == [Item(id=1), Item(id=2)]
+
+
+def test_unhashable_type_is_not_cached() -> None:
+    registry = TypeAdapterRegistry()
+    unhashable = Annotated[int, Field(gt=0), {"unhashable": []}]
+
+    adapter = registry.get(unhashable)  # type: ignore[arg-type]
+
+    assert adapter.validate_python(1) == 1
+    assert len(registry) == 0
+    assert unhashable not in registry
+
+
+def test_clear() -> None:
+    registry = TypeAdapterRegistry()
+    registry.get(Item)
+
+    registry.clear()
+
+    assert len(registry) == 0
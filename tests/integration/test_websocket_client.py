@@ -0,0 +1,148 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import orjson
+import pytest
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+from botenix.exceptions import BearerTokenMissingError
+from botenix.integration.utils.websocket_client import WebSocketClient
+
+
+def frame(event: str, seq: int, **data: object) -> bytes:
+    return orjson.dumps({"event": event, "data": data, "broadcast": {"channel_id": "c1"}, "seq": seq})
+
+
+class FakeMattermostWebSocket:
+    """Serves one scripted list of frames per connection and records the handshakes."""
+
+    def __init__(self, scripts: list[list[bytes]]) -> None:
+        self.scripts = scripts
+        self.paths: list[str] = []
+        self.authorizations: list[str | None] = []
+        self.server: Server | None = None
+
+    async def handler(self, connection: ServerConnection) -> None:
+        assert connection.request
+        self.paths.append(connection.request.path)
+        self.authorizations.append(connection.request.headers.get("Authorization"))
+        script = self.scripts.pop(0) if self.scripts else []
+        for message in script:
+            await connection.send(message)
+        if self.scripts:
+            await connection.close()
+        else:
+            await connection.wait_closed()
+
+    @property
+    def url(self) -> str:
+        assert self.server
+        host, port = next(iter(self.server.sockets)).getsockname()[:2]
+        return f"http://{host}:{port}"
+
+
+@pytest.fixture
+async def fake_server() -> AsyncGenerator[FakeMattermostWebSocket]:
+    fake = FakeMattermostWebSocket([])
+    async with serve(fake.handler, "127.0.0.1", 0) as server:
+        fake.server = server
+        yield fake
+
+
+async def collect(client: WebSocketClient, count: int) -> list[tuple[str, int | None]]:
+    events = []
+    async for event in client:
+        events.append((event.type, event.seq))
+        if len(events) == count:
+            break
+    return events
+
+
+async def test_receives_events_with_bearer_auth(fake_server: FakeMattermostWebSocket) -> None:
+    fake_server.scripts = [
+        [frame("hello", 0, connection_id="conn"), b'{"status":"OK","seq_reply":1}', frame("posted", 1)]
+    ]
+
+    async with WebSocketClient(fake_server.url, "secret") as client:
+        events = await asyncio.wait_for(collect(client, 2), timeout=5)
+
+    assert events == [("hello", 0), ("posted", 1)]
+    assert fake_server.authorizations == ["Bearer secret"]
+    assert fake_server.paths == ["/api/v4/websocket"]
+
+
+async def test_reconnects_and_resumes_connection(fake_server: FakeMattermostWebSocket) -> None:
+    fake_server.scripts = [
+        [frame("hello", 0, connection_id="conn"), frame("posted", 1)],
+        [frame("hello", 0, connection_id="conn"), frame("posted", 1), frame("posted", 2)],
+    ]
+    gaps: list[tuple[int, int]] = []
+
+    async with WebSocketClient(
+        fake_server.url, "secret", reconnect_delay=0.01, on_gap=lambda *gap: gaps.append(gap)
+    ) as client:
+        events = await asyncio.wait_for(collect(client, 4), timeout=5)
+
+    assert events == [("hello", 0), ("posted", 1), ("hello", 0), ("posted", 2)]
+    assert fake_server.paths[1] == "/api/v4/websocket?connection_id=conn&sequence_number=2"
+    assert client.reconnects >= 1
+    assert gaps == []
+
+
+async def test_sequence_gaps_are_reported(fake_server: FakeMattermostWebSocket) -> None:
+    fake_server.scripts = [
+        [frame("hello", 0, connection_id="conn"), frame("posted", 1), frame("posted", 4)],
+        [frame("hello", 0, connection_id="new-conn"), frame("posted", 1)],
+    ]
+    gaps: list[tuple[int, int]] = []
+
+    async def on_gap(expected: int, received: int) -> None:
+        await asyncio.sleep(0)
+        gaps.append((expected, received))
+
+    async with WebSocketClient(fake_server.url, "secret", reconnect_delay=0.01, on_gap=on_gap) as client:
+        await asyncio.wait_for(collect(client, 5), timeout=5)
+
+    assert gaps == [(2, 4), (5, 0)]
+    assert client.gaps == 2
+    assert client.connection_id == "new-conn"
+
+
+def test_websocket_url_follows_http_scheme() -> None:
+    assert WebSocketClient("https://chat.example.com", "t").url == "wss://chat.example.com/api/v4/websocket"
+    assert WebSocketClient("http://localhost:8065/", "t").url == "ws://localhost:8065/api/v4/websocket"
+
+
+def test_token_is_mandatory() -> None:
+    with pytest.raises(BearerTokenMissingError):
+        WebSocketClient("http://localhost:8065", "")
+
+
+async def test_malformed_frames_and_failing_gap_callbacks_are_skipped(fake_server: FakeMattermostWebSocket) -> None:
+    fake_server.scripts = [
+        [frame("hello", 0, connection_id="conn"), b"{not json", frame("posted", 1), frame("posted", 3)]
+    ]
+
+    def on_gap(expected: int, received: int) -> None:
+        raise RuntimeError(f"cannot catch up from {expected} to {received}")
+
+    async with WebSocketClient(fake_server.url, "secret", on_gap=on_gap) as client:
+        events = await asyncio.wait_for(collect(client, 3), timeout=5)
+
+    assert events == [("hello", 0), ("posted", 1), ("posted", 3)]
+    assert client.gaps == 1
+
+
+async def test_reader_errors_end_iteration(
+    fake_server: FakeMattermostWebSocket, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_server.scripts = [[frame("hello", 0, connection_id="conn")]]
+
+    async def fail(_event: object) -> bool:
+        raise RuntimeError("broken")
+
+    async with WebSocketClient(fake_server.url, "secret") as client:
+        monkeypatch.setattr(client, "_track_sequence", fail)
+        with pytest.raises(RuntimeError, match="broken"):
+            await asyncio.wait_for(collect(client, 1), timeout=5)
+        assert client.queue.closed
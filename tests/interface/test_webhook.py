@@ -0,0 +1,92 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from botenix.core.dispatcher import Dispatcher
+from botenix.core.events.event import Event, EventType
+from botenix.interface.webhook import WebhookApp, run_webhook_server
+
+
+TOKEN = "webhook-token"
+
+
+@pytest.fixture
+def dispatcher() -> Dispatcher:
+    return Dispatcher()
+
+
+@pytest.fixture
+async def client(dispatcher: Dispatcher) -> AsyncIterator[AsyncClient]:
+    app = WebhookApp(dispatcher, tokens=["other-token", TOKEN])
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://bot") as client:
+        yield client
+
+
+async def test_slash_command_is_dispatched_after_acknowledgement(dispatcher: Dispatcher, client: AsyncClient) -> None:
+    received: list[str | None] = []
+
+    @dispatcher.slash_command("deploy")
+    async def deploy(event: Event) -> None:
+        received.append(event.text)
+
+    response = await client.post(
+        "/hooks/command",
+        data={"token": TOKEN, "command": "/deploy", "text": "production", "channel_id": "c1"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {}
+    assert received == ["/deploy production"]
+
+
+async def test_outgoing_webhook_json(dispatcher: Dispatcher, client: AsyncClient) -> None:
+    received: list[Event] = []
+
+    @dispatcher.event(EventType.outgoing_webhook)
+    async def outgoing(event: Event) -> None:
+        received.append(event)
+
+    response = await client.post("/hooks/outgoing", json={"token": TOKEN, "text": "hi", "channel_id": "c1"})
+
+    assert response.status_code == 200
+    assert [(event.type, event.text, event.channel_id) for event in received] == [("outgoing_webhook", "hi", "c1")]
+
+
+@pytest.mark.parametrize(
+    ("path", "payload", "headers", "status_code"),
+    [
+        ("/hooks/action", {"context": {"token": TOKEN}, "post_id": "p1"}, {}, 200),
+        ("/hooks/action", {"context": {"token": "wrong"}}, {}, 401),
+        ("/hooks/dialog", {"state": TOKEN, "submission": {}}, {}, 200),
+        ("/hooks/command", {"command": "/x"}, {"Authorization": f"Token {TOKEN}"}, 200),
+        ("/hooks/command", {"command": "/x"}, {}, 401),
+        ("/hooks/outgoing", {"token": TOKEN[:-1]}, {}, 401),
+    ],
+)
+async def test_tokens_are_checked(
+    client: AsyncClient, path: str, payload: dict[str, object], headers: dict[str, str], status_code: int
+) -> None:
+    response = await client.post(path, json=payload, headers=headers)
+
+    assert response.status_code == status_code
+
+
+@pytest.mark.parametrize("body", [b"not json", b"[1, 2]"])
+async def test_malformed_payload(client: AsyncClient, body: bytes) -> None:
+    response = await client.post("/hooks/outgoing", content=body, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 400
+
+
+async def test_without_tokens_requests_are_accepted(dispatcher: Dispatcher) -> None:
+    app = WebhookApp(dispatcher)
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://bot") as client:
+        response = await client.post("/hooks/outgoing", json={"text": "hi"})
+
+    assert response.status_code == 200
+
+
+def test_run_webhook_server_needs_a_worker() -> None:
+    with pytest.raises(ValueError, match="At least one worker"):
+        run_webhook_server(lambda: WebhookApp(Dispatcher()), workers=0)
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from typing import cast
+
+import orjson
+
+
+# Budgets for a cold import in a fresh interpreter, generous enough for slow CI machines: a
+# regression that loads the HTTP, WebSocket or model stack eagerly again still blows them.
+IMPORT_BUDGET = 0.05
+BOT_BUDGET = 1.0
+
+SCRIPT = """
+import sys, time
+result = {{}}
+started_at = time.perf_counter()
+{code}
+result["elapsed"] = time.perf_counter() - started_at
+import orjson
+print(orjson.dumps(result).decode())
+"""
+
+HEAVY_MODULES = ("httpx", "pydantic", "websockets", "botenix.integration.clients.models.posts")
+
+
+def run_isolated(code: str) -> dict[str, object]:
+    # ``code`` fills ``result``; the import is timed without the interpreter startup.
+    script = SCRIPT.format(code=code)
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True).stdout
+    return dict(orjson.loads(output))
+
+
+def test_import_botenix_is_lazy() -> None:
+    result = run_isolated(
+        "import botenix\n"
+        f"result['loaded'] = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "result['exports'] = dir(botenix)"
+    )
+
+    assert result["loaded"] == []
+    assert {"Bot", "Dispatcher", "Router"} <= set(cast("list[str]", result["exports"]))
+    assert result["elapsed"] < IMPORT_BUDGET  # type: ignore[operator]
+
+
+def test_creating_a_bot_defers_websockets_and_model_schemas() -> None:
+    result = run_isolated(
+        "from botenix import Bot\n"
+        "bot = Bot('token')\n"
+        "from botenix.integration.clients.models.posts import PostResponse\n"
+        "result['websockets'] = 'websockets' in sys.modules\n"
+        "result['built'] = PostResponse.__pydantic_complete__"
+    )
+
+    assert result == {"websockets": False, "built": False, "elapsed": result["elapsed"]}
+    assert result["elapsed"] < BOT_BUDGET  # type: ignore[operator]
+
+
+def test_schemas_are_built_on_demand() -> None:
+    result = run_isolated(
+        "from botenix.integration.clients.models.common import build_schemas\n"
+        "from botenix.integration.clients.models.posts import PostResponse\n"
+        "result['built'] = build_schemas()\n"
+        "result['complete'] = PostResponse.__pydantic_complete__\n"
+        "result['again'] = build_schemas()"
+    )
+
+    assert result["built"] > 0  # type: ignore[operator]
+    assert result["complete"] is True
+    assert result["again"] == 0
+
+
+def test_deferred_schemas_can_be_disabled() -> None:
+    code = (
+        "import os\nos.environ['BOTENIX_DEFER_SCHEMAS'] = '0'\n"
+        "from botenix.integration.clients.models.posts import PostResponse\n"
+        "result['complete'] = PostResponse.__pydantic_complete__"
+    )
+
+    assert run_isolated(code)["complete"] is True